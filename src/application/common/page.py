@@ -6,7 +6,9 @@ from application.common.pageable import Pageable
 class Page[T](BaseModel):
     items: list[T]
     pageable: Pageable = Field(...)
-    total: int = Field(..., ge=0)
+    # None quando a consulta foi paginada por cursor e o total não foi contado
+    total: int | None = Field(None, ge=0)
+    next_cursor: str | None = None
 
     @computed_field
     @property
@@ -20,7 +22,10 @@ class Page[T](BaseModel):
 
     @computed_field
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> int | None:
+        if self.total is None:
+            return None
+
         if self.size == 0:
             return 0
 
@@ -29,6 +34,9 @@ class Page[T](BaseModel):
     @computed_field
     @property
     def has_next(self) -> bool:
+        if self.total_pages is None:
+            return self.next_cursor is not None
+
         return self.page < self.total_pages
 
     @computed_field
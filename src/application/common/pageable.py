@@ -20,6 +20,8 @@ class Pageable(BaseModel):
     page: int = Field(PAGE_DEFAULT, ge=1)
     size: int = Field(SIZE_DEFAULT, ge=1)
     sort: list[tuple[str, SORT_DIRECTION]] | None = None
+    # Paginação por cursor (keyset): quando informado, substitui `page` nos repositórios que a suportam
+    cursor: str | None = None
 
     model_config = {"extra": "forbid"}
 
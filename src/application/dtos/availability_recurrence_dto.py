@@ -0,0 +1,69 @@
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from typing import Annotated
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pydantic import BaseModel, Field
+
+from application.common.exception import ApplicationException
+
+MAX_RECURRENCE_DAYS = 731
+
+
+class AvailabilityRecurrenceDTO(BaseModel):
+    """Weekly recurrence rule: every `hours` (local time) on every `weekdays` between both dates, inclusive."""
+
+    # 0 = Monday ... 6 = Sunday, as in `date.weekday()`
+    weekdays: set[Annotated[int, Field(ge=0, le=6)]] = Field(min_length=1)
+    # Local hours, so the 05:00-23:00 rule is checked here, whatever the timezone
+    hours: set[Annotated[int, Field(ge=5, le=23)]] = Field(min_length=1)
+    start_date: date
+    end_date: date
+    timezone: str = "America/Sao_Paulo"
+
+    class Config:
+        extra = "forbid"
+
+    def expand(self, after: datetime | None = None) -> list[datetime]:
+        """Expands the rule into UTC datetimes, in chronological order, skipping those not later than `after`."""
+        if self.end_date < self.start_date:
+            raise ApplicationException("A data final da recorrência deve ser igual ou posterior à inicial.")
+
+        days = (self.end_date - self.start_date).days + 1
+        if days > MAX_RECURRENCE_DAYS:
+            raise ApplicationException(f"A recorrência pode cobrir no máximo {MAX_RECURRENCE_DAYS} dias.")
+
+        try:
+            tz = ZoneInfo(self.timezone)
+        except (ZoneInfoNotFoundError, ValueError) as e:
+            raise ApplicationException("Fuso horário da recorrência inválido.") from e
+
+        hours = sorted(self.hours)
+        hour_offsets = [timedelta(hours=hour) for hour in hours]
+        matching_days = (
+            self.start_date + timedelta(days=offset)
+            for offset in range(days)
+            if (self.start_date.weekday() + offset) % 7 in self.weekdays
+        )
+
+        slots: list[datetime] = []
+        for day in matching_days:
+            first = datetime(day.year, day.month, day.day, hours[0], tzinfo=tz)
+            last = datetime(day.year, day.month, day.day, hours[-1], tzinfo=tz)
+            offset = first.utcoffset()
+
+            if offset == last.utcoffset():
+                # Same UTC offset all day: every slot is the UTC midnight shifted by the hour
+                midnight = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) - offset  # type: ignore
+                slots.extend(midnight + hour_offset for hour_offset in hour_offsets)
+            else:
+                # DST change during the day: resolve the offset of each slot
+                slots.extend(
+                    datetime(day.year, day.month, day.day, hour, tzinfo=tz).astimezone(timezone.utc) for hour in hours
+                )
+
+        if after is not None:
+            # Slots are sorted: drop the leading ones that have already passed (e.g. earlier today)
+            slots = slots[bisect_right(slots, after) :]
+
+        return slots
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 from application.dtos.approach_dto import ApproachDTO
 from application.dtos.availability_dto import AvailabilityDTO
 from application.dtos.city_dto import CityDTO
@@ -18,7 +20,14 @@ class PsychologistDTO(UserDTO):
     availabilities: list[AvailabilityDTO] | None = None
 
     @staticmethod
-    def to_dto(entity: Psychologist) -> PsychologistDTO:
+    def to_dto(entity: Psychologist, availabilities_from: datetime | None = None) -> PsychologistDTO:
+        """`availabilities_from` drops the availabilities before it (e.g. past slots) from the response."""
+        availabilities = (
+            entity.get_availabilities_between(start=availabilities_from)
+            if availabilities_from is not None
+            else entity.availabilities
+        )
+
         return PsychologistDTO(
             id=entity.id.value,
             type=UserType.PSYCHOLOGIST,
@@ -36,7 +45,7 @@ class PsychologistDTO(UserDTO):
             value_per_appointment=entity.value_per_appointment,
             city=CityDTO.to_dto(entity.city),
             profile_picture=entity.profile_picture,
-            availabilities=[AvailabilityDTO.to_dto(availability) for availability in entity.availabilities]
-            if entity.availabilities
+            availabilities=[AvailabilityDTO.to_dto(availability) for availability in availabilities]
+            if availabilities
             else None,
         )
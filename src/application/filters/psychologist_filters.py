@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -12,6 +13,9 @@ class PsychologistFilters(BaseModel):
     approach_ids: set[UUID] | None = None
     audiences: set[AudienceEnum] | None = None
     max_price: float | None = None
+    # Availability search: only psychologists with a free slot in the window, earliest slot first on ties
+    available_from: datetime | None = None
+    available_to: datetime | None = None
 
     class Config:
         extra = "forbid"
@@ -1,22 +1,33 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
-from application.common.page import Page
-from application.common.pageable import Pageable
-from application.filters.availability_filters import AvailabilityFilters
 from domain.availability import Availability
 from domain.common.unique_entity_id import UniqueEntityId
 
 
 class IAvailabilityRepo(ABC):
     @abstractmethod
-    async def create(self, entity: Availability) -> Availability: ...
+    async def create_many(self, psychologist_id: UniqueEntityId, entities: list[Availability]) -> None: ...
 
     @abstractmethod
-    async def get(
-        self,
-        pageable: Pageable,
-        filters: AvailabilityFilters | None = None,
-    ) -> Page[Availability]: ...
+    async def delete_available(self, psychologist_id: UniqueEntityId, ids: list[UniqueEntityId]) -> int:
+        """Remove apenas as disponibilidades ainda livres. Retorna quantas foram removidas."""
+        ...
 
     @abstractmethod
-    async def get_by_id(self, id: UniqueEntityId) -> Availability | None: ...
+    async def get_by_psychologist_id(self, psychologist_id: UniqueEntityId) -> list[Availability]: ...
+
+    @abstractmethod
+    async def get_between(
+        self, psychologist_id: UniqueEntityId, start: datetime, end: datetime, only_available: bool = False
+    ) -> list[Availability]:
+        """Disponibilidades do psicólogo com start <= data <= end, em ordem cronológica."""
+        ...
+
+    @abstractmethod
+    async def reserve_availability(self, psychologist_id: UniqueEntityId, date: datetime) -> UniqueEntityId | None:
+        """Marca atomicamente a disponibilidade livre da data como ocupada. Retorna o id ou None se não houver."""
+        ...
+
+    @abstractmethod
+    async def release_availability(self, psychologist_id: UniqueEntityId, id: UniqueEntityId) -> bool: ...
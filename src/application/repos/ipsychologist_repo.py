@@ -23,3 +23,8 @@ class IPsychologistRepo(ABC):
 
     @abstractmethod
     async def get_by_id(self, id: UniqueEntityId) -> Psychologist | None: ...
+
+    @abstractmethod
+    async def get_value_per_appointment(self, id: UniqueEntityId) -> float | None:
+        """Lê apenas o valor da consulta, sem carregar o psicólogo. Retorna None se ele não existir."""
+        ...
@@ -10,6 +10,8 @@ from domain.value_objects.password import Password
 class JWTData(BaseModel):
     id: UUID
     user_type: str  # "patient" or "psychologist"
+    # Época de sessão do usuário na emissão; o logout a incrementa e invalida os tokens anteriores
+    epoch: int = 0
 
     @field_serializer("id")
     def serialize_id(self, id: UUID, _info: FieldSerializationInfo) -> str:
@@ -24,7 +26,7 @@ class IAuthService(ABC):
     async def verify_password(self, password: Password, hashed_password: Password) -> bool: ...
 
     @abstractmethod
-    def sign_jwt_tokens(self, user: User) -> tuple[str, str]: ...
+    async def sign_jwt_tokens(self, user: User) -> tuple[str, str]: ...
 
     @abstractmethod
     async def decode_access_token(self, token: str) -> JWTData | None: ...
@@ -39,4 +41,7 @@ class IAuthService(ABC):
     async def get_tokens(self, user_id: str) -> list[str]: ...
 
     @abstractmethod
-    def _construct_key(self, user_id: str, refresh_token: str) -> str: ...
+    async def is_session_active(self, data: JWTData) -> bool: ...
+
+    @abstractmethod
+    def _construct_key(self, user_id: str) -> str: ...
@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class CacheTags:
+    """Tags of cached public responses; list tags cover every page of a listing."""
+
+    PSYCHOLOGISTS = "psychologists"
+    CONTENTS = "contents"
+    SPECIALTIES = "specialties"
+    APPROACHES = "approaches"
+    # Listings filtered by free slots: change whenever any psychologist's slots do
+    AVAILABILITY_SEARCH = "availability_search"
+
+    @staticmethod
+    def psychologist(id: UUID) -> str:
+        return f"psychologist:{id}"
+
+    @staticmethod
+    def content(id: UUID) -> str:
+        return f"content:{id}"
+
+
+class IResponseCache(ABC):
+    @abstractmethod
+    async def invalidate(self, *tags: str) -> None:
+        """Drops every cached response carrying any of the tags once the current request's writes are committed."""
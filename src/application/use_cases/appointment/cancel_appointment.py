@@ -6,8 +6,9 @@ from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
 from application.dtos.appointment_dto import AppointmentDTO
 from application.repos.iappointment_repo import IAppointmentRepo
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.ipatient_repo import IPatientRepo
-from application.repos.ipsychologist_repo import IPsychologistRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.appointment import AppointmentStatusEnum
 from domain.common.unique_entity_id import UniqueEntityId
 
@@ -19,18 +20,21 @@ class CancelAppointmentDTO(BaseModel):
 
 class CancelAppointmentUseCase(IUseCase[CancelAppointmentDTO, AppointmentDTO]):
     appointment_repo: IAppointmentRepo
-    psychologist_repo: IPsychologistRepo
+    availability_repo: IAvailabilityRepo
     patient_repo: IPatientRepo
+    response_cache: IResponseCache
 
     def __init__(
         self,
         appointment_repo: IAppointmentRepo,
-        psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
         patient_repo: IPatientRepo,
+        response_cache: IResponseCache,
     ) -> None:
         self.appointment_repo = appointment_repo
-        self.psychologist_repo = psychologist_repo
+        self.availability_repo = availability_repo
         self.patient_repo = patient_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: CancelAppointmentDTO) -> AppointmentDTO:
         appointment = await self.appointment_repo.get_by_id(UniqueEntityId(dto.appointment_id))
@@ -56,17 +60,14 @@ class CancelAppointmentUseCase(IUseCase[CancelAppointmentDTO, AppointmentDTO]):
         # perform cancel
         appointment.cancel()
 
-        # if appointment had an availability reserved, unschedule it on psychologist
+        # if appointment had an availability reserved, release it
         if appointment.availability_id:
-            psychologist = await self.psychologist_repo.get_by_id(appointment.psychologist_id)
-            if psychologist and psychologist.availabilities:
-                # find availability and unschedule
-                for av in psychologist.availabilities:
-                    if av.id.value == appointment.availability_id.value:
-                        av.unschedule()
-                        await self.psychologist_repo.update(psychologist)
-                        break
+            await self.availability_repo.release_availability(appointment.psychologist_id, appointment.availability_id)
 
         updated = await self.appointment_repo.update(appointment)
 
+        await self.response_cache.invalidate(
+            CacheTags.psychologist(appointment.psychologist_id.value), CacheTags.AVAILABILITY_SEARCH
+        )
+
         return AppointmentDTO.to_dto(updated)
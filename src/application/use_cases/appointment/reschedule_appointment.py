@@ -7,8 +7,9 @@ from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
 from application.dtos.appointment_dto import AppointmentDTO
 from application.repos.iappointment_repo import IAppointmentRepo
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.ipatient_repo import IPatientRepo
-from application.repos.ipsychologist_repo import IPsychologistRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.common.unique_entity_id import UniqueEntityId
 
 
@@ -20,18 +21,21 @@ class RescheduleAppointmentDTO(BaseModel):
 
 class RescheduleAppointmentUseCase(IUseCase[RescheduleAppointmentDTO, AppointmentDTO]):
     appointment_repo: IAppointmentRepo
-    psychologist_repo: IPsychologistRepo
+    availability_repo: IAvailabilityRepo
     patient_repo: IPatientRepo
+    response_cache: IResponseCache
 
     def __init__(
         self,
         appointment_repo: IAppointmentRepo,
-        psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
         patient_repo: IPatientRepo,
+        response_cache: IResponseCache,
     ) -> None:
         self.appointment_repo = appointment_repo
-        self.psychologist_repo = psychologist_repo
+        self.availability_repo = availability_repo
         self.patient_repo = patient_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: RescheduleAppointmentDTO) -> AppointmentDTO:
         appointment = await self.appointment_repo.get_by_id(UniqueEntityId(dto.appointment_id))
@@ -57,26 +61,22 @@ class RescheduleAppointmentUseCase(IUseCase[RescheduleAppointmentDTO, Appointmen
         if time_diff_hours < -1:
             raise ApplicationException("Não é possível reagendar para uma data passada.")
 
-        # attempt to schedule new availability in psychologist and free old availability
-        psychologist = await self.psychologist_repo.get_by_id(appointment.psychologist_id)
-        if not psychologist:
-            raise ApplicationException("Psicólogo não encontrado.")
-
-        # schedule new availability (this will raise if not available)
-        new_availability_id = psychologist.get_availability_by_date(dto.new_date)
+        # reserve new availability atomically (fails if it is not free)
+        new_availability_id = await self.availability_repo.reserve_availability(appointment.psychologist_id, new_date)
+        if not new_availability_id:
+            raise ApplicationException("Nenhuma disponibilidade livre encontrada para a data informada.")
 
         # free old availability if present
         if appointment.availability_id:
-            for av in psychologist.availabilities or []:
-                if av.id.value == appointment.availability_id.value:
-                    av.unschedule()
-                    break
+            await self.availability_repo.release_availability(appointment.psychologist_id, appointment.availability_id)
 
         # use domain method to reschedule
         appointment.reschedule(dto.new_date, new_availability_id)
 
-        # persist psychologist changes and appointment
-        await self.psychologist_repo.update(psychologist)
         updated = await self.appointment_repo.update(appointment)
 
+        await self.response_cache.invalidate(
+            CacheTags.psychologist(appointment.psychologist_id.value), CacheTags.AVAILABILITY_SEARCH
+        )
+
         return AppointmentDTO.to_dto(updated)
@@ -3,6 +3,7 @@ from pydantic import BaseModel
 from application.common.use_case import IUseCase
 from application.dtos.approach_dto import ApproachDTO
 from application.repos.iapproach_repo import IApproachRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.approach import Approach
 
 
@@ -13,9 +14,11 @@ class CreateApproachDTO(BaseModel):
 
 class CreateApproachUseCase(IUseCase[CreateApproachDTO, ApproachDTO]):
     approach_repo: IApproachRepo
+    response_cache: IResponseCache
 
-    def __init__(self, approach_repo: IApproachRepo) -> None:
+    def __init__(self, approach_repo: IApproachRepo, response_cache: IResponseCache) -> None:
         self.approach_repo = approach_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: CreateApproachDTO) -> ApproachDTO:
         approach = Approach(
@@ -24,4 +27,6 @@ class CreateApproachUseCase(IUseCase[CreateApproachDTO, ApproachDTO]):
         )
 
         created_approach = await self.approach_repo.create(approach)
+        await self.response_cache.invalidate(CacheTags.APPROACHES)
+
         return ApproachDTO.to_dto(created_approach)
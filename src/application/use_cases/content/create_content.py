@@ -7,6 +7,7 @@ from application.common.use_case import IUseCase
 from application.dtos.content_dto import ContentDTO
 from application.repos.icontent_repo import IContentRepo
 from application.repos.ipsychologist_repo import IPsychologistRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.content import Content
 
@@ -20,14 +21,17 @@ class CreateContentDTO(BaseModel):
 class CreateContentUseCase(IUseCase[CreateContentDTO, ContentDTO]):
     content_repo: IContentRepo
     psychologist_repo: IPsychologistRepo
+    response_cache: IResponseCache
 
     def __init__(
         self,
         content_repo: IContentRepo,
         psychologist_repo: IPsychologistRepo,
+        response_cache: IResponseCache,
     ) -> None:
         self.content_repo = content_repo
         self.psychologist_repo = psychologist_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: CreateContentDTO) -> ContentDTO:
         # Verifica se o autor é um psicólogo
@@ -42,4 +46,6 @@ class CreateContentUseCase(IUseCase[CreateContentDTO, ContentDTO]):
         )
 
         created_content = await self.content_repo.create(content)
+        await self.response_cache.invalidate(CacheTags.CONTENTS)
+
         return ContentDTO.to_dto(created_content)
@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
 from application.repos.icontent_repo import IContentRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.common.unique_entity_id import UniqueEntityId
 
 
@@ -15,9 +16,11 @@ class DeleteContentDTO(BaseModel):
 
 class DeleteContentUseCase(IUseCase[DeleteContentDTO, bool]):
     content_repo: IContentRepo
+    response_cache: IResponseCache
 
-    def __init__(self, content_repo: IContentRepo) -> None:
+    def __init__(self, content_repo: IContentRepo, response_cache: IResponseCache) -> None:
         self.content_repo = content_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: DeleteContentDTO) -> bool:
         content = await self.content_repo.get_by_id(UniqueEntityId(dto.content_id))
@@ -28,4 +31,6 @@ class DeleteContentUseCase(IUseCase[DeleteContentDTO, bool]):
         if content.author_id.value != dto.requesting_user_id:
             raise ApplicationException("Apenas o autor pode deletar este conteúdo")
 
+        await self.response_cache.invalidate(CacheTags.content(dto.content_id), CacheTags.CONTENTS)
+
         return await self.content_repo.delete(UniqueEntityId(dto.content_id))
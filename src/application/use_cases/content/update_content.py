@@ -6,6 +6,7 @@ from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
 from application.dtos.content_dto import ContentDTO
 from application.repos.icontent_repo import IContentRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.common.unique_entity_id import UniqueEntityId
 
 
@@ -18,9 +19,11 @@ class UpdateContentDTO(BaseModel):
 
 class UpdateContentUseCase(IUseCase[UpdateContentDTO, ContentDTO]):
     content_repo: IContentRepo
+    response_cache: IResponseCache
 
-    def __init__(self, content_repo: IContentRepo) -> None:
+    def __init__(self, content_repo: IContentRepo, response_cache: IResponseCache) -> None:
         self.content_repo = content_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: UpdateContentDTO) -> ContentDTO:
         content = await self.content_repo.get_by_id(UniqueEntityId(dto.content_id))
@@ -34,4 +37,6 @@ class UpdateContentUseCase(IUseCase[UpdateContentDTO, ContentDTO]):
         content.update(title=dto.title, body=dto.body)
 
         updated_content = await self.content_repo.update(content)
+        await self.response_cache.invalidate(CacheTags.content(dto.content_id), CacheTags.CONTENTS)
+
         return ContentDTO.to_dto(updated_content)
@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from pydantic import BaseModel
@@ -7,9 +7,11 @@ from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
 from application.dtos.appointment_dto import AppointmentDTO
 from application.repos.iappointment_repo import IAppointmentRepo
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.ipatient_repo import IPatientRepo
 from application.repos.ipsychologist_repo import IPsychologistRepo
 from application.services.ipix_payment_service import IPixPaymentService
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.appointment import Appointment, AppointmentStatusEnum
 from domain.common.unique_entity_id import UniqueEntityId
 
@@ -27,19 +29,25 @@ class SolicitScheduleAppointmentUseCase(IUseCase[SolicitScheduleAppointmentDTO,
     patient_repo: IPatientRepo
     psychologist_repo: IPsychologistRepo
     appointment_repo: IAppointmentRepo
+    availability_repo: IAvailabilityRepo
     pix_payment_service: IPixPaymentService
+    response_cache: IResponseCache
 
     def __init__(
         self,
         patient_repo: IPatientRepo,
         psychologist_repo: IPsychologistRepo,
         appointment_repo: IAppointmentRepo,
+        availability_repo: IAvailabilityRepo,
         pix_payment_service: IPixPaymentService,
+        response_cache: IResponseCache,
     ) -> None:
         self.patient_repo = patient_repo
         self.psychologist_repo = psychologist_repo
         self.appointment_repo = appointment_repo
+        self.availability_repo = availability_repo
         self.pix_payment_service = pix_payment_service
+        self.response_cache = response_cache
 
     async def execute(self, dto: SolicitScheduleAppointmentDTO) -> AppointmentDTO:
         patient = await self.patient_repo.get_by_id(UniqueEntityId(dto.patient_id))
@@ -47,36 +55,44 @@ class SolicitScheduleAppointmentUseCase(IUseCase[SolicitScheduleAppointmentDTO,
         if not patient:
             raise ApplicationException("Paciente não encontrado.")
 
-        psychologist = await self.psychologist_repo.get_by_id(UniqueEntityId(dto.psychologist_id))
-
-        if not psychologist:
-            raise ApplicationException("Psicólogo não encontrado.")
-
-        # A validação de data passada não é necessária aqui porque:
-        # 1. As availabilities do psicólogo já filtram horários passados
-        # 2. O método get_availability_by_date vai falhar se o horário não estiver disponível
-        # 3. Problemas de timezone entre frontend/backend podem causar falsos positivos
-
         # Garantir que a data tenha timezone para o banco de dados
         appointment_date = dto.date
         if appointment_date.tzinfo is None:
             appointment_date = appointment_date.replace(tzinfo=timezone.utc)
 
-        availability_id = psychologist.get_availability_by_date(appointment_date)
+        # Margem de 1 hora para diferenças de timezone entre frontend/backend
+        if appointment_date < datetime.now(timezone.utc) - timedelta(hours=1):
+            raise ApplicationException("Disponibilidade inválida - horário já passou.")
+
+        psychologist_id = UniqueEntityId(dto.psychologist_id)
 
-        pix_payment = await self.pix_payment_service.create_payment(psychologist.value_per_appointment)
+        # Só o valor da consulta é necessário: não carrega o psicólogo inteiro
+        value_per_appointment = await self.psychologist_repo.get_value_per_appointment(psychologist_id)
+
+        if value_per_appointment is None:
+            raise ApplicationException("Psicólogo não encontrado.")
+
+        # Reserva atômica: só um agendamento concorrente consegue ocupar o horário
+        availability_id = await self.availability_repo.reserve_availability(psychologist_id, appointment_date)
+
+        if not availability_id:
+            raise ApplicationException("Nenhuma disponibilidade livre encontrada para a data informada.")
+
+        pix_payment = await self.pix_payment_service.create_payment(value_per_appointment)
 
         appointment = Appointment(
             date=appointment_date,
-            psychologist_id=psychologist.id,
+            psychologist_id=psychologist_id,
             patient_id=patient.id,
             availability_id=availability_id,
             status=AppointmentStatusEnum.WAITING_FOR_PAYMENT,
-            value=psychologist.value_per_appointment,
+            value=value_per_appointment,
             pix_payment=pix_payment,
         )
 
         scheduled_appointment = await self.appointment_repo.create(appointment)
-        await self.psychologist_repo.update(psychologist)
+
+        # The reserved slot is no longer shown as available
+        await self.response_cache.invalidate(CacheTags.psychologist(dto.psychologist_id), CacheTags.AVAILABILITY_SEARCH)
 
         return AppointmentDTO.to_dto(scheduled_appointment)
@@ -13,11 +13,7 @@ from application.repos.iuser_repo import IUserRepo
 from application.services.iauth_service import IAuthService
 from application.services.ifile_service import IFileService
 from domain.common.unique_entity_id import UniqueEntityId
-from domain.patient import Patient
 from domain.user import GenderEnum
-from domain.value_objects.cpf import CPF
-from domain.value_objects.email import Email
-from domain.value_objects.phone_number import PhoneNumber
 
 
 class UpdatePatientDTO(BaseModel):
@@ -64,14 +60,10 @@ class UpdatePatientUseCase(IUseCase[UpdatePatientDTO, PatientDTO]):
 
         query_list: list[dict[str, str]] = []
 
-        email = found_patient.email
-        if dto.email and dto.email != email.value:
-            email = Email(value=dto.email)
+        if dto.email and dto.email != found_patient.email.value:
             query_list.append({"email": dto.email})
 
-        cpf = found_patient.cpf
-        if dto.cpf and dto.cpf != cpf.value:
-            cpf = CPF(value=dto.cpf)
+        if dto.cpf and dto.cpf != found_patient.cpf.value:
             query_list.append({"email": dto.cpf})
 
         if len(query_list) > 0:
@@ -79,36 +71,36 @@ class UpdatePatientUseCase(IUseCase[UpdatePatientDTO, PatientDTO]):
             if is_duplicated:
                 raise ApplicationException("E-mail ou CPF duplicado.")
 
-        city = found_patient.city
+        # Only the fields actually assigned below are persisted by the repo
         if dto.city_id:
             city = await self.city_repo.get_by_id(UniqueEntityId(dto.city_id))
             if not city:
                 raise ApplicationException("Cidade não encontrada.")
+            found_patient.city = city
 
-        profile_picture = found_patient.profile_picture
         if dto.delete_profile_picture:
-            profile_picture = None
             if found_patient.profile_picture:
                 await self.file_service.delete(found_patient.profile_picture.key)
+            found_patient.profile_picture = None
 
         elif dto.profile_picture:
             # Delete old profile picture and upload new one
             if found_patient.profile_picture:
                 await self.file_service.delete(found_patient.profile_picture.key)
-            profile_picture = await self.file_service.upload(dto.profile_picture)
-
-        updated_patient = Patient(
-            name=dto.name or found_patient.name,
-            email=email,
-            password=found_patient.password,
-            cpf=cpf,
-            phone_number=PhoneNumber(value=dto.phone_number) if dto.phone_number else found_patient.phone_number,
-            birth_date=dto.birth_date or found_patient.birth_date,
-            gender=GenderEnum(dto.gender) if dto.gender else found_patient.gender,
-            city=city,
-            profile_picture=profile_picture,
-            id=found_patient.id,
-        )
-
-        saved_patient = await self.patient_repo.update(updated_patient)
+            found_patient.profile_picture = await self.file_service.upload(dto.profile_picture)
+
+        if dto.name:
+            found_patient.name = dto.name
+        if dto.email and dto.email != found_patient.email.value:
+            found_patient.email = dto.email
+        if dto.cpf and dto.cpf != found_patient.cpf.value:
+            found_patient.cpf = dto.cpf
+        if dto.phone_number:
+            found_patient.phone_number = dto.phone_number
+        if dto.birth_date:
+            found_patient.birth_date = dto.birth_date
+        if dto.gender:
+            found_patient.gender = GenderEnum(dto.gender)
+
+        saved_patient = await self.patient_repo.update(found_patient)
         return PatientDTO.to_dto(saved_patient)
@@ -5,14 +5,48 @@ from pydantic import BaseModel
 
 from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
+from application.dtos.availability_recurrence_dto import AvailabilityRecurrenceDTO
 from application.dtos.psychologist_dto import PsychologistDTO
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.ipsychologist_repo import IPsychologistRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.availability import Availability
 from domain.common.unique_entity_id import UniqueEntityId
 
+MAX_AVAILABILITIES_PER_REQUEST = 10_000
+
+# Hours are in UTC, so 0-2 are allowed too (21-23 in BRT UTC-3)
+ALLOWED_UTC_HOURS = frozenset(range(5, 24)) | frozenset(range(3))
+
+
+def validate_availability_count(availability_datetimes: list[datetime]) -> None:
+    if len(availability_datetimes) > MAX_AVAILABILITIES_PER_REQUEST:
+        raise ApplicationException(
+            f"É possível enviar no máximo {MAX_AVAILABILITIES_PER_REQUEST} disponibilidades por requisição."
+        )
+
+
+def validate_availability_datetimes(availability_datetimes: list[datetime]) -> None:
+    """Checks the slot rules over the whole batch at once: past dates, whole hours and the 05:00-23:00 window."""
+    validate_availability_count(availability_datetimes)
+
+    if not availability_datetimes:
+        return
+
+    if min(availability_datetimes) < datetime.now(timezone.utc):
+        raise ApplicationException("Não é possível adicionar disponibilidade em uma data passada.")
+
+    if any(dt.minute or dt.second or dt.microsecond for dt in availability_datetimes):
+        raise ApplicationException("Disponibilidades devem estar em horas inteiras (ex: 05:00, 14:00).")
+
+    if not {dt.hour for dt in availability_datetimes} <= ALLOWED_UTC_HOURS:
+        raise ApplicationException("Disponibilidades devem estar entre 05:00 e 23:00.")
+
 
 class AddAvailabilitiesDTO(BaseModel):
-    availability_datetimes: list[datetime]
+    availability_datetimes: list[datetime] = []
+    # Expanded on the server and added together with the explicit datetimes
+    recurrence: AvailabilityRecurrenceDTO | None = None
     psychologist_id: UUID
 
     class Config:
@@ -21,46 +55,42 @@ class AddAvailabilitiesDTO(BaseModel):
 
 class AddAvailabilitiesUseCase(IUseCase[AddAvailabilitiesDTO, PsychologistDTO]):
     psychologist_repo: IPsychologistRepo
+    availability_repo: IAvailabilityRepo
+    response_cache: IResponseCache
 
     def __init__(
         self,
         psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
+        response_cache: IResponseCache,
     ) -> None:
         self.psychologist_repo = psychologist_repo
+        self.availability_repo = availability_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: AddAvailabilitiesDTO) -> PsychologistDTO:
         availability_datetimes = dto.availability_datetimes
+        validate_availability_datetimes(availability_datetimes)
+
+        if dto.recurrence:
+            # The rule's hours were already checked in its own timezone; slots that have passed are skipped
+            recurrence_datetimes = dto.recurrence.expand(after=datetime.now(timezone.utc))
+            availability_datetimes = [*availability_datetimes, *recurrence_datetimes]
+            validate_availability_count(availability_datetimes)
 
         psychologist = await self.psychologist_repo.get_by_id(UniqueEntityId(dto.psychologist_id))
 
         if not psychologist:
             raise ApplicationException("Psicólogo não encontrado.")
 
-        availabiliies: list[Availability] = []
-        for availability_datetime in availability_datetimes:
-            if availability_datetime < datetime.now(timezone.utc):
-                raise ApplicationException("Não é possível adicionar disponibilidade em uma data passada.")
-            # Validate that the time is a whole hour (minutes and seconds zero)
-            if (
-                availability_datetime.minute != 0
-                or availability_datetime.second != 0
-                or availability_datetime.microsecond != 0
-            ):
-                raise ApplicationException("Disponibilidades devem estar em horas inteiras (ex: 05:00, 14:00).")
-
-            # Validate hour range: 05:00 through 23:00 inclusive
-            # NOTE: Hours are in UTC, so we need to allow 0-2 (which are 21-23 in BRT UTC-3)
-            if not ((5 <= availability_datetime.hour <= 23) or (0 <= availability_datetime.hour <= 2)):
-                raise ApplicationException("Disponibilidades devem estar entre 05:00 e 23:00.")
-
-            availability = Availability(
-                date=availability_datetime,
-                available=True,
-            )
-
-            availabiliies.append(availability)
-
-        psychologist.add_availabilities(availabiliies)
-
-        updated_psychologist = await self.psychologist_repo.update(psychologist)
-        return PsychologistDTO.to_dto(updated_psychologist)
+        availabilities = [
+            Availability(date=availability_datetime, available=True) for availability_datetime in availability_datetimes
+        ]
+
+        # Upserted in a single bulk write
+        added_availabilities = psychologist.add_availabilities(availabilities)
+        await self.availability_repo.create_many(psychologist.id, added_availabilities)
+
+        await self.response_cache.invalidate(CacheTags.psychologist(dto.psychologist_id), CacheTags.AVAILABILITY_SEARCH)
+
+        return PsychologistDTO.to_dto(psychologist)
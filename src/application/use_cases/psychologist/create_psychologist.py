@@ -15,6 +15,7 @@ from application.repos.ispecialty_repo import ISpecialtyRepo
 from application.repos.iuser_repo import IUserRepo
 from application.services.iauth_service import IAuthService
 from application.services.ifile_service import IFileService
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.common.exception import DomainException
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.psychologist import AudienceEnum, Psychologist
@@ -56,6 +57,7 @@ class CreatePsychologistUseCase(IUseCase[CreatePsychologistDTO, PsychologistDTO]
     approach_repo: IApproachRepo
     file_service: IFileService
     auth_service: IAuthService
+    response_cache: IResponseCache
 
     def __init__(
         self,
@@ -66,6 +68,7 @@ class CreatePsychologistUseCase(IUseCase[CreatePsychologistDTO, PsychologistDTO]
         city_repo: ICityRepo,
         file_service: IFileService,
         auth_service: IAuthService,
+        response_cache: IResponseCache,
     ) -> None:
         self.user_repo = user_repo
         self.psychologist_repo = psychologist_repo
@@ -74,6 +77,7 @@ class CreatePsychologistUseCase(IUseCase[CreatePsychologistDTO, PsychologistDTO]
         self.city_repo = city_repo
         self.file_service = file_service
         self.auth_service = auth_service
+        self.response_cache = response_cache
 
     async def execute(self, dto: CreatePsychologistDTO) -> PsychologistDTO:
         email = Email(value=dto.email)
@@ -123,4 +127,6 @@ class CreatePsychologistUseCase(IUseCase[CreatePsychologistDTO, PsychologistDTO]
             profile_picture=profile_picture,
         )
         created_psychologist = await self.psychologist_repo.create(psychologist)
+        await self.response_cache.invalidate(CacheTags.PSYCHOLOGISTS)
+
         return PsychologistDTO.to_dto(created_psychologist)
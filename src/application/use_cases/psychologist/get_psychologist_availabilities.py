@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from application.common.exception import ApplicationException
+from application.common.use_case import IUseCase
+from application.dtos.availability_dto import AvailabilityDTO
+from application.repos.iavailability_repo import IAvailabilityRepo
+from application.repos.ipsychologist_repo import IPsychologistRepo
+from domain.availability import Availability
+from domain.common.unique_entity_id import UniqueEntityId
+
+DEFAULT_WINDOW_DAYS = 30
+MAX_WINDOW_DAYS = 92
+
+
+class GetPsychologistAvailabilitiesDTO(BaseModel):
+    psychologist_id: UUID
+    # Defaults to the ongoing slot
+    from_date: datetime | None = None
+    # Defaults to DEFAULT_WINDOW_DAYS after from_date
+    to_date: datetime | None = None
+    only_free: bool = True
+
+
+class GetPsychologistAvailabilitiesUseCase(IUseCase[GetPsychologistAvailabilitiesDTO, list[AvailabilityDTO]]):
+    psychologist_repo: IPsychologistRepo
+    availability_repo: IAvailabilityRepo
+
+    def __init__(self, psychologist_repo: IPsychologistRepo, availability_repo: IAvailabilityRepo) -> None:
+        self.psychologist_repo = psychologist_repo
+        self.availability_repo = availability_repo
+
+    async def execute(self, dto: GetPsychologistAvailabilitiesDTO) -> list[AvailabilityDTO]:
+        start = Availability.normalize_datetime(dto.from_date or Availability.current_slot_start())
+        end = Availability.normalize_datetime(dto.to_date or start + timedelta(days=DEFAULT_WINDOW_DAYS))
+
+        if end < start:
+            raise ApplicationException("A data final da janela deve ser igual ou posterior à inicial.")
+        if end - start > timedelta(days=MAX_WINDOW_DAYS):
+            raise ApplicationException(f"A janela de disponibilidades pode cobrir no máximo {MAX_WINDOW_DAYS} dias.")
+
+        psychologist_id = UniqueEntityId(dto.psychologist_id)
+        availabilities = await self.availability_repo.get_between(
+            psychologist_id, start, end, only_available=dto.only_free
+        )
+
+        # Empty window: tell an unknown psychologist apart without loading the profile
+        if not availabilities and await self.psychologist_repo.get_value_per_appointment(psychologist_id) is None:
+            raise ApplicationException("Psicólogo não encontrado.")
+
+        return [AvailabilityDTO.to_dto(availability) for availability in availabilities]
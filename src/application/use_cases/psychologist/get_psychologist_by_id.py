@@ -6,6 +6,7 @@ from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
 from application.dtos.psychologist_dto import PsychologistDTO
 from application.repos.ipsychologist_repo import IPsychologistRepo
+from domain.availability import Availability
 from domain.common.unique_entity_id import UniqueEntityId
 
 
@@ -25,4 +26,5 @@ class GetPsychologistByIdUseCase(IUseCase[GetPsychologistByIdDTO, PsychologistDT
         if not psychologist:
             raise ApplicationException("Psicólogo não encontrado.")
 
-        return PsychologistDTO.to_dto(psychologist)
+        # Past slots are never bookable: the profile only lists the upcoming ones
+        return PsychologistDTO.to_dto(psychologist, availabilities_from=Availability.current_slot_start())
@@ -1,9 +1,16 @@
+from datetime import datetime, timedelta
+
+from application.common.exception import ApplicationException
 from application.common.page import Page
 from application.common.pageable import Pageable
 from application.common.use_case import IUseCase
 from application.dtos.psychologist_dto import PsychologistDTO
 from application.filters.psychologist_filters import PsychologistFilters
 from application.repos.ipsychologist_repo import IPsychologistRepo
+from application.use_cases.psychologist.get_psychologist_availabilities import MAX_WINDOW_DAYS
+from domain.availability import Availability
+
+DEFAULT_AVAILABILITY_SEARCH_HOURS = 48
 
 
 class GetPsychologistsDTO(Pageable, PsychologistFilters): ...
@@ -19,17 +26,43 @@ class GetPsychologistsUseCase(IUseCase[GetPsychologistsDTO, Page[PsychologistDTO
         self.psychologist_repo = psychologist_repo
 
     async def execute(self, dto: GetPsychologistsDTO) -> Page[PsychologistDTO]:
-        pageable = Pageable(page=dto.page, size=dto.size)
+        availabilities_from = Availability.current_slot_start()
+        available_from, available_to = self._availability_window(dto, availabilities_from)
+
+        pageable = Pageable(page=dto.page, size=dto.size, cursor=dto.cursor)
         filters = PsychologistFilters(
             gender=dto.gender,
             specialty_ids=dto.specialty_ids,
             approach_ids=dto.approach_ids,
             audiences=dto.audiences,
             max_price=dto.max_price,
+            available_from=available_from,
+            available_to=available_to,
         )
         page = await self.psychologist_repo.get(pageable, filters)
         return Page(
-            items=[PsychologistDTO.to_dto(entity) for entity in page.items],
+            items=[PsychologistDTO.to_dto(entity, availabilities_from) for entity in page.items],
             total=page.total,
             pageable=page.pageable,
+            next_cursor=page.next_cursor,
+        )
+
+    @staticmethod
+    def _availability_window(
+        dto: GetPsychologistsDTO, current_slot_start: datetime
+    ) -> tuple[datetime | None, datetime | None]:
+        """Completes a partial window; past slots are never bookable, so it never starts before the ongoing slot."""
+        if dto.available_from is None and dto.available_to is None:
+            return None, None
+
+        start = max(Availability.normalize_datetime(dto.available_from or current_slot_start), current_slot_start)
+        end = Availability.normalize_datetime(
+            dto.available_to or start + timedelta(hours=DEFAULT_AVAILABILITY_SEARCH_HOURS)
         )
+
+        if end < start:
+            raise ApplicationException("A data final da janela deve ser igual ou posterior à inicial.")
+        if end - start > timedelta(days=MAX_WINDOW_DAYS):
+            raise ApplicationException(f"A janela de disponibilidades pode cobrir no máximo {MAX_WINDOW_DAYS} dias.")
+
+        return start, end
@@ -5,13 +5,19 @@ from pydantic import BaseModel
 
 from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
+from application.dtos.availability_recurrence_dto import AvailabilityRecurrenceDTO
 from application.dtos.psychologist_dto import PsychologistDTO
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.ipsychologist_repo import IPsychologistRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
+from application.use_cases.psychologist.add_availabilities import validate_availability_count
 from domain.common.unique_entity_id import UniqueEntityId
 
 
 class RemoveAvailabilitiesDTO(BaseModel):
-    availability_datetimes: list[datetime]
+    availability_datetimes: list[datetime] = []
+    # Expanded on the server and removed together with the explicit datetimes
+    recurrence: AvailabilityRecurrenceDTO | None = None
     psychologist_id: UUID
 
     class Config:
@@ -20,15 +26,25 @@ class RemoveAvailabilitiesDTO(BaseModel):
 
 class RemoveAvailabilitiesUseCase(IUseCase[RemoveAvailabilitiesDTO, PsychologistDTO]):
     psychologist_repo: IPsychologistRepo
+    availability_repo: IAvailabilityRepo
+    response_cache: IResponseCache
 
     def __init__(
         self,
         psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
+        response_cache: IResponseCache,
     ) -> None:
         self.psychologist_repo = psychologist_repo
+        self.availability_repo = availability_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: RemoveAvailabilitiesDTO) -> PsychologistDTO:
         availability_datetimes = dto.availability_datetimes
+        if dto.recurrence:
+            availability_datetimes = [*availability_datetimes, *dto.recurrence.expand()]
+
+        validate_availability_count(availability_datetimes)
 
         psychologist = await self.psychologist_repo.get_by_id(UniqueEntityId(dto.psychologist_id))
 
@@ -39,7 +55,11 @@ class RemoveAvailabilitiesUseCase(IUseCase[RemoveAvailabilitiesDTO, Psychologist
             raise ApplicationException("É necessário fornecer pelo menos uma disponibilidade para remover.")
 
         # Remove the availabilities (domain will validate if they exist and are available)
-        psychologist.remove_availabilities(availability_datetimes)
+        removed_availabilities = psychologist.remove_availabilities(availability_datetimes)
+        await self.availability_repo.delete_available(
+            psychologist.id, [availability.id for availability in removed_availabilities]
+        )
+
+        await self.response_cache.invalidate(CacheTags.psychologist(dto.psychologist_id), CacheTags.AVAILABILITY_SEARCH)
 
-        updated_psychologist = await self.psychologist_repo.update(psychologist)
-        return PsychologistDTO.to_dto(updated_psychologist)
+        return PsychologistDTO.to_dto(psychologist)
@@ -14,13 +14,10 @@ from application.repos.ispecialty_repo import ISpecialtyRepo
 from application.repos.iuser_repo import IUserRepo
 from application.services.iauth_service import IAuthService
 from application.services.ifile_service import IFileService
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.common.unique_entity_id import UniqueEntityId
-from domain.psychologist import AudienceEnum, Psychologist
+from domain.psychologist import AudienceEnum
 from domain.user import GenderEnum
-from domain.value_objects.cpf import CPF
-from domain.value_objects.crp import CRP
-from domain.value_objects.email import Email
-from domain.value_objects.phone_number import PhoneNumber
 
 
 class UpdatePsychologistDTO(BaseModel):
@@ -53,6 +50,7 @@ class UpdatePsychologistUseCase(IUseCase[UpdatePsychologistDTO, PsychologistDTO]
     approach_repo: IApproachRepo
     file_service: IFileService
     auth_service: IAuthService
+    response_cache: IResponseCache
 
     def __init__(
         self,
@@ -63,6 +61,7 @@ class UpdatePsychologistUseCase(IUseCase[UpdatePsychologistDTO, PsychologistDTO]
         approach_repo: IApproachRepo,
         file_service: IFileService,
         auth_service: IAuthService,
+        response_cache: IResponseCache,
     ) -> None:
         self.user_repo = user_repo
         self.psychologist_repo = psychologist_repo
@@ -71,6 +70,7 @@ class UpdatePsychologistUseCase(IUseCase[UpdatePsychologistDTO, PsychologistDTO]
         self.approach_repo = approach_repo
         self.file_service = file_service
         self.auth_service = auth_service
+        self.response_cache = response_cache
 
     async def execute(self, dto: UpdatePsychologistDTO) -> PsychologistDTO:
         found_psychologist = await self.psychologist_repo.get_by_id(UniqueEntityId(dto.psychologist_id))
@@ -79,19 +79,13 @@ class UpdatePsychologistUseCase(IUseCase[UpdatePsychologistDTO, PsychologistDTO]
 
         query_list: list[dict[str, str]] = []
 
-        email = found_psychologist.email
-        if dto.email and dto.email != email.value:
-            email = Email(value=dto.email)
+        if dto.email and dto.email != found_psychologist.email.value:
             query_list.append({"email": dto.email})
 
-        cpf = found_psychologist.cpf
-        if dto.cpf and dto.cpf != cpf.value:
-            cpf = CPF(value=dto.cpf)
+        if dto.cpf and dto.cpf != found_psychologist.cpf.value:
             query_list.append({"email": dto.cpf})
 
-        crp = found_psychologist.crp
-        if dto.crp and dto.crp != crp.value:
-            crp = CRP(value=dto.crp)
+        if dto.crp and dto.crp != found_psychologist.crp.value:
             query_list.append({"crp": dto.crp})
 
         if len(query_list) > 0:
@@ -99,59 +93,58 @@ class UpdatePsychologistUseCase(IUseCase[UpdatePsychologistDTO, PsychologistDTO]
             if is_duplicated:
                 raise ApplicationException("E-mail, CPF ou CRP duplicado.")
 
-        specialties = found_psychologist.specialties
+        # Only the fields actually assigned below are persisted by the repo
         if dto.specialty_ids:
             specialties = await self.specialty_repo.get_by_ids([UniqueEntityId(id) for id in dto.specialty_ids])
             if len(specialties) != len(dto.specialty_ids):
                 raise ApplicationException("Uma ou mais especialidades não foram encontradas.")
+            found_psychologist.specialties = specialties
 
-        approaches = found_psychologist.approaches
         if dto.approach_ids:
             approaches = await self.approach_repo.get_by_ids([UniqueEntityId(id) for id in dto.approach_ids])
             if len(approaches) != len(dto.approach_ids):
                 raise ApplicationException("Uma ou mais abordagens não foram encontradas.")
+            found_psychologist.approaches = approaches
 
-        city = found_psychologist.city
         if dto.city_id:
             city = await self.city_repo.get_by_id(UniqueEntityId(dto.city_id))
             if not city:
                 raise ApplicationException("Cidade não encontrada.")
+            found_psychologist.city = city
 
-        profile_picture = found_psychologist.profile_picture
         if dto.delete_profile_picture:
-            profile_picture = None
             if found_psychologist.profile_picture:
                 await self.file_service.delete(found_psychologist.profile_picture.key)
+            found_psychologist.profile_picture = None
 
         elif dto.profile_picture:
             # Delete old profile picture and upload new one
             if found_psychologist.profile_picture:
                 await self.file_service.delete(found_psychologist.profile_picture.key)
-            profile_picture = await self.file_service.upload(dto.profile_picture)
-
-        updated_psychologist = Psychologist(
-            name=dto.name or found_psychologist.name,
-            email=email,
-            password=found_psychologist.password,
-            cpf=cpf,
-            phone_number=PhoneNumber(value=dto.phone_number) if dto.phone_number else found_psychologist.phone_number,
-            birth_date=dto.birth_date or found_psychologist.birth_date,
-            gender=GenderEnum(dto.gender) if dto.gender else found_psychologist.gender,
-            city=city,
-            crp=crp,
-            description=dto.description or found_psychologist.description,
-            specialties=specialties,
-            approaches=approaches,
-            audiences=[AudienceEnum(audience) for audience in dto.audiences]
-            if dto.audiences
-            else found_psychologist.audiences,
-            value_per_appointment=dto.value_per_appointment
-            if dto.value_per_appointment is not None
-            else found_psychologist.value_per_appointment,
-            availabilities=found_psychologist.availabilities,
-            profile_picture=profile_picture,
-            id=found_psychologist.id,
-        )
-
-        saved_psychologist = await self.psychologist_repo.update(updated_psychologist)
+            found_psychologist.profile_picture = await self.file_service.upload(dto.profile_picture)
+
+        if dto.name:
+            found_psychologist.name = dto.name
+        if dto.email and dto.email != found_psychologist.email.value:
+            found_psychologist.email = dto.email
+        if dto.cpf and dto.cpf != found_psychologist.cpf.value:
+            found_psychologist.cpf = dto.cpf
+        if dto.crp and dto.crp != found_psychologist.crp.value:
+            found_psychologist.crp = dto.crp
+        if dto.phone_number:
+            found_psychologist.phone_number = dto.phone_number
+        if dto.birth_date:
+            found_psychologist.birth_date = dto.birth_date
+        if dto.gender:
+            found_psychologist.gender = GenderEnum(dto.gender)
+        if dto.description:
+            found_psychologist.description = dto.description
+        if dto.audiences:
+            found_psychologist.audiences = [AudienceEnum(audience) for audience in dto.audiences]
+        if dto.value_per_appointment is not None:
+            found_psychologist.value_per_appointment = dto.value_per_appointment
+
+        saved_psychologist = await self.psychologist_repo.update(found_psychologist)
+        await self.response_cache.invalidate(CacheTags.psychologist(dto.psychologist_id), CacheTags.PSYCHOLOGISTS)
+
         return PsychologistDTO.to_dto(saved_psychologist)
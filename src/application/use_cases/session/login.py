@@ -43,7 +43,7 @@ class LoginUseCase(IUseCase[LoginDTO, LoginDTOResponse]):
         is_match = await self.auth_service.verify_password(Password(value=dto.password), found_user.password)
         if not is_match:
             raise UnauthorizedAccessException("E-mail ou senha incorretos")
-        access_token, refresh_token = self.auth_service.sign_jwt_tokens(found_user)
+        access_token, refresh_token = await self.auth_service.sign_jwt_tokens(found_user)
         user_id = str(found_user.id.value)
         await self.auth_service.save_authenticated_user(user_id, refresh_token)
 
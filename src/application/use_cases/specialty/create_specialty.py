@@ -3,6 +3,7 @@ from pydantic import BaseModel
 from application.common.use_case import IUseCase
 from application.dtos.specialty_dto import SpecialtyDTO
 from application.repos.ispecialty_repo import ISpecialtyRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.specialty import Specialty
 
 
@@ -13,9 +14,11 @@ class CreateSpecialtyDTO(BaseModel):
 
 class CreateSpecialtyUseCase(IUseCase[CreateSpecialtyDTO, SpecialtyDTO]):
     specialty_repo: ISpecialtyRepo
+    response_cache: IResponseCache
 
-    def __init__(self, specialty_repo: ISpecialtyRepo) -> None:
+    def __init__(self, specialty_repo: ISpecialtyRepo, response_cache: IResponseCache) -> None:
         self.specialty_repo = specialty_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: CreateSpecialtyDTO) -> SpecialtyDTO:
         specialty = Specialty(
@@ -25,4 +28,6 @@ class CreateSpecialtyUseCase(IUseCase[CreateSpecialtyDTO, SpecialtyDTO]):
         )
 
         created_specialty = await self.specialty_repo.create(specialty)
+        await self.response_cache.invalidate(CacheTags.SPECIALTIES)
+
         return SpecialtyDTO.to_dto(created_specialty)
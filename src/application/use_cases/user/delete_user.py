@@ -5,6 +5,7 @@ from pydantic import BaseModel
 from application.common.exception import ApplicationException
 from application.common.use_case import IUseCase
 from application.repos.iuser_repo import IUserRepo
+from application.services.iresponse_cache import CacheTags, IResponseCache
 from domain.common.unique_entity_id import UniqueEntityId
 
 
@@ -14,12 +15,15 @@ class DeleteUserDTO(BaseModel):
 
 class DeleteUserUseCase(IUseCase[DeleteUserDTO, bool]):
     user_repo: IUserRepo
+    response_cache: IResponseCache
 
     def __init__(
         self,
         user_repo: IUserRepo,
+        response_cache: IResponseCache,
     ) -> None:
         self.user_repo = user_repo
+        self.response_cache = response_cache
 
     async def execute(self, dto: DeleteUserDTO) -> bool:
         user = await self.user_repo.get_by_id(UniqueEntityId(dto.user_id))
@@ -31,4 +35,9 @@ class DeleteUserUseCase(IUseCase[DeleteUserDTO, bool]):
         if not deleted:
             raise ApplicationException("Falha ao deletar usuário.")
 
+        # A deleted psychologist disappears from listings, profiles and its contents' author
+        await self.response_cache.invalidate(
+            CacheTags.psychologist(dto.user_id), CacheTags.PSYCHOLOGISTS, CacheTags.CONTENTS
+        )
+
         return deleted
@@ -93,6 +93,7 @@ class Appointment(Entity):
         if self._status != AppointmentStatusEnum.PENDING_CONFIRMATION:
             raise DomainException("Só é possível confirmar consultas com pagamento pendente de confirmação")
         self._status = AppointmentStatusEnum.CONFIRMED
+        self._mark_dirty("status")
         self._pix_payment.mark_as_paid()
 
     def mark_payment_sent(self) -> None:
@@ -100,18 +101,21 @@ class Appointment(Entity):
         if self._status != AppointmentStatusEnum.WAITING_FOR_PAYMENT:
             raise DomainException("Só é possível marcar pagamento em consultas aguardando pagamento")
         self._status = AppointmentStatusEnum.PENDING_CONFIRMATION
+        self._mark_dirty("status")
 
     def cancel(self) -> None:
         """Cancel the appointment"""
         if self._status in [AppointmentStatusEnum.CANCELED, AppointmentStatusEnum.COMPLETED]:
             raise DomainException("Não é possível cancelar consultas já canceladas ou finalizadas")
         self._status = AppointmentStatusEnum.CANCELED
+        self._mark_dirty("status")
 
     def complete(self) -> None:
         """Mark the appointment as completed"""
         if self._status != AppointmentStatusEnum.CONFIRMED:
             raise DomainException("Só é possível finalizar consultas confirmadas")
         self._status = AppointmentStatusEnum.COMPLETED
+        self._mark_dirty("status")
 
     def reschedule(self, new_date: datetime, new_availability_id: UniqueEntityId) -> None:
         """Reschedule appointment to a new date and availability."""
@@ -127,3 +131,4 @@ class Appointment(Entity):
 
         self._date = new_date
         self._availability_id = new_availability_id
+        self._mark_dirty("date", "availability_id")
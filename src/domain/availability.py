@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
 from datetime import datetime, timezone
 
 from domain.common.entity import Entity
@@ -18,10 +20,9 @@ class Availability(Entity):
         super().__init__(id)
 
         # Normalizar data removendo microsegundos para consistência
-        if date.tzinfo is None:
-            self._date = date.replace(tzinfo=timezone.utc, microsecond=0)
-        else:
-            self._date = date.astimezone(timezone.utc).replace(microsecond=0)
+        self._date = self.normalize_datetime(date)
+        # Epoch seconds of the normalized date: the key used for comparisons and by AvailabilitySchedule
+        self._key = int(self._date.timestamp())
         self._available = available
 
     def schedule(self):
@@ -31,9 +32,7 @@ class Availability(Entity):
         # Validação: não permitir agendar se já passou mais de 1 hora
         # Isso dá margem para diferenças de timezone mas previne agendamentos muito antigos
         now_utc = datetime.now(timezone.utc)
-        time_diff_hours = (
-            self._normalize_datetime(self.date) - self._normalize_datetime(now_utc)
-        ).total_seconds() / 3600
+        time_diff_hours = (self.normalize_datetime(self.date) - self.normalize_datetime(now_utc)).total_seconds() / 3600
 
         if time_diff_hours < -1:  # Se passou mais de 1 hora
             raise DomainException("Disponibilidade inválida - horário já passou.")
@@ -48,9 +47,10 @@ class Availability(Entity):
         self._available = True
 
     def is_date_equals_to(self, i_date: datetime):
-        return self._normalize_datetime(i_date) == self._normalize_datetime(self.date)
+        return self.key_of(i_date) == self._key
 
-    def _normalize_datetime(self, dt: datetime) -> datetime:
+    @staticmethod
+    def normalize_datetime(dt: datetime) -> datetime:
         # Normalizar para UTC e remover microsegundos para comparação
         if dt.tzinfo is None:
             normalized = dt.replace(tzinfo=timezone.utc, microsecond=0)
@@ -58,9 +58,23 @@ class Availability(Entity):
             normalized = dt.astimezone(timezone.utc).replace(microsecond=0)
         return normalized
 
+    @staticmethod
+    def current_slot_start() -> datetime:
+        """Start of the ongoing hourly slot: slots before it are in the past."""
+        return datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def key_of(dt: datetime) -> int:
+        return int(Availability.normalize_datetime(dt).timestamp())
+
+    @property
+    def key(self) -> int:
+        return self._key
+
     @property
     def normalized_date(self) -> datetime:
-        return self._normalize_datetime(self._date)
+        # Already normalized at construction
+        return self._date
 
     @property
     def date(self) -> datetime:
@@ -69,3 +83,79 @@ class Availability(Entity):
     @property
     def available(self) -> bool:
         return self._available
+
+
+class AvailabilitySchedule:
+    """
+    A psychologist's availabilities kept sorted by `Availability.key` (epoch seconds), with a dict index.
+
+    Point lookups and dedupe are O(1), range queries are O(log n + k), single inserts and removals are
+    O(log n) to locate plus a memmove of the key array.
+    """
+
+    # Above this many keys changed at once, rebuilding the key array is cheaper than one memmove per key
+    _BULK_THRESHOLD = 64
+
+    _keys: list[int]
+    _by_key: dict[int, Availability]
+
+    def __init__(self, availabilities: Iterable[Availability] = ()) -> None:
+        self._by_key = {}
+        for availability in availabilities:
+            self._by_key.setdefault(availability.key, availability)
+        self._keys = sorted(self._by_key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self):
+        return (self._by_key[key] for key in self._keys)
+
+    def get(self, dt: datetime) -> Availability | None:
+        return self._by_key.get(Availability.key_of(dt))
+
+    def between(
+        self, start: datetime | None = None, end: datetime | None = None, *, only_available: bool = False
+    ) -> list[Availability]:
+        """Availabilities with start <= date <= end, in chronological order. A missing bound is open."""
+        low = bisect_left(self._keys, Availability.key_of(start)) if start is not None else 0
+        high = bisect_right(self._keys, Availability.key_of(end)) if end is not None else len(self._keys)
+        keys = self._keys[low:high]
+        availabilities = [self._by_key[key] for key in keys]
+
+        if only_available:
+            return [availability for availability in availabilities if availability.available]
+        return availabilities
+
+    def add_many(self, availabilities: Iterable[Availability]) -> list[Availability]:
+        """Adds the availabilities whose date is not present yet (first one wins). Returns the ones added."""
+        added: list[Availability] = []
+        for availability in availabilities:
+            if availability.key not in self._by_key:
+                self._by_key[availability.key] = availability
+                added.append(availability)
+
+        if len(added) > self._BULK_THRESHOLD:
+            # Timsort merges the two sorted runs in linear time
+            self._keys.extend(sorted(availability.key for availability in added))
+            self._keys.sort()
+        else:
+            for availability in added:
+                insort(self._keys, availability.key)
+
+        return added
+
+    def remove_available(self, dts: Iterable[datetime]) -> list[Availability]:
+        """Removes the still available slots at the given dates. Returns the removed ones in chronological order."""
+        removed_keys = sorted(
+            {key for key in map(Availability.key_of, dts) if key in self._by_key and self._by_key[key].available}
+        )
+        removed = [self._by_key.pop(key) for key in removed_keys]
+
+        if len(removed_keys) > self._BULK_THRESHOLD:
+            self._keys = [key for key in self._keys if key in self._by_key]
+        else:
+            for key in removed_keys:
+                del self._keys[bisect_left(self._keys, key)]
+
+        return removed
@@ -7,9 +7,11 @@ from domain.common.unique_entity_id import UniqueEntityId
 
 class Entity(ABC):
     _id: UniqueEntityId
+    _dirty_fields: set[str]
 
     def __init__(self, id: UniqueEntityId | None) -> None:
         self._id = id if id is not None else UniqueEntityId()
+        self._dirty_fields = set()
 
     def equals(self, obj: Entity):
         if obj is None or not isinstance(obj, Entity):
@@ -20,3 +22,14 @@ class Entity(ABC):
     @property
     def id(self) -> UniqueEntityId:
         return self._id
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        """Fields changed since the entity was created or loaded, so repos can persist only those."""
+        return frozenset(self._dirty_fields)
+
+    def clear_dirty_fields(self) -> None:
+        self._dirty_fields.clear()
+
+    def _mark_dirty(self, *fields: str) -> None:
+        self._dirty_fields.update(fields)
@@ -54,6 +54,8 @@ class Content(Entity):
             if not title.strip():
                 raise DomainException("O título não pode estar vazio")
             self._title = title
+            self._mark_dirty("title")
 
         if body is not None:
             self._body = body
+            self._mark_dirty("body")
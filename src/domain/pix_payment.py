@@ -72,7 +72,9 @@ class PixPayment(Entity):
     def mark_as_paid(self) -> None:
         """Mark payment as paid"""
         self._status = PaymentStatusEnum.PAID
+        self._mark_dirty("status")
 
     def mark_as_failed(self) -> None:
         """Mark payment as failed"""
         self._status = PaymentStatusEnum.FAILED
+        self._mark_dirty("status")
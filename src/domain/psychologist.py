@@ -2,7 +2,7 @@ from datetime import date, datetime
 from enum import Enum
 
 from domain.approach import Approach
-from domain.availability import Availability
+from domain.availability import Availability, AvailabilitySchedule
 from domain.city import City
 from domain.common.exception import DomainException
 from domain.common.guard import Guard
@@ -81,8 +81,9 @@ class Psychologist(User):
         self._specialties = specialties
         self._approaches = approaches
         self._audiences = audiences
-        self._availabilities = availabilities
-        self.value_per_appointment = value_per_appointment
+        # Sorted by date and deduplicated once, here: lookups and range queries are O(log n)
+        self._availabilities = AvailabilitySchedule(availabilities or [])
+        self._value_per_appointment = value_per_appointment
 
     @property
     def crp(self) -> CRP:
@@ -104,56 +105,77 @@ class Psychologist(User):
     def audiences(self) -> list[AudienceEnum]:
         return self._audiences
 
+    @property
+    def value_per_appointment(self) -> float:
+        return self._value_per_appointment
+
     @property
     def availabilities(self) -> list[Availability] | None:
-        return self._availabilities
+        return list(self._availabilities) or None
 
-    def add_availabilities(self, availabilities: list[Availability]) -> None:
-        if self._availabilities is None:
-            self._availabilities = []
+    @crp.setter
+    def crp(self, crp: str | CRP) -> None:
+        self._crp = crp if isinstance(crp, CRP) else CRP(value=crp)
+        self._mark_dirty("crp")
 
-        existing_datetimes = {availability.normalized_date for availability in self._availabilities}
+    @description.setter
+    def description(self, description: str | None) -> None:
+        self._description = description
+        self._mark_dirty("description")
 
-        new_availabilities = [
-            availability for availability in availabilities if availability.normalized_date not in existing_datetimes
-        ]
+    @specialties.setter
+    def specialties(self, specialties: list[Specialty]) -> None:
+        Guard.against_empty_list(specialties, "specialties")
+        self._specialties = specialties
+        self._mark_dirty("specialties")
 
-        self._availabilities.extend(new_availabilities)
+    @approaches.setter
+    def approaches(self, approaches: list[Approach]) -> None:
+        Guard.against_empty_list(approaches, "approaches")
+        self._approaches = approaches
+        self._mark_dirty("approaches")
 
-    def remove_availabilities(self, availability_datetimes: list[datetime]) -> None:
-        """Remove availabilities by their datetime. Only removes if available (not scheduled)."""
-        if not self._availabilities:
-            raise DomainException("O psicólogo não possui disponibilidades.")
+    @audiences.setter
+    def audiences(self, audiences: list[AudienceEnum]) -> None:
+        Guard.against_empty_list(audiences, "audiences")
+        self._audiences = audiences
+        self._mark_dirty("audiences")
 
-        # Normalize datetimes for comparison
-        from domain.availability import Availability as AvailabilityClass
+    @value_per_appointment.setter
+    def value_per_appointment(self, value_per_appointment: float) -> None:
+        # Consultation price validation: must not exceed 1000
+        Guard.in_range(value_per_appointment, 0, 1000, "value_per_appointment")
+        self._value_per_appointment = value_per_appointment
+        self._mark_dirty("value_per_appointment")
 
-        temp_availability = AvailabilityClass(date=datetime.now(), available=True)
-        normalized_datetimes = {temp_availability._normalize_datetime(dt) for dt in availability_datetimes}
+    def add_availabilities(self, availabilities: list[Availability]) -> list[Availability]:
+        """Add availabilities, skipping dates already present. Returns only the ones actually added."""
+        return self._availabilities.add_many(availabilities)
+
+    def remove_availabilities(self, availability_datetimes: list[datetime]) -> list[Availability]:
+        """Remove availabilities by their datetime. Only removes if available (not scheduled).
+        Returns the removed availabilities."""
+        if not self._availabilities:
+            raise DomainException("O psicólogo não possui disponibilidades.")
 
-        # Filter out availabilities that match the datetimes AND are available
-        removed_count = 0
-        new_availabilities = []
-        for availability in self._availabilities:
-            if availability.normalized_date in normalized_datetimes and availability.available:
-                removed_count += 1
-                # Skip this availability (remove it)
-                continue
-            new_availabilities.append(availability)
+        removed = self._availabilities.remove_available(availability_datetimes)
 
-        if removed_count == 0:
+        if not removed:
             raise DomainException("Nenhuma disponibilidade válida foi encontrada para remoção.")
 
-        self._availabilities = new_availabilities
+        return removed
+
+    def get_availabilities_between(
+        self, start: datetime | None = None, end: datetime | None = None, only_available: bool = False
+    ) -> list[Availability]:
+        """Availabilities from `start` to `end` (inclusive), in chronological order. A missing bound is open."""
+        return self._availabilities.between(start, end, only_available=only_available)
 
     def get_availability_by_date(self, availability_date: datetime) -> UniqueEntityId:
-        if not self.availabilities:
+        if not self._availabilities:
             raise DomainException("O psicólogo não possui disponibilidades.")
 
-        availability = next(
-            (availability for availability in self.availabilities if availability.is_date_equals_to(availability_date)),
-            None,
-        )
+        availability = self._availabilities.get(availability_date)
 
         if not availability:
             raise DomainException("Nenhuma disponibilidade encontrada para a data informada.")
@@ -45,13 +45,7 @@ class User(Entity, ABC):
             ]
         )
         Guard.against_empty_str(name, "name")
-
-        # Age validation: must be between 18 and 150 years
-        from datetime import date
-
-        today = date.today()
-        age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
-        Guard.in_range(age, 18, 150, "age (from birth_date)")
+        self._validate_birth_date(birth_date)
 
         super().__init__(id)
 
@@ -106,23 +100,58 @@ class User(Entity, ABC):
     def city(self) -> City:
         return self._city
 
+    @name.setter
+    def name(self, name: str) -> None:
+        Guard.against_empty_str(name, "name")
+        self._name = name
+        self._mark_dirty("name")
+
+    @email.setter
+    def email(self, email: str | Email) -> None:
+        self._email = email if isinstance(email, Email) else Email(value=email)
+        self._mark_dirty("email")
+
+    @cpf.setter
+    def cpf(self, cpf: str | CPF) -> None:
+        self._cpf = cpf if isinstance(cpf, CPF) else CPF(value=cpf)
+        self._mark_dirty("cpf")
+
+    @birth_date.setter
+    def birth_date(self, birth_date: date) -> None:
+        Guard.against_undefined(birth_date, "birth_date")
+        self._validate_birth_date(birth_date)
+        self._birth_date = birth_date
+        self._mark_dirty("birth_date")
+
     @phone_number.setter
     def phone_number(self, phone_number: str | PhoneNumber) -> None:
         self._phone_number = phone_number if isinstance(phone_number, PhoneNumber) else PhoneNumber(value=phone_number)
+        self._mark_dirty("phone_number")
 
     @profile_picture.setter
     def profile_picture(self, profile_picture: FileData | None) -> None:
         self._profile_picture = profile_picture
+        self._mark_dirty("profile_picture")
 
     @gender.setter
     def gender(self, gender: GenderEnum) -> None:
         Guard.against_undefined(gender, "gender")
         self._gender = gender
+        self._mark_dirty("gender")
 
     @city.setter
     def city(self, city: City):
         Guard.against_undefined(city, "city")
         self._city = city
+        self._state = city.state
+        self._mark_dirty("city")
+
+    @staticmethod
+    def _validate_birth_date(birth_date: date) -> None:
+        # Age validation: must be between 18 and 150 years
+        today = date.today()
+        age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+        Guard.in_range(age, 18, 150, "age (from birth_date)")
 
     from abc import abstractmethod
 
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from uuid import UUID
+
+from pydantic import TypeAdapter
+from pymongo.errors import PyMongoError
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from application.common.page import Page
+from application.common.pageable import Pageable
+from application.dtos.city_dto import CityDTO
+from application.dtos.state_dto import StateDTO
+from domain.city import City
+from domain.state import State
+from infra.cache.reference_cache import ReferenceCache
+from infra.config.logger import logger
+
+_CITY_LIST_ADAPTER = TypeAdapter(list[CityDTO])
+
+# Quantidade de páginas de estados (page, size, name) serializadas mantidas por snapshot
+_MAX_STATE_PAGES = 256
+
+
+@dataclass(frozen=True)
+class JsonResource:
+    """Corpo JSON já serializado e seu ETag forte (hash do conteúdo)."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_body(cls, body: bytes) -> JsonResource:
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+@dataclass(frozen=True)
+class GeographySnapshot:
+    """Estados e cidades por estado serializados uma única vez; imutável depois de montado."""
+
+    versions: tuple[int, int]
+    states: tuple[StateDTO, ...]
+    cities_by_state: Mapping[UUID, JsonResource]
+    no_cities: JsonResource
+    _state_pages: dict[tuple[int, int, str | None], JsonResource] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def build(cls, states: list[State], cities: list[City], versions: tuple[int, int]) -> GeographySnapshot:
+        cities_by_state: dict[UUID, list[CityDTO]] = {}
+        for city in sorted(cities, key=lambda city: city.name):
+            cities_by_state.setdefault(city.state.id.value, []).append(CityDTO.to_dto(city))
+
+        return cls(
+            versions=versions,
+            states=tuple(StateDTO.to_dto(state) for state in sorted(states, key=lambda state: state.name)),
+            cities_by_state=MappingProxyType(
+                {
+                    state_id: JsonResource.from_body(_CITY_LIST_ADAPTER.dump_json(dtos))
+                    for state_id, dtos in cities_by_state.items()
+                }
+            ),
+            no_cities=JsonResource.from_body(_CITY_LIST_ADAPTER.dump_json([])),
+        )
+
+    def cities(self, state_id: UUID) -> JsonResource:
+        return self.cities_by_state.get(state_id, self.no_cities)
+
+    def states_page(self, page: int, size: int, name: str | None) -> JsonResource:
+        """Mesma resposta de `GET /states` (ordenada por nome, filtro por nome sem diferenciar maiúsculas)."""
+        key = (page, size, name)
+        resource = self._state_pages.get(key)
+        if resource:
+            return resource
+
+        states = list(self.states)
+        if name:
+            try:
+                pattern = re.compile(name, re.IGNORECASE)
+            except re.error:
+                pattern = re.compile(re.escape(name), re.IGNORECASE)
+            states = [state for state in states if pattern.search(state.name)]
+
+        pageable = Pageable(page=page, size=size)
+        items = states[pageable.offset() : pageable.offset() + pageable.limit()]
+        resource = JsonResource.from_body(
+            Page[StateDTO](items=items, total=len(states), pageable=pageable).model_dump_json().encode()
+        )
+
+        if len(self._state_pages) < _MAX_STATE_PAGES:
+            self._state_pages[key] = resource
+
+        return resource
+
+
+class GeographySnapshotStore:
+    """
+    Mantém o snapshot de geografia e o refaz quando o cache de referência recarrega estados ou cidades.
+
+    O snapshot é montado em `start()`, antes da primeira requisição. O seeder de geografia roda em outro
+    processo e publica em `CHANNEL` ao terminar; cada instância recarrega estados e cidades ao receber a
+    mensagem. Se a assinatura cair, as tabelas são invalidadas, pois um aviso pode ter se perdido.
+    """
+
+    CHANNEL = "geographySnapshot"
+
+    _reference_cache: ReferenceCache
+    _redis_client: Redis
+    _snapshot: GeographySnapshot | None
+    _lock: asyncio.Lock
+    _listener: asyncio.Task[None] | None
+
+    def __init__(self, reference_cache: ReferenceCache, redis_client: Redis) -> None:
+        self._reference_cache = reference_cache
+        self._redis_client = redis_client
+        self._snapshot = None
+        self._lock = asyncio.Lock()
+        self._listener = None
+        self.pubsub_rebuilds = 0
+
+    @classmethod
+    async def request_rebuild(cls, redis_client: Redis) -> int:
+        """Pede às instâncias da API que refaçam o snapshot. Retorna quantas receberam o aviso."""
+        return await redis_client.publish(cls.CHANNEL, "rebuild")
+
+    async def start(self) -> None:
+        await self.get()
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+
+    async def get(self) -> GeographySnapshot:
+        versions = (await self._reference_cache.states.refresh(), await self._reference_cache.cities.refresh())
+        if self._snapshot is not None and self._snapshot.versions == versions:
+            return self._snapshot
+
+        async with self._lock:
+            if self._snapshot is None or self._snapshot.versions != versions:
+                states = await self._reference_cache.states.get_all()
+                cities = await self._reference_cache.cities.get_all()
+                # Serializar ~5.570 cidades é CPU puro: fora do event loop
+                self._snapshot = await asyncio.to_thread(GeographySnapshot.build, states, cities, versions)
+
+            return self._snapshot
+
+    def _invalidate(self) -> None:
+        self._reference_cache.states.invalidate()
+        self._reference_cache.cities.invalidate()
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub: PubSub = self._redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+
+                    self._invalidate()
+                    self.pubsub_rebuilds += 1
+                    try:
+                        await self.get()
+                    except PyMongoError as e:
+                        # As tabelas já foram invalidadas: a próxima requisição tenta a recarga de novo
+                        logger.error(f"❌ Geography snapshot rebuild failed: {e}")
+
+            except (RedisError, OSError) as e:
+                logger.error(f"❌ Geography snapshot subscription lost: {e}")
+                self._invalidate()
+                await asyncio.sleep(1)
+            finally:
+                with contextlib.suppress(RedisError, OSError):
+                    await pubsub.aclose()
@@ -0,0 +1,29 @@
+from typing import Any
+from uuid import UUID
+
+from domain.content import Content
+from domain.psychologist import Psychologist
+from infra.cache.single_flight import SingleFlight
+
+
+class ReadCoalescer:
+    """
+    Buscas por id simultâneas do processo, agrupadas por repositório: requisições que pedem o mesmo
+    perfil de psicólogo ou conteúdo ao mesmo tempo compartilham uma única consulta e o mesmo resultado.
+
+    Só vale para leituras fora de transação (rotas `ReadOnly`): a entidade devolvida é compartilhada
+    entre as requisições e não deve ser alterada.
+    """
+
+    psychologists: SingleFlight[UUID, Psychologist | None]
+    contents: SingleFlight[UUID, Content | None]
+
+    def __init__(self) -> None:
+        self.psychologists = SingleFlight()
+        self.contents = SingleFlight()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "psychologists": self.psychologists.stats(),
+            "contents": self.contents.stats(),
+        }
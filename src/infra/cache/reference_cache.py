@@ -0,0 +1,246 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+from uuid import UUID
+
+from beanie import Document
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.read_preferences import ReadPreference
+
+from domain.approach import Approach
+from domain.city import City
+from domain.common.entity import Entity
+from domain.common.unique_entity_id import UniqueEntityId
+from domain.specialty import Specialty
+from domain.state import State
+from infra.mappers.mongo.approach_mapper import ApproachMongoMapper
+from infra.mappers.mongo.specialty_mapper import SpecialtyMongoMapper
+from infra.mappers.mongo.state_mapper import StateMongoMapper
+from infra.models.mongo.approach_document import ApproachDocument
+from infra.models.mongo.city_document import CityDocument
+from infra.models.mongo.specialty_document import SpecialtyDocument
+from infra.models.mongo.state_document import StateDocument
+
+
+def _by_ids(ids: list[UUID] | None) -> dict[str, Any]:
+    return {"_id": {"$in": ids}} if ids is not None else {}
+
+
+class ReferenceTable[E: Entity]:
+    """
+    Cópia em memória de uma coleção pequena e quase imutável.
+
+    A coleção inteira é carregada no primeiro acesso e recarregada depois de `ttl_seconds`
+    ou de `invalidate()`. Carregamentos concorrentes são serializados por um lock.
+
+    Um id ausente da última carga é buscado no banco (`fetcher`) antes de ser dado como inexistente:
+    pode ter sido criado depois dela, inclusive por outra réplica. Se existir, a tabela é recarregada.
+    """
+
+    _loader: Callable[[], Awaitable[list[E]]]
+    _fetcher: Callable[[list[UUID], AsyncClientSession | None], Awaitable[list[E]]]
+    _ttl_seconds: float
+    _group_by: Callable[[E], Hashable] | None
+    _by_id: dict[UUID, E]
+    _groups: dict[Hashable, list[E]]
+    _loaded_at: float | None
+    _lock: asyncio.Lock
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[list[E]]],
+        fetcher: Callable[[list[UUID], AsyncClientSession | None], Awaitable[list[E]]],
+        ttl_seconds: float,
+        group_by: Callable[[E], Hashable] | None = None,
+    ) -> None:
+        self._loader = loader
+        self._fetcher = fetcher
+        self._ttl_seconds = ttl_seconds
+        self._group_by = group_by
+        self._by_id = {}
+        self._groups = {}
+        self._loaded_at = None
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Acessos que esperaram a carga de outra corrotina em vez de consultar o banco
+        self.coalesced = 0
+        # Ids ausentes da carga que existiam no banco
+        self.fallbacks = 0
+        # Incrementado a cada carga, para quem deriva dados da tabela saber quando refazê-los
+        self.version = 0
+
+    def _is_fresh(self) -> bool:
+        return self._loaded_at is not None and time.monotonic() - self._loaded_at < self._ttl_seconds
+
+    async def _ensure_loaded(self) -> None:
+        if self._is_fresh():
+            self.hits += 1
+            return
+
+        async with self._lock:
+            # Outra corrotina pode ter carregado enquanto esperávamos o lock
+            if self._is_fresh():
+                self.coalesced += 1
+                return
+
+            self.misses += 1
+            entities = await self._loader()
+
+            groups: dict[Hashable, list[E]] = {}
+            if self._group_by:
+                for entity in entities:
+                    groups.setdefault(self._group_by(entity), []).append(entity)
+
+            self._by_id = {entity.id.value: entity for entity in entities}
+            self._groups = groups
+            self._loaded_at = time.monotonic()
+            self.version += 1
+
+    async def refresh(self) -> int:
+        """Garante que a tabela está carregada e devolve a versão atual."""
+        await self._ensure_loaded()
+        return self.version
+
+    def invalidate(self) -> None:
+        self._loaded_at = None
+
+    async def get_all(self) -> list[E]:
+        await self._ensure_loaded()
+        return list(self._by_id.values())
+
+    async def get_by_id(self, id: UniqueEntityId, session: AsyncClientSession | None = None) -> E | None:
+        found = await self.get_by_ids([id], session)
+        return found[0] if found else None
+
+    async def get_by_ids(self, ids: list[UniqueEntityId], session: AsyncClientSession | None = None) -> list[E]:
+        """Entidades dos ids, na ordem pedida. A sessão é usada para buscar no banco os ids ausentes da carga."""
+        await self._ensure_loaded()
+
+        fetched: dict[UUID, E] = {}
+        missing = list(dict.fromkeys(id.value for id in ids if id.value not in self._by_id))
+        if missing:
+            fetched = {entity.id.value: entity for entity in await self._fetcher(missing, session)}
+            if fetched:
+                self.fallbacks += 1
+                self.invalidate()
+
+        return [entity for id in ids if (entity := self._by_id.get(id.value) or fetched.get(id.value))]
+
+    def peek(self, id: UUID) -> E | None:
+        """Busca síncrona na última carga, para mapear muitos itens depois de um único `refresh()`."""
+        return self._by_id.get(id)
+
+    def peek_many(self, ids: list[UUID]) -> list[E]:
+        return [self._by_id[id] for id in ids if id in self._by_id]
+
+    async def get_group(self, key: Hashable) -> list[E]:
+        await self._ensure_loaded()
+        return list(self._groups.get(key, []))
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "size": len(self._by_id),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "fallbacks": self.fallbacks,
+            "loaded": self._is_fresh(),
+        }
+
+
+class ReferenceCache:
+    """Cache do processo para especialidades, abordagens, estados e cidades."""
+
+    specialties: ReferenceTable[Specialty]
+    approaches: ReferenceTable[Approach]
+    states: ReferenceTable[State]
+    cities: ReferenceTable[City]
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.specialties = ReferenceTable(self._load_specialties, self._fetch_specialties, ttl_seconds)
+        self.approaches = ReferenceTable(self._load_approaches, self._fetch_approaches, ttl_seconds)
+        self.states = ReferenceTable(self._load_states, self._fetch_states, ttl_seconds)
+        self.cities = ReferenceTable(
+            self._load_cities, self._fetch_cities, ttl_seconds, group_by=lambda city: city.state.id.value
+        )
+
+    # Cargas sem sessão, fora das transações das requisições, sempre no primário: uma carga feita logo
+    # depois de uma escrita não pode vir de um secundário atrasado e ficar em cache até o TTL
+    async def _find[D: Document](
+        self, document: type[D], filter: dict[str, Any], session: AsyncClientSession | None = None
+    ) -> list[D]:
+        collection = document.get_pymongo_collection().with_options(read_preference=ReadPreference.PRIMARY)
+        return [document.model_validate(raw) async for raw in collection.find(filter, session=session)]
+
+    async def _load_specialties(self) -> list[Specialty]:
+        return await self._fetch_specialties(None, None)
+
+    async def _fetch_specialties(self, ids: list[UUID] | None, session: AsyncClientSession | None) -> list[Specialty]:
+        docs = await self._find(SpecialtyDocument, _by_ids(ids), session)
+        return [SpecialtyMongoMapper.to_domain(doc) for doc in docs]
+
+    async def _load_approaches(self) -> list[Approach]:
+        return await self._fetch_approaches(None, None)
+
+    async def _fetch_approaches(self, ids: list[UUID] | None, session: AsyncClientSession | None) -> list[Approach]:
+        docs = await self._find(ApproachDocument, _by_ids(ids), session)
+        return [ApproachMongoMapper.to_domain(doc) for doc in docs]
+
+    async def _load_states(self) -> list[State]:
+        return await self._fetch_states(None, None)
+
+    async def _fetch_states(self, ids: list[UUID] | None, session: AsyncClientSession | None) -> list[State]:
+        docs = await self._find(StateDocument, _by_ids(ids), session)
+        return [StateMongoMapper.to_domain(doc) for doc in docs]
+
+    async def _load_cities(self) -> list[City]:
+        # Monta as cidades com os estados já em cache, sem $lookup por cidade
+        states = {state.id.value: state for state in await self.states.get_all()}
+        docs = await self._find(CityDocument, {})
+
+        return [
+            City(name=doc.name, state=states[doc.state.ref.id], id=UniqueEntityId(doc.id))  # type: ignore
+            for doc in docs
+            if doc.state.ref.id in states  # type: ignore
+        ]
+
+    async def _fetch_cities(self, ids: list[UUID] | None, session: AsyncClientSession | None) -> list[City]:
+        docs = await self._find(CityDocument, _by_ids(ids), session)
+        state_ids = [UniqueEntityId(doc.state.ref.id) for doc in docs]  # type: ignore
+        states = {state.id.value: state for state in await self.states.get_by_ids(state_ids, session)}
+
+        return [
+            City(name=doc.name, state=states[doc.state.ref.id], id=UniqueEntityId(doc.id))  # type: ignore
+            for doc in docs
+            if doc.state.ref.id in states  # type: ignore
+        ]
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {
+            "specialties": self.specialties.stats(),
+            "approaches": self.approaches.stats(),
+            "states": self.states.stats(),
+            "cities": self.cities.stats(),
+        }
+
+
+class PendingReferenceInvalidations:
+    """
+    Tabelas de referência alteradas pela requisição. Só são invalidadas depois do commit: uma recarga
+    feita antes dele não veria a escrita e a deixaria de fora do cache até o TTL.
+    """
+
+    _tables: list[ReferenceTable[Any]]
+
+    def __init__(self) -> None:
+        self._tables = []
+
+    def invalidate(self, *tables: ReferenceTable[Any]) -> None:
+        self._tables.extend(table for table in tables if table not in self._tables)
+
+    def flush(self) -> None:
+        tables, self._tables = self._tables, []
+        for table in tables:
+            table.invalidate()
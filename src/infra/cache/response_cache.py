@@ -0,0 +1,131 @@
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from application.services.iresponse_cache import IResponseCache
+from infra.cache.single_flight import SingleFlight
+from infra.config.logger import logger
+
+
+@dataclass(frozen=True)
+class RenderedResponse:
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+class ResponseCache:
+    """
+    Respostas JSON de rotas públicas guardadas no Redis, cada uma com as tags das entidades que contém.
+
+    Cada tag é um set com as chaves das respostas que a carregam; invalidar uma tag apaga essas respostas.
+    As renderizações concorrentes de uma mesma chave são feitas uma única vez (`flights`).
+    """
+
+    KEY_PREFIX = "responseCache"
+    TAG_PREFIX = "responseCacheTag"
+
+    _redis_client: Redis
+    flights: SingleFlight[str, RenderedResponse]
+
+    def __init__(self, redis_client: Redis) -> None:
+        self._redis_client = redis_client
+        self.flights = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidated_tags = 0
+        self.invalidated_responses = 0
+        # Falhas do Redis contornadas: a requisição segue sem cache
+        self.errors = 0
+
+    def key(self, route_name: str, normalized_request: str) -> str:
+        digest = hashlib.sha256(normalized_request.encode()).hexdigest()[:32]
+        return f"{self.KEY_PREFIX}:{route_name}:{digest}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.TAG_PREFIX}:{tag}"
+
+    async def get(self, key: str) -> str | None:
+        body = await self._redis_client.get(key)
+        if body is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return body
+
+    async def store(self, key: str, body: str, ttl_seconds: int, tags: Iterable[str]) -> None:
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(key, body, ex=ttl_seconds)
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                pipe.sadd(tag_key, key)
+                # O set de uma tag dura tanto quanto a resposta mais longa que a carrega
+                pipe.expire(tag_key, ttl_seconds, gt=True)
+                pipe.expire(tag_key, ttl_seconds, nx=True)
+            await pipe.execute()
+
+        self.stores += 1
+
+    async def invalidate(self, tags: Iterable[str]) -> None:
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return
+
+        async with self._redis_client.pipeline(transaction=False) as pipe:
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            members: list[set[str]] = await pipe.execute()
+
+        keys = set().union(*members)
+        await self._redis_client.unlink(*keys, *tag_keys)
+
+        self.invalidated_tags += len(tag_keys)
+        self.invalidated_responses += len(keys)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "stores": self.stores,
+            "invalidated_tags": self.invalidated_tags,
+            "invalidated_responses": self.invalidated_responses,
+            "errors": self.errors,
+            "single_flight": self.flights.stats(),
+        }
+
+
+class PendingInvalidations(IResponseCache):
+    """
+    Invalidações pedidas pelos casos de uso durante a requisição. Só são aplicadas depois do commit:
+    antes dele, uma leitura concorrente ainda veria os dados antigos e os colocaria de volta no cache.
+    """
+
+    _response_cache: ResponseCache
+    _tags: set[str]
+
+    def __init__(self, response_cache: ResponseCache) -> None:
+        self._response_cache = response_cache
+        self._tags = set()
+
+    async def invalidate(self, *tags: str) -> None:
+        self._tags.update(tags)
+
+    async def flush(self) -> None:
+        if self._tags:
+            tags, self._tags = self._tags, set()
+            try:
+                await self._response_cache.invalidate(tags)
+            except RedisError as e:
+                # A escrita já foi confirmada no MongoDB: falhar aqui faria o cliente repeti-la.
+                # As respostas desatualizadas expiram pelo TTL
+                self._response_cache.errors += 1
+                logger.error(f"❌ Response cache invalidation failed for {sorted(tags)}: {e}")
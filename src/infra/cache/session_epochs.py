@@ -0,0 +1,146 @@
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from infra.config.logger import logger
+
+
+class SessionEpochCache:
+    """
+    Época de sessão de cada usuário, com cópia local (LRU) para validar tokens sem ir ao Redis.
+
+    O logout incrementa a época no Redis e publica o id do usuário em `CHANNEL`; todas as instâncias
+    descartam a cópia local ao receber a mensagem e relêem a época na próxima requisição. Se uma mensagem
+    se perder, nenhuma entrada é usada por mais de `max_staleness_seconds` sem ser relida, o que limita
+    a janela de revogação.
+    """
+
+    CHANNEL = "sessionEpochs"
+    KEY_PREFIX = "sessionEpoch"
+
+    _redis_client: Redis
+    _max_entries: int
+    _max_staleness_seconds: float
+    # user_id -> (época, instante monotônico em que foi lida); época None = invalidada por pub/sub
+    _entries: OrderedDict[str, tuple[int | None, float]]
+    _listener: asyncio.Task[None] | None
+
+    def __init__(self, redis_client: Redis, max_entries: int, max_staleness_seconds: float) -> None:
+        self._redis_client = redis_client
+        self._max_entries = max_entries
+        self._max_staleness_seconds = max_staleness_seconds
+        self._entries = OrderedDict()
+        self._listener = None
+        self.hits = 0
+        self.misses = 0
+        self.pubsub_updates = 0
+        self._staleness_sum = 0.0
+        self._staleness_max = 0.0
+
+    async def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+
+    async def get(self, user_id: str) -> int:
+        entry = self._entries.get(user_id)
+        now = time.monotonic()
+
+        if entry and entry[0] is not None and now - entry[1] < self._max_staleness_seconds:
+            self.hits += 1
+            staleness = now - entry[1]
+            self._staleness_sum += staleness
+            self._staleness_max = max(self._staleness_max, staleness)
+            self._entries.move_to_end(user_id)
+            return entry[0]
+
+        self.misses += 1
+        return await self.current(user_id)
+
+    async def current(self, user_id: str) -> int:
+        """Lê a época direto do Redis (usado no login e quando a cópia local expirou)."""
+        read_at = time.monotonic()
+        epoch = int(await self._redis_client.get(self._key(user_id)) or 0)
+
+        # Uma invalidação recebida durante a leitura é mais recente que o valor lido
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] <= read_at:
+            self._store(user_id, epoch)
+
+        return epoch
+
+    async def bump(self, user_id: str, *, delete: tuple[str, ...] = ()) -> int:
+        """
+        Invalida todos os access tokens já emitidos para o usuário. As chaves em `delete` são apagadas
+        na mesma transação, e tudo vai ao Redis em uma única ida e volta.
+        """
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            if delete:
+                pipe.delete(*delete)
+            pipe.incr(self._key(user_id))
+            pipe.publish(self.CHANNEL, user_id)
+            results = await pipe.execute()
+
+        epoch = int(results[-2])
+        self._store(user_id, epoch)
+
+        return epoch
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        lookups = self.hits + self.misses
+
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else None,
+            "pubsub_updates": self.pubsub_updates,
+            "listening": self._listener is not None and not self._listener.done(),
+            "max_staleness_seconds": self._max_staleness_seconds,
+            "avg_staleness_on_hit_seconds": self._staleness_sum / self.hits if self.hits else None,
+            "max_staleness_on_hit_seconds": self._staleness_max,
+            "oldest_entry_age_seconds": max((now - read_at for _, read_at in self._entries.values()), default=None),
+        }
+
+    def _key(self, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{user_id}"
+
+    def _store(self, user_id: str, epoch: int | None) -> None:
+        self._entries[user_id] = (epoch, time.monotonic())
+        self._entries.move_to_end(user_id)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub: PubSub = self._redis_client.pubsub()
+            try:
+                await pubsub.subscribe(self.CHANNEL)
+
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+
+                    self._store(str(message["data"]), None)
+                    self.pubsub_updates += 1
+
+            except (RedisError, OSError) as e:
+                # Sem a assinatura, logouts de outras instâncias não chegam: descarta a cópia local
+                logger.error(f"❌ Session epoch subscription lost: {e}")
+                self._entries.clear()
+                await asyncio.sleep(1)
+            finally:
+                with contextlib.suppress(RedisError, OSError):
+                    await pubsub.aclose()
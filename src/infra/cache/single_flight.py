@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight[K: Hashable, V]:
+    """
+    Junta chamadas concorrentes com a mesma chave: só a primeira executa, as demais aguardam o mesmo resultado
+    (ou a mesma exceção). A execução roda em uma task própria, então o cancelamento de quem a iniciou
+    não cancela quem está esperando.
+    """
+
+    _in_flight: dict[K, asyncio.Future[V]]
+
+    def __init__(self) -> None:
+        self._in_flight = {}
+        self.calls = 0
+        self.executions = 0
+
+    async def run(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        self.calls += 1
+
+        future = self._in_flight.get(key)
+        if future is None:
+            self.executions += 1
+            future = asyncio.ensure_future(fn())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return await asyncio.shield(future)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.calls - self.executions,
+            "in_flight": len(self._in_flight),
+        }
@@ -6,8 +6,13 @@ from typing import Any, AsyncGenerator
 from beanie import init_beanie  # type: ignore
 from pymongo import AsyncMongoClient
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.read_concern import ReadConcern
+from pymongo.read_preferences import ReadPreference
 
 from infra.config.logger import logger
+from infra.config.pool_monitoring import MongoPoolMonitor
+from infra.config.query_plans import check_query_plans
+from infra.config.read_routing import ListingReads
 from infra.config.settings import Settings
 from infra.models.mongo.appointment_document import (
     AppointmentDocument,
@@ -19,21 +24,44 @@ from infra.models.mongo.city_document import CityDocument
 from infra.models.mongo.content_document import ContentDocument
 from infra.models.mongo.patient_document import PatientDocument
 from infra.models.mongo.psychologist_document import PsychologistDocument
+from infra.models.mongo.psychologist_search_document import PsychologistSearchDocument
 from infra.models.mongo.specialty_document import SpecialtyDocument
 from infra.models.mongo.state_document import StateDocument
+from infra.repos.mongo.availability_repo import MongoAvailabilityRepo
+from infra.repos.mongo.psychologist_repo import MongoPsychologistRepo
 
 
 class MongoManager:
     _client: AsyncMongoClient[Any]
+    pool_monitor: MongoPoolMonitor
+    listing_reads: ListingReads
 
-    def __init__(self, client: AsyncMongoClient[Any]) -> None:
+    def __init__(
+        self, client: AsyncMongoClient[Any], pool_monitor: MongoPoolMonitor, listing_reads: ListingReads
+    ) -> None:
         self._client = client
+        self.pool_monitor = pool_monitor
+        self.listing_reads = listing_reads
 
     @classmethod
     @asynccontextmanager
     async def connect(cls) -> AsyncGenerator[MongoManager, None]:
         settings = Settings()
-        client = AsyncMongoClient[Any](settings.MONGO_URI, uuidRepresentation="standard")
+        pool_monitor = MongoPoolMonitor()
+        client = AsyncMongoClient[Any](
+            settings.MONGO_URI,
+            uuidRepresentation="standard",
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+            serverSelectionTimeoutMS=settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=settings.MONGO_CONNECT_TIMEOUT_MS,
+            readPreference=settings.MONGO_READ_PREFERENCE,
+            readConcernLevel=settings.MONGO_READ_CONCERN,
+            event_listeners=[pool_monitor],
+            **({"compressors": settings.MONGO_COMPRESSORS} if settings.MONGO_COMPRESSORS else {}),
+        )
 
         await init_beanie(
             database=client[settings.MONGO_DATABASE_NAME],
@@ -42,6 +70,7 @@ class MongoManager:
                 CityDocument,
                 PatientDocument,
                 PsychologistDocument,
+                PsychologistSearchDocument,
                 SpecialtyDocument,
                 ApproachDocument,
                 AvailabilityDocument,
@@ -53,7 +82,21 @@ class MongoManager:
 
         logger.info("✅ Established connection with MongoDB and initialized Beanie")
 
-        manager = cls(client)
+        migrated = await MongoAvailabilityRepo.migrate_embedded_availabilities()
+        if migrated:
+            logger.info(f"📦 Moved embedded availabilities of {migrated} psychologists to availability_slots")
+
+        if await PsychologistSearchDocument.count() == 0:
+            indexed = await MongoPsychologistRepo.rebuild_search_projection()
+            logger.info(f"🔎 Psychologist search projection rebuilt with {indexed} documents")
+
+        if settings.MONGO_CHECK_QUERY_PLANS:
+            await check_query_plans()
+
+        listing_reads = ListingReads(
+            settings.MONGO_LISTING_READ_PREFERENCE, settings.MONGO_LISTING_MAX_STALENESS_SECONDS
+        )
+        manager = cls(client, pool_monitor, listing_reads)
         await manager.seed()
 
         try:
@@ -62,9 +105,19 @@ class MongoManager:
             await client.close()
 
     @asynccontextmanager
-    async def get_session(self) -> AsyncGenerator[AsyncClientSession, None]:
+    async def get_session(self, transactional: bool = True) -> AsyncGenerator[AsyncClientSession, None]:
         assert self._client is not None
 
-        async with self._client.start_session() as session:
-            async with await session.start_transaction():
+        # Consistência causal: as leituras de uma sessão veem as escritas e leituras anteriores dela,
+        # mesmo quando vão para secundários diferentes
+        async with self._client.start_session(causal_consistency=True) as session:
+            if not transactional:
+                # Cada leitura usa a read preference e o read concern do cliente
+                yield session
+                return
+
+            # Transações exigem o primário; o read concern fica o padrão do servidor
+            async with await session.start_transaction(
+                read_concern=ReadConcern(), read_preference=ReadPreference.PRIMARY
+            ):
                 yield session
@@ -0,0 +1,217 @@
+import bisect
+import threading
+import time
+from typing import Any
+
+from pymongo.monitoring import (
+    CommandFailedEvent,
+    CommandListener,
+    CommandStartedEvent,
+    CommandSucceededEvent,
+    ConnectionCheckedInEvent,
+    ConnectionCheckedOutEvent,
+    ConnectionCheckOutFailedEvent,
+    ConnectionCheckOutStartedEvent,
+    ConnectionClosedEvent,
+    ConnectionCreatedEvent,
+    ConnectionPoolListener,
+    ConnectionReadyEvent,
+    PoolClearedEvent,
+    PoolClosedEvent,
+    PoolCreatedEvent,
+    PoolReadyEvent,
+)
+from redis.asyncio import BlockingConnectionPool
+from redis.asyncio.connection import AbstractConnection
+
+# Limites superiores (ms) dos buckets dos histogramas de latência
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class LatencyHistogram:
+    """Histograma de latências com buckets fixos; os percentis são o limite do bucket que os contém."""
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self._count = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def observe(self, duration_ms: float) -> None:
+        self._counts[bisect.bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self._count += 1
+        self._sum_ms += duration_ms
+        self._max_ms = max(self._max_ms, duration_ms)
+
+    def _percentile(self, fraction: float) -> float | None:
+        if not self._count:
+            return None
+
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_MS, self._counts, strict=False):
+            seen += count
+            if seen >= fraction * self._count:
+                return bound
+
+        return self._max_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "count": self._count,
+            "avg_ms": self._sum_ms / self._count if self._count else None,
+            "p50_ms": self._percentile(0.5),
+            "p99_ms": self._percentile(0.99),
+            "max_ms": self._max_ms,
+            "buckets": {
+                **{f"<={bound}": count for bound, count in zip(LATENCY_BUCKETS_MS, self._counts, strict=False)},
+                "+Inf": self._counts[-1],
+            },
+        }
+
+
+class MongoPoolMonitor(ConnectionPoolListener, CommandListener):
+    """
+    Coleta, pelos listeners do pymongo, o estado dos pools de conexão de cada servidor e a latência
+    dos comandos. Os eventos podem chegar de threads do driver, por isso o estado é protegido por um lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pools: dict[str, dict[str, Any]] = {}
+        self._checkout_wait = LatencyHistogram()
+        self._commands: dict[str, LatencyHistogram] = {}
+        self._command_failures: dict[str, int] = {}
+
+    def _pool(self, address: tuple[str, int | None]) -> dict[str, Any]:
+        key = f"{address[0]}:{address[1]}"
+        if key not in self._pools:
+            self._pools[key] = {
+                "open": 0,
+                "checked_out": 0,
+                "wait_queue": 0,
+                "checkout_failures": {},
+                "cleared": 0,
+            }
+        return self._pools[key]
+
+    # Pool
+    def pool_created(self, event: PoolCreatedEvent) -> None:
+        with self._lock:
+            self._pool(event.address)["options"] = {
+                key: value for key, value in event.options.items() if key in ("maxPoolSize", "minPoolSize")
+            }
+
+    def pool_ready(self, event: PoolReadyEvent) -> None: ...
+
+    def pool_cleared(self, event: PoolClearedEvent) -> None:
+        with self._lock:
+            self._pool(event.address)["cleared"] += 1
+
+    def pool_closed(self, event: PoolClosedEvent) -> None:
+        with self._lock:
+            self._pools.pop(f"{event.address[0]}:{event.address[1]}", None)
+
+    # Conexões
+    def connection_created(self, event: ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._pool(event.address)["open"] += 1
+
+    def connection_ready(self, event: ConnectionReadyEvent) -> None: ...
+
+    def connection_closed(self, event: ConnectionClosedEvent) -> None:
+        with self._lock:
+            self._pool(event.address)["open"] -= 1
+
+    def connection_check_out_started(self, event: ConnectionCheckOutStartedEvent) -> None:
+        with self._lock:
+            self._pool(event.address)["wait_queue"] += 1
+
+    def connection_check_out_failed(self, event: ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["wait_queue"] -= 1
+            pool["checkout_failures"][event.reason] = pool["checkout_failures"].get(event.reason, 0) + 1
+
+    def connection_checked_out(self, event: ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            pool = self._pool(event.address)
+            pool["wait_queue"] -= 1
+            pool["checked_out"] += 1
+            if event.duration is not None:
+                self._checkout_wait.observe(event.duration * 1000)
+
+    def connection_checked_in(self, event: ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            self._pool(event.address)["checked_out"] -= 1
+
+    # Comandos
+    def started(self, event: CommandStartedEvent) -> None: ...
+
+    def succeeded(self, event: CommandSucceededEvent) -> None:
+        with self._lock:
+            self._commands.setdefault(event.command_name, LatencyHistogram()).observe(event.duration_micros / 1000)
+
+    def failed(self, event: CommandFailedEvent) -> None:
+        with self._lock:
+            self._commands.setdefault(event.command_name, LatencyHistogram()).observe(event.duration_micros / 1000)
+            self._command_failures[event.command_name] = self._command_failures.get(event.command_name, 0) + 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "pools": {
+                    address: {**pool, "checkout_failures": dict(pool["checkout_failures"])}
+                    for address, pool in self._pools.items()
+                },
+                "checkout_wait": self._checkout_wait.snapshot(),
+                "commands": {name: histogram.snapshot() for name, histogram in self._commands.items()},
+                "command_failures": dict(self._command_failures),
+            }
+
+
+class MonitoredConnectionPool(BlockingConnectionPool):
+    """
+    Pool do Redis que espera por uma conexão livre (até `timeout`) em vez de falhar e registra a fila
+    de espera e quanto tempo cada conexão fica emprestada (a latência de um comando ou pipeline).
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._waiting = 0
+        self._max_waiting = 0
+        self._checked_out_at: dict[int, float] = {}
+        self._checkout_wait = LatencyHistogram()
+        self._command_latency = LatencyHistogram()
+
+    async def get_connection(self, *args: Any, **kwargs: Any) -> AbstractConnection:
+        self._waiting += 1
+        self._max_waiting = max(self._max_waiting, self._waiting)
+        start = time.monotonic()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        finally:
+            self._waiting -= 1
+
+        now = time.monotonic()
+        self._checkout_wait.observe((now - start) * 1000)
+        self._checked_out_at[id(connection)] = now
+        return connection
+
+    async def release(self, connection: AbstractConnection) -> None:
+        checked_out_at = self._checked_out_at.pop(id(connection), None)
+        if checked_out_at is not None:
+            self._command_latency.observe((time.monotonic() - checked_out_at) * 1000)
+
+        await super().release(connection)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_connections": self.max_connections,
+            "open": len(self._in_use_connections) + len(self._available_connections),
+            # Inclui a conexão presa pela assinatura de pub/sub das épocas de sessão
+            "checked_out": len(self._in_use_connections),
+            "wait_queue": self._waiting,
+            "max_wait_queue": self._max_waiting,
+            "checkout_wait": self._checkout_wait.snapshot(),
+            "command_latency": self._command_latency.snapshot(),
+        }
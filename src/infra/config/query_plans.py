@@ -0,0 +1,157 @@
+from datetime import datetime
+from typing import Any, TypedDict
+from uuid import UUID
+
+from beanie import Document
+
+from infra.config.logger import logger
+from infra.models.mongo.appointment_document import AppointmentDocument, PixPaymentDocument
+from infra.models.mongo.availability_document import AvailabilityDocument
+from infra.models.mongo.content_document import ContentDocument
+from infra.models.mongo.psychologist_search_document import PsychologistSearchDocument
+
+# Valores de exemplo: o plano escolhido depende da forma da consulta, não dos valores
+_SAMPLE_ID = UUID(int=0)
+
+
+class QueryPlanException(Exception): ...
+
+
+class QueryShape(TypedDict):
+    name: str
+    document: type[Document]
+    filter: dict[str, Any]
+    sort: list[tuple[str, int]]
+
+
+# Formas de consulta usadas pelos repositórios (filtros + ordenação)
+QUERY_SHAPES: list[QueryShape] = [
+    {
+        "name": "appointments by psychologist",
+        "document": AppointmentDocument,
+        "filter": {"psychologist_id": _SAMPLE_ID},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments by psychologist and status",
+        "document": AppointmentDocument,
+        "filter": {"psychologist_id": _SAMPLE_ID, "status": "scheduled"},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments by patient",
+        "document": AppointmentDocument,
+        "filter": {"patient_id": _SAMPLE_ID},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments by patient and status",
+        "document": AppointmentDocument,
+        "filter": {"patient_id": _SAMPLE_ID, "status": "scheduled"},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments by status",
+        "document": AppointmentDocument,
+        "filter": {"status": "scheduled"},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments by date range",
+        "document": AppointmentDocument,
+        "filter": {"date": {"$gte": datetime(2000, 1, 1), "$lte": datetime(2100, 1, 1)}},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments by availability",
+        "document": AppointmentDocument,
+        "filter": {"availability_id": _SAMPLE_ID},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments listing",
+        "document": AppointmentDocument,
+        "filter": {},
+        "sort": [("date", -1)],
+    },
+    {
+        "name": "appointments by pix payment",
+        "document": AppointmentDocument,
+        "filter": {"pix_payment.$id": {"$in": [_SAMPLE_ID]}, "status": "waiting_for_payment"},
+        "sort": [],
+    },
+    {
+        "name": "expired pix payments",
+        "document": PixPaymentDocument,
+        "filter": {"status": "pending", "expiry_swept_at": None, "expires_at": {"$lt": datetime(2100, 1, 1)}},
+        "sort": [("expires_at", 1), ("_id", 1)],
+    },
+    {
+        "name": "upcoming availabilities of psychologists",
+        "document": AvailabilityDocument,
+        "filter": {"psychologist_id": {"$in": [_SAMPLE_ID]}, "date": {"$gte": datetime(2000, 1, 1)}},
+        "sort": [("date", 1)],
+    },
+    {
+        "name": "contents by author",
+        "document": ContentDocument,
+        "filter": {"author.$id": _SAMPLE_ID},
+        "sort": [("created_at", -1)],
+    },
+    {
+        "name": "contents listing",
+        "document": ContentDocument,
+        "filter": {},
+        "sort": [("created_at", -1)],
+    },
+    {
+        "name": "psychologist search candidates",
+        "document": PsychologistSearchDocument,
+        "filter": {
+            "$or": [
+                {"gender": "female"},
+                {"price": {"$lte": 100}},
+                {"specialty_ids": {"$in": [_SAMPLE_ID]}},
+                {"approach_ids": {"$in": [_SAMPLE_ID]}},
+                {"audiences": {"$in": ["adults"]}},
+            ]
+        },
+        "sort": [],
+    },
+]
+
+
+def _plan_stages(plan: dict[str, Any]) -> list[str]:
+    """Lista os estágios do plano, do mais externo ao mais interno."""
+    stage = plan.get("stage", "?")
+    if plan.get("indexName"):
+        stage = f"{stage}({plan['indexName']})"
+
+    children: list[dict[str, Any]] = []
+    if "inputStage" in plan:
+        children.append(plan["inputStage"])
+    children.extend(plan.get("inputStages", []))
+
+    return [stage, *(child_stage for child in children for child_stage in _plan_stages(child))]
+
+
+async def check_query_plans(shapes: list[QueryShape] = QUERY_SHAPES) -> None:
+    """Roda `explain()` para cada forma de consulta e falha se alguma ainda fizer COLLSCAN."""
+    collscans: list[str] = []
+
+    for shape in shapes:
+        cursor = shape["document"].get_pymongo_collection().find(shape["filter"])
+        if shape["sort"]:
+            cursor = cursor.sort(shape["sort"])
+
+        explain = await cursor.limit(1).explain()
+        winning_plan = explain["queryPlanner"]["winningPlan"]
+        stages = _plan_stages(winning_plan.get("queryPlan", winning_plan))
+
+        logger.info(f"🔍 Query plan [{shape['name']}]: {' <- '.join(stages)}")
+
+        if any(stage.startswith("COLLSCAN") for stage in stages):
+            collscans.append(shape["name"])
+
+    if collscans:
+        raise QueryPlanException(f"Consultas sem índice (COLLSCAN): {', '.join(collscans)}")
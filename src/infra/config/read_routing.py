@@ -0,0 +1,44 @@
+from typing import Any
+
+from beanie import Document
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+
+type ListingReadPreference = Primary | PrimaryPreferred | Secondary | SecondaryPreferred | Nearest
+
+# Modos que aceitam limite de atraso dos secundários (o primário não tem atraso)
+_STALENESS_MODES: dict[str, type[PrimaryPreferred | Secondary | SecondaryPreferred | Nearest]] = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+class ListingReads:
+    """
+    Coleções para as consultas de listagem e busca, com a read preference das listagens
+    (ex.: `secondaryPreferred` com limite de atraso), para distribuir essas leituras entre os secundários.
+
+    Leituras por id e as feitas depois de uma escrita (agendamentos, pagamentos) continuam no primário.
+    Dentro de uma transação o driver usa a read preference da transação, sempre o primário.
+    """
+
+    read_preference: ListingReadPreference
+    _collections: dict[type[Document], AsyncCollection[Any]]
+
+    def __init__(self, read_preference: str, max_staleness_seconds: int = -1) -> None:
+        if read_preference == "primary":
+            self.read_preference = Primary()
+        elif read_preference in _STALENESS_MODES:
+            self.read_preference = _STALENESS_MODES[read_preference](max_staleness=max_staleness_seconds)
+        else:
+            raise ValueError(f"Read preference de listagem inválida: {read_preference}")
+        self._collections = {}
+
+    def collection(self, document: type[Document]) -> AsyncCollection[Any]:
+        if document not in self._collections:
+            self._collections[document] = document.get_pymongo_collection().with_options(
+                read_preference=self.read_preference
+            )
+        return self._collections[document]
@@ -4,6 +4,7 @@ from typing import AsyncGenerator
 import redis.asyncio as redis
 
 from infra.config.logger import logger
+from infra.config.pool_monitoring import MonitoredConnectionPool
 from infra.config.settings import Settings
 
 
@@ -11,12 +12,19 @@ class RedisManager:
     @classmethod
     @asynccontextmanager
     async def connect(cls) -> AsyncGenerator[redis.Redis, None]:
-        client = redis.from_url(  # type: ignore
-            f"redis://{Settings().REDIS_HOST}:{Settings().REDIS_PORT}?decode_responses=True"
+        settings = Settings()
+        pool = MonitoredConnectionPool.from_url(
+            f"redis://{settings.REDIS_HOST}:{settings.REDIS_PORT}",
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
         )
+        # O cliente é dono do pool e o fecha junto
+        client = redis.Redis.from_pool(pool)
         logger.info("✅ Established connection with redis")
 
         try:
             yield client
         finally:
-            await client.close()
+            await client.aclose()
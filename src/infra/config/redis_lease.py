@@ -0,0 +1,58 @@
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from redis.asyncio import Redis
+from redis.asyncio.client import Pipeline
+from redis.exceptions import WatchError
+
+
+class RedisLease:
+    """
+    Lease exclusivo entre réplicas: quem grava a chave com `SET NX PX` é o dono até ela expirar.
+
+    O dono renova o prazo enquanto trabalha; se a réplica morrer, outra assume após `ttl_seconds`.
+    O dono é identificado por um token aleatório, então uma réplica nunca renova nem libera o lease de outra.
+    """
+
+    KEY_PREFIX = "lease"
+
+    _redis_client: Redis
+    _key: str
+    _ttl_ms: int
+    _token: str
+
+    def __init__(self, redis_client: Redis, name: str, ttl_seconds: float) -> None:
+        self._redis_client = redis_client
+        self._key = f"{self.KEY_PREFIX}:{name}"
+        self._ttl_ms = int(ttl_seconds * 1000)
+        self._token = uuid.uuid4().hex
+
+    async def acquire(self) -> bool:
+        """Adquire o lease ou renova o prazo se esta réplica já é a dona. Retorna se ela é a dona."""
+        if await self.renew():
+            return True
+
+        return bool(await self._redis_client.set(self._key, self._token, nx=True, px=self._ttl_ms))
+
+    async def renew(self) -> bool:
+        return await self._if_owner(lambda pipe: pipe.pexpire(self._key, self._ttl_ms))
+
+    async def release(self) -> None:
+        await self._if_owner(lambda pipe: pipe.delete(self._key))
+
+    async def _if_owner(self, command: Callable[[Pipeline], Any]) -> bool:
+        """Aplica o comando só se a chave ainda pertence a esta réplica (compare-and-set com WATCH)."""
+        async with self._redis_client.pipeline(transaction=True) as pipe:
+            try:
+                await pipe.watch(self._key)
+                if await pipe.get(self._key) != self._token:
+                    return False
+
+                pipe.multi()
+                command(pipe)
+                await pipe.execute()
+                return True
+            except WatchError:
+                # A chave mudou entre a leitura e o MULTI: o lease expirou e outra réplica o adquiriu
+                return False
@@ -21,6 +21,27 @@ class Settings(BaseSettings):
 
     MONGO_URI: str = "mongodb://localhost:27017"
     MONGO_DATABASE_NAME: str = "mindhub-dev"
+    # Roda explain() nas consultas dos repositórios ao iniciar e falha se alguma fizer COLLSCAN
+    MONGO_CHECK_QUERY_PLANS: bool = True
+    # Especialidades, abordagens, estados e cidades ficam em memória por este tempo
+    REFERENCE_CACHE_TTL_SECONDS: int = 3600
+    # Pool de conexões do MongoDB (por servidor); sem conexão livre, a requisição espera até o timeout
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_IDLE_TIME_MS: int = 300000
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 5000
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 5000
+    MONGO_CONNECT_TIMEOUT_MS: int = 5000
+    # Compressão do protocolo em ordem de preferência, ex.: "zstd,snappy,zlib"
+    # (zstd e snappy requerem os pacotes zstandard e python-snappy). Vazio desativa.
+    MONGO_COMPRESSORS: str = ""
+    # Leituras fora de transação (rotas ReadOnly); as transações sempre leem do primário
+    MONGO_READ_PREFERENCE: str = "primary"
+    MONGO_READ_CONCERN: str = "local"
+    # Listagens e buscas (psicólogos, pacientes, conteúdos, dados de referência) toleram atraso de replicação
+    MONGO_LISTING_READ_PREFERENCE: str = "secondaryPreferred"
+    # Secundários mais atrasados que isso são ignorados (mínimo 90; -1 desativa o limite)
+    MONGO_LISTING_MAX_STALENESS_SECONDS: int = 90
 
     @property
     def MONGODB_URL(self) -> str:
@@ -45,6 +66,13 @@ class Settings(BaseSettings):
     # REDIS CONFIG
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
+    # Inclui a conexão usada pela assinatura de pub/sub das épocas de sessão
+    REDIS_MAX_CONNECTIONS: int = 50
+    # Tempo de espera por uma conexão livre quando o pool está cheio
+    REDIS_POOL_TIMEOUT_SECONDS: float = 5
+    REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS: float = 5
+    # Cache no Redis das respostas de GETs públicos (psicólogos, conteúdos, especialidades e abordagens)
+    RESPONSE_CACHE_ENABLED: bool = True
 
     # AWS S3 CONFIG
     AWS_ACCESS_KEY_ID: str = "test"
@@ -58,3 +86,24 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_SECRET: str = "accesss_token_secret"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours = 1440 minutes
     REFRESH_TOKEN_EXPIRE_SECONDS: int = 86400
+    # Valida access tokens pela época de sessão em cache local em vez de consultar o Redis a cada requisição
+    AUTH_EPOCH_VALIDATION: bool = True
+    AUTH_EPOCH_CACHE_SIZE: int = 10000
+    # Tempo máximo que uma época em cache é usada sem ser relida (limite da janela de revogação)
+    AUTH_EPOCH_MAX_STALENESS_SECONDS: int = 30
+
+    # BCRYPT CONFIG
+    # Custo das senhas novas; hashes existentes continuam válidos com o custo em que foram gerados
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_WORKERS: int = 4
+    # Verificações de login simultâneas; as demais esperam na fila (deixa workers livres para cadastros)
+    LOGIN_MAX_CONCURRENCY: int = 3
+
+    # EXPIRAÇÃO DE AGENDAMENTOS NÃO PAGOS
+    # Tarefa de fundo que cancela agendamentos com PIX expirado e libera os horários
+    APPOINTMENT_EXPIRY_SWEEPER_ENABLED: bool = True
+    APPOINTMENT_EXPIRY_SWEEP_INTERVAL_SECONDS: float = 30
+    # Pagamentos por transação
+    APPOINTMENT_EXPIRY_BATCH_SIZE: int = 200
+    # Lease no Redis: só uma réplica varre por vez; se ela parar de renovar, outra assume após esse tempo
+    APPOINTMENT_EXPIRY_LEASE_SECONDS: float = 90
@@ -0,0 +1 @@
+"""Benchmarks que rodam contra um MongoDB real (com os seeds aplicados)."""
@@ -0,0 +1,188 @@
+"""
+Compara idas e voltas ao Redis e latência (p50/p99) de login, /me e logout entre o
+DefaultAuthService atual e o formato antigo (uma chave por refresh token, KEYS + GET).
+
+Por padrão usa o fakeredis em memória; com --redis-url usa um servidor real
+(as chaves criadas são apagadas no final).
+
+    uv run python src/infra/database/benchmarks/auth_round_trips.py [--redis-url redis://localhost:6379/15]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+# Adiciona o diretório src ao path para imports
+src_path = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(src_path))
+
+try:
+    import fakeredis
+except ImportError:
+    fakeredis = None  # type: ignore
+
+from redis.asyncio import Redis
+
+from application.services.iauth_service import JWTData
+from infra.cache.session_epochs import SessionEpochCache
+from infra.services.bcrypt_pool import BcryptPool
+from infra.services.default_auth_service import DefaultAuthService
+
+# Tokens ativos por usuário antes de cada medição (sessões em vários dispositivos)
+ACTIVE_SESSIONS = 5
+
+
+class RoundTripCounter:
+    """Conta comandos avulsos e pipelines enviados pelo cliente; cada um é uma ida e volta."""
+
+    def __init__(self, client: Redis) -> None:
+        self.count = 0
+        execute_command = client.execute_command
+        pipeline = client.pipeline
+
+        async def counted_execute_command(*args: Any, **options: Any) -> Any:
+            self.count += 1
+            return await execute_command(*args, **options)
+
+        def counted_pipeline(*args: Any, **kwargs: Any) -> Any:
+            pipe = pipeline(*args, **kwargs)
+            execute = pipe.execute
+
+            async def counted_execute(*args: Any, **kwargs: Any) -> Any:
+                self.count += 1
+                return await execute(*args, **kwargs)
+
+            pipe.execute = counted_execute  # type: ignore
+            return pipe
+
+        client.execute_command = counted_execute_command  # type: ignore
+        client.pipeline = counted_pipeline  # type: ignore
+
+
+class LegacyAuthFlows:
+    """Réplica do armazenamento anterior: `refresh-{token}.activeJwtClients.{user_id}` com SET + EXPIRE."""
+
+    def __init__(self, client: Redis, expire_seconds: int) -> None:
+        self.client = client
+        self.expire_seconds = expire_seconds
+
+    async def login(self, user_id: str) -> None:
+        key = f"refresh-{uuid4().hex}.activeJwtClients.{user_id}"
+        await self.client.set(key, key)
+        await self.client.expire(key, self.expire_seconds)
+
+    async def me(self, user_id: str) -> None:
+        keys = await self.client.keys(f"*activeJwtClients.{user_id}*")  # type: ignore
+        await asyncio.gather(*[self.client.get(key) for key in keys])
+
+    async def logout(self, user_id: str) -> None:
+        keys = await self.client.keys(f"*activeJwtClients.{user_id}*")  # type: ignore
+        if keys:
+            await self.client.delete(*keys)
+
+
+class CurrentAuthFlows:
+    """Os mesmos fluxos pelo DefaultAuthService, como fazem os casos de uso e o AuthMiddleware."""
+
+    def __init__(self, service: DefaultAuthService) -> None:
+        self.service = service
+
+    async def login(self, user_id: str) -> None:
+        epoch = await self.service.session_epochs.current(user_id)
+        await self.service.save_authenticated_user(user_id, uuid4().hex)
+        self.token = JWTData(id=UUID(user_id), user_type="patient", epoch=epoch)
+
+    async def me(self, user_id: str) -> None:
+        await self.service.is_session_active(self.token)
+
+    async def logout(self, user_id: str) -> None:
+        await self.service.de_authenticate_user(user_id)
+
+
+async def measure(
+    counter: RoundTripCounter,
+    prepare: Callable[[str], Awaitable[None]],
+    flow: Callable[[str], Awaitable[None]],
+    iterations: int,
+    user_ids: list[str],
+) -> tuple[float, float, float]:
+    """Devolve (idas e voltas por chamada, p50 em ms, p99 em ms)."""
+    latencies: list[float] = []
+    round_trips = 0
+
+    for _ in range(iterations):
+        user_id = str(uuid4())
+        user_ids.append(user_id)
+        for _ in range(ACTIVE_SESSIONS):
+            await prepare(user_id)
+
+        before = counter.count
+        start = time.perf_counter()
+        await flow(user_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+        round_trips += counter.count - before
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    return round_trips / iterations, percentiles[49], percentiles[98]
+
+
+async def run_benchmark(redis_url: str | None, iterations: int) -> None:
+    if redis_url:
+        client = Redis.from_url(redis_url, decode_responses=True)
+    elif fakeredis is not None:
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    else:
+        print("❌ fakeredis não instalado. Instale-o ou informe --redis-url.")
+        sys.exit(1)
+
+    counter = RoundTripCounter(client)
+    bcrypt_pool = BcryptPool(workers=1, rounds=4, max_concurrent_verifications=1)
+    service = DefaultAuthService(client, SessionEpochCache(client, 10_000, 30), bcrypt_pool)
+
+    user_ids: list[str] = []
+    legacy = LegacyAuthFlows(client, service.token_expire_time)
+    current = CurrentAuthFlows(service)
+
+    try:
+        print("=" * 60)
+        print(f"📊 AUTENTICAÇÃO NO REDIS ({iterations} iterações, {ACTIVE_SESSIONS} sessões por usuário)")
+        print("=" * 60)
+        print(f"  {'fluxo':<22} {'idas/voltas':>11} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+        for name, flows in (("antigo", legacy), ("atual", current)):
+            for flow_name in ("login", "me", "logout"):
+                round_trips, p50, p99 = await measure(
+                    counter, flows.login, getattr(flows, flow_name), iterations, user_ids
+                )
+                print(f"  {name + ' ' + flow_name:<22} {round_trips:>11.1f} {p50:>10.3f} {p99:>10.3f}")
+        print("=" * 60)
+
+    finally:
+        bcrypt_pool.shutdown()
+        if redis_url:
+            # Apaga só as chaves dos usuários criados pelo benchmark
+            for user_id in user_ids:
+                legacy_keys = await client.keys(f"*activeJwtClients.{user_id}")  # type: ignore
+                await client.delete(
+                    *legacy_keys, service._construct_key(user_id), f"{SessionEpochCache.KEY_PREFIX}:{user_id}"
+                )
+        await client.aclose()
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", help="servidor Redis real em vez do fakeredis")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.redis_url, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Compara a publicação de ~10 mil disponibilidades de um psicólogo enviando a lista explícita de horários
+(validação antiga, um horário por vez, e a atual, em lote) e enviando uma regra de recorrência expandida
+no servidor: tamanho do corpo da requisição, tempo de parse, tempo do caso de uso e escritas no banco.
+
+Roda em memória, sem MongoDB: os repositórios apenas registram as escritas que seriam feitas.
+
+    uv run python src/infra/database/benchmarks/availability_publication.py [--iterations 20]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+# Adiciona o diretório src ao path para imports
+src_path = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(src_path))
+
+from pydantic import TypeAdapter
+
+from application.common.exception import ApplicationException
+from application.dtos.availability_recurrence_dto import AvailabilityRecurrenceDTO
+from application.dtos.psychologist_dto import PsychologistDTO
+from application.services.iresponse_cache import IResponseCache
+from application.use_cases.psychologist.add_availabilities import AddAvailabilitiesDTO, AddAvailabilitiesUseCase
+from domain.approach import Approach
+from domain.availability import Availability
+from domain.city import City
+from domain.common.unique_entity_id import UniqueEntityId
+from domain.psychologist import AudienceEnum, Psychologist
+from domain.specialty import Specialty
+from domain.state import State
+from domain.user import GenderEnum
+
+# Todos os dias, das 08:00 às 21:00 (horário de Brasília), por quase dois anos: 9660 horários
+RECURRENCE = {
+    "weekdays": [0, 1, 2, 3, 4, 5, 6],
+    "hours": list(range(8, 22)),
+    "start_date": (date.today() + timedelta(days=1)).isoformat(),
+    "end_date": (date.today() + timedelta(days=690)).isoformat(),
+    "timezone": "America/Sao_Paulo",
+}
+
+
+def new_psychologist() -> Psychologist:
+    state = State(name="São Paulo", abbreviation="SP")
+
+    return Psychologist(
+        name="Psicólogo Benchmark",
+        email="benchmark@mindhub.dev",
+        password="Benchmark@123",
+        cpf="52998224725",
+        phone_number="11987654321",
+        birth_date=datetime(1985, 5, 20),
+        gender=GenderEnum.FEMALE,
+        city=City(name="São Paulo", state=state),
+        crp="06/12345",
+        specialties=[Specialty(name="Ansiedade", description="Descrição", id=None)],
+        approaches=[Approach(name="TCC", description="Descrição", id=None)],
+        audiences=[AudienceEnum.ADULTS],
+        value_per_appointment=150.0,
+    )
+
+
+class PsychologistRepoStub:
+    def __init__(self) -> None:
+        self.psychologist = new_psychologist()
+
+    async def get_by_id(self, id: UniqueEntityId) -> Psychologist:
+        # Um psicólogo sem disponibilidades a cada publicação
+        self.psychologist = new_psychologist()
+        return self.psychologist
+
+
+class AvailabilityRepoStub:
+    """Registra as escritas; o `MongoAvailabilityRepo` envia cada chamada como um único `bulk_write`."""
+
+    def __init__(self) -> None:
+        self.bulk_writes = 0
+        self.operations = 0
+
+    async def create_many(self, psychologist_id: UniqueEntityId, entities: list[Availability]) -> None:
+        if entities:
+            self.bulk_writes += 1
+            self.operations += len(entities)
+
+
+class ResponseCacheStub(IResponseCache):
+    async def invalidate(self, *tags: str) -> None: ...
+
+
+class LegacyPublication:
+    """Validação antiga: regras conferidas horário a horário, com `datetime.now()` em cada iteração."""
+
+    def __init__(self, psychologist_repo: PsychologistRepoStub, availability_repo: AvailabilityRepoStub) -> None:
+        self.psychologist_repo = psychologist_repo
+        self.availability_repo = availability_repo
+
+    async def execute(self, dto: AddAvailabilitiesDTO) -> PsychologistDTO:
+        psychologist = await self.psychologist_repo.get_by_id(UniqueEntityId(dto.psychologist_id))
+
+        availabilities: list[Availability] = []
+        for availability_datetime in dto.availability_datetimes:
+            if availability_datetime < datetime.now(timezone.utc):
+                raise ApplicationException("Não é possível adicionar disponibilidade em uma data passada.")
+            if (
+                availability_datetime.minute != 0
+                or availability_datetime.second != 0
+                or availability_datetime.microsecond != 0
+            ):
+                raise ApplicationException("Disponibilidades devem estar em horas inteiras (ex: 05:00, 14:00).")
+            if not ((5 <= availability_datetime.hour <= 23) or (0 <= availability_datetime.hour <= 2)):
+                raise ApplicationException("Disponibilidades devem estar entre 05:00 e 23:00.")
+
+            availabilities.append(Availability(date=availability_datetime, available=True))
+
+        added = psychologist.add_availabilities(availabilities)
+        await self.availability_repo.create_many(psychologist.id, added)
+
+        return PsychologistDTO.to_dto(psychologist)
+
+
+async def measure(
+    body: bytes,
+    parse: Callable[[bytes], AddAvailabilitiesDTO],
+    execute: Callable[[Any], Awaitable[Any]],
+    iterations: int,
+) -> tuple[float, float]:
+    parse_ms: list[float] = []
+    execute_ms: list[float] = []
+
+    for _ in range(iterations):
+        start = time.perf_counter()
+        dto = parse(body)
+        parsed = time.perf_counter()
+        await execute(dto)
+        executed = time.perf_counter()
+
+        parse_ms.append((parsed - start) * 1000)
+        execute_ms.append((executed - parsed) * 1000)
+
+    return statistics.median(parse_ms), statistics.median(execute_ms)
+
+
+async def run_benchmark(iterations: int) -> None:
+    psychologist_repo = PsychologistRepoStub()
+    availability_repo = AvailabilityRepoStub()
+    use_case = AddAvailabilitiesUseCase(psychologist_repo, availability_repo, ResponseCacheStub())  # type: ignore
+    legacy = LegacyPublication(psychologist_repo, availability_repo)
+    psychologist_id = psychologist_repo.psychologist.id.value
+
+    slots = AvailabilityRecurrenceDTO.model_validate(RECURRENCE).expand()
+    list_body = json.dumps([slot.isoformat() for slot in slots]).encode()
+    recurrence_body = json.dumps(RECURRENCE).encode()
+    datetimes = TypeAdapter(list[datetime])
+
+    def parse_list(body: bytes) -> AddAvailabilitiesDTO:
+        return AddAvailabilitiesDTO(
+            availability_datetimes=datetimes.validate_json(body), psychologist_id=psychologist_id
+        )
+
+    def parse_recurrence(body: bytes) -> AddAvailabilitiesDTO:
+        recurrence = AvailabilityRecurrenceDTO.model_validate_json(body)
+        return AddAvailabilitiesDTO(recurrence=recurrence, psychologist_id=psychologist_id)
+
+    scenarios = (
+        ("lista (antiga)", list_body, parse_list, legacy.execute),
+        ("lista (em lote)", list_body, parse_list, use_case.execute),
+        ("recorrência", recurrence_body, parse_recurrence, use_case.execute),
+    )
+
+    print("=" * 84)
+    print(f"📊 PUBLICAÇÃO DE {len(slots)} DISPONIBILIDADES (mediana de {iterations} execuções)")
+    print("=" * 84)
+    print(f"  {'entrada':<18} {'corpo (KiB)':>12} {'parse (ms)':>11} {'caso de uso (ms)':>17} {'bulk writes':>12}")
+    for name, body, parse, execute in scenarios:
+        availability_repo.bulk_writes = availability_repo.operations = 0
+        parse_ms, execute_ms = await measure(body, parse, execute, iterations)
+        assert availability_repo.operations == len(slots) * iterations
+        print(
+            f"  {name:<18} {len(body) / 1024:>12.1f} {parse_ms:>11.2f} {execute_ms:>17.2f} "
+            f"{availability_repo.bulk_writes / iterations:>12.0f}"
+        )
+    print("=" * 84)
+    print("  O caso de uso inclui a montagem do PsychologistDTO de resposta com todas as disponibilidades.")
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
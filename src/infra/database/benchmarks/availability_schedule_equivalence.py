@@ -0,0 +1,248 @@
+"""
+Confere que o `AvailabilitySchedule` (chaves em segundos epoch ordenadas, com bisect e índice por dict) dentro do
+`Psychologist` se comporta como a implementação anterior, uma lista percorrida a cada operação.
+
+Cada semente gera uma agenda inicial e uma sequência aleatória de inclusões, remoções, agendamentos e consultas
+por janela, com datas em fusos diferentes e com microssegundos, e compara resultados, erros e estado final.
+Termina com código 1 na primeira divergência.
+
+    uv run python src/infra/database/benchmarks/availability_schedule_equivalence.py [--seeds 3000] [--first-seed 0]
+"""
+
+import argparse
+import random
+import sys
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+# Adiciona o diretório src ao path para imports
+src_path = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(src_path))
+
+from domain.approach import Approach
+from domain.availability import Availability
+from domain.city import City
+from domain.common.exception import DomainException
+from domain.common.unique_entity_id import UniqueEntityId
+from domain.psychologist import AudienceEnum, Psychologist
+from domain.specialty import Specialty
+from domain.state import State
+from domain.user import GenderEnum
+
+TIMEZONES = (timezone.utc, timezone(timedelta(hours=-3)), timezone(timedelta(hours=5, minutes=30)), None)
+
+
+class ListAvailabilities:
+    """Implementação anterior das disponibilidades do `Psychologist`: uma lista, percorrida a cada operação."""
+
+    def __init__(self, availabilities: list[Availability] | None) -> None:
+        self.availabilities = availabilities
+
+    def add_availabilities(self, availabilities: list[Availability]) -> list[Availability]:
+        if self.availabilities is None:
+            self.availabilities = []
+
+        existing_datetimes = {availability.normalized_date for availability in self.availabilities}
+        new_availabilities = [
+            availability for availability in availabilities if availability.normalized_date not in existing_datetimes
+        ]
+        self.availabilities.extend(new_availabilities)
+
+        return new_availabilities
+
+    def remove_availabilities(self, availability_datetimes: list[datetime]) -> list[Availability]:
+        if not self.availabilities:
+            raise DomainException("O psicólogo não possui disponibilidades.")
+
+        normalized_datetimes = {Availability.normalize_datetime(dt) for dt in availability_datetimes}
+        removed: list[Availability] = []
+        kept: list[Availability] = []
+        for availability in self.availabilities:
+            if availability.normalized_date in normalized_datetimes and availability.available:
+                removed.append(availability)
+                continue
+            kept.append(availability)
+
+        if not removed:
+            raise DomainException("Nenhuma disponibilidade válida foi encontrada para remoção.")
+
+        self.availabilities = kept
+
+        return removed
+
+    def get_availability_by_date(self, availability_date: datetime) -> UniqueEntityId:
+        if not self.availabilities:
+            raise DomainException("O psicólogo não possui disponibilidades.")
+
+        availability = next(
+            (availability for availability in self.availabilities if availability.is_date_equals_to(availability_date)),
+            None,
+        )
+        if not availability:
+            raise DomainException("Nenhuma disponibilidade encontrada para a data informada.")
+
+        availability.schedule()
+
+        return availability.id
+
+    def get_availabilities_between(
+        self, start: datetime | None, end: datetime | None, only_available: bool
+    ) -> list[Availability]:
+        low = Availability.key_of(start) if start is not None else None
+        high = Availability.key_of(end) if end is not None else None
+
+        return sorted(
+            (
+                availability
+                for availability in self.availabilities or []
+                if (low is None or availability.key >= low)
+                and (high is None or availability.key <= high)
+                and (availability.available or not only_available)
+            ),
+            key=lambda availability: availability.key,
+        )
+
+
+def new_psychologist(availabilities: list[Availability] | None) -> Psychologist:
+    state = State(name="São Paulo", abbreviation="SP")
+
+    return Psychologist(
+        name="Psicólogo Verificação",
+        email="verificacao@mindhub.dev",
+        password="Verificacao@123",
+        cpf="52998224725",
+        phone_number="11987654321",
+        birth_date=datetime(1985, 5, 20),
+        gender=GenderEnum.FEMALE,
+        city=City(name="São Paulo", state=state),
+        crp="06/12345",
+        specialties=[Specialty(name="Ansiedade", description="Descrição", id=None)],
+        approaches=[Approach(name="TCC", description="Descrição", id=None)],
+        audiences=[AudienceEnum.ADULTS],
+        value_per_appointment=150.0,
+        availabilities=availabilities,
+    )
+
+
+def outcome(operation: Callable[[], Any]) -> Any:
+    """Resultado da operação ou a mensagem da `DomainException` que ela levantou."""
+    try:
+        return operation()
+    except DomainException as e:
+        return f"DomainException: {e}"
+
+
+def snapshot(availabilities: list[Availability] | None) -> list[tuple[int, bool]]:
+    return sorted((availability.key, availability.available) for availability in availabilities or [])
+
+
+class Scenario:
+    def __init__(self, seed: int, base: datetime) -> None:
+        self.random = random.Random(seed)
+        self.base = base
+
+    def datetime(self) -> datetime:
+        dt = self.base + timedelta(hours=self.random.randrange(200), microseconds=self.random.choice((0, 0, 123)))
+        tz = self.random.choice(TIMEZONES)
+
+        return dt.replace(tzinfo=None) if tz is None else dt.astimezone(tz)
+
+    def size(self) -> int:
+        # Lotes grandes de vez em quando, para passar pelos caminhos de reconstrução do índice
+        return self.random.randrange(0, 100 if self.random.random() < 0.2 else 8)
+
+    def distinct_datetimes(self, count: int) -> list[datetime]:
+        by_key: dict[int, datetime] = {}
+        for _ in range(count):
+            dt = self.datetime()
+            by_key.setdefault(Availability.key_of(dt), dt)
+
+        return list(by_key.values())
+
+
+def check_seed(seed: int, base: datetime) -> str | None:
+    """Roda o cenário da semente nas duas implementações. Retorna a primeira divergência ou None."""
+    scenario = Scenario(seed, base)
+    initial = [
+        (dt, scenario.random.random() < 0.8) for dt in scenario.distinct_datetimes(scenario.random.randrange(40))
+    ]
+
+    current = new_psychologist([Availability(dt, available) for dt, available in initial] or None)
+    reference = ListAvailabilities([Availability(dt, available) for dt, available in initial] or None)
+
+    for step in range(scenario.random.randrange(1, 15)):
+        operation = scenario.random.randrange(4)
+
+        if operation == 0:
+            dts = scenario.distinct_datetimes(scenario.size())
+            got = [a.key for a in current.add_availabilities([Availability(dt) for dt in dts])]
+            expected = [a.key for a in reference.add_availabilities([Availability(dt) for dt in dts])]
+            name = "add_availabilities"
+        elif operation == 1:
+            dts = [scenario.datetime() for _ in range(scenario.size())]
+            got = outcome(lambda dts=dts: sorted(a.key for a in current.remove_availabilities(dts)))
+            expected = outcome(lambda dts=dts: sorted(a.key for a in reference.remove_availabilities(dts)))
+            name = "remove_availabilities"
+        elif operation == 2:
+            dt = scenario.datetime()
+            got = outcome(lambda dt=dt: isinstance(current.get_availability_by_date(dt), UniqueEntityId))
+            expected = outcome(lambda dt=dt: isinstance(reference.get_availability_by_date(dt), UniqueEntityId))
+            name = "get_availability_by_date"
+        else:
+            start, end = sorted((scenario.datetime(), scenario.datetime()), key=Availability.key_of)
+            start = None if scenario.random.random() < 0.1 else start
+            end = None if scenario.random.random() < 0.1 else end
+            only_available = scenario.random.random() < 0.5
+            got = [a.key for a in current.get_availabilities_between(start, end, only_available)]
+            expected = [a.key for a in reference.get_availabilities_between(start, end, only_available)]
+            name = "get_availabilities_between"
+
+        if got != expected:
+            return f"semente {seed}, passo {step} ({name}): {got!r} != {expected!r}"
+
+        if snapshot(current.availabilities) != snapshot(reference.availabilities):
+            return f"semente {seed}, passo {step} ({name}): estado final diverge"
+
+        keys = [availability.key for availability in current.availabilities or []]
+        if keys != sorted(set(keys)):
+            return f"semente {seed}, passo {step} ({name}): disponibilidades fora de ordem ou repetidas"
+
+    return None
+
+
+def check_batch_dedupe(base: datetime) -> str | None:
+    """Diferença intencional: datas repetidas no mesmo lote são incluídas uma vez só (a primeira)."""
+    psychologist = new_psychologist(None)
+    added = psychologist.add_availabilities([Availability(base), Availability(base.astimezone(TIMEZONES[1]))])
+
+    return None if len(added) == 1 else f"lote com data repetida incluiu {len(added)} disponibilidades"
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seeds", type=int, default=3000)
+    parser.add_argument("--first-seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Datas futuras: agendar exige que o horário não tenha passado
+    base = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+
+    for seed in range(args.first_seed, args.first_seed + args.seeds):
+        divergence = check_seed(seed, base)
+        if divergence:
+            print(f"❌ {divergence}")
+            sys.exit(1)
+
+    divergence = check_batch_dedupe(base)
+    if divergence:
+        print(f"❌ {divergence}")
+        sys.exit(1)
+
+    print(f"✅ {args.seeds} sementes: AvailabilitySchedule equivalente à implementação em lista")
+
+
+if __name__ == "__main__":
+    main()
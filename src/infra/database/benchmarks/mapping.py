@@ -0,0 +1,287 @@
+"""
+Compara o custo de CPU e as tasks criadas no mapeamento documento -> entidade da listagem de psicólogos
+entre o caminho atual (mappers síncronos, tabelas de referência conferidas uma vez por página, e-mail, CPF,
+telefone e CRP gravados sem nova validação) e o antigo (mappers assíncronos, uma corrotina por linha com
+asyncio.gather e value objects validados a cada leitura).
+
+Roda em memória, sem MongoDB: os documentos são montados com `model_construct` (sem `init_beanie`).
+
+    uv run python src/infra/database/benchmarks/mapping.py [--psychologists 10000] [--page-size 20] [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+# Adiciona o diretório src ao path para imports
+src_path = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(src_path))
+
+from beanie import Link
+from bson import DBRef
+
+from domain.approach import Approach
+from domain.availability import Availability
+from domain.city import City
+from domain.common.unique_entity_id import UniqueEntityId
+from domain.psychologist import AudienceEnum, Psychologist
+from domain.specialty import Specialty
+from domain.state import State
+from domain.value_objects.cpf import CPF
+from domain.value_objects.crp import CRP
+from domain.value_objects.email import Email
+from domain.value_objects.password import Password
+from domain.value_objects.phone_number import PhoneNumber
+from infra.cache.read_coalescing import ReadCoalescer
+from infra.cache.reference_cache import ReferenceCache, ReferenceTable
+from infra.config.read_routing import ListingReads
+from infra.mappers.mongo.availability_mapper import AvailabilityMongoMapper
+from infra.models.mongo.approach_document import ApproachDocument
+from infra.models.mongo.availability_document import AvailabilityDocument
+from infra.models.mongo.city_document import CityDocument
+from infra.models.mongo.psychologist_document import PsychologistDocument
+from infra.models.mongo.specialty_document import SpecialtyDocument
+from infra.repos.mongo.psychologist_repo import MongoPsychologistRepo
+
+SPECIALTIES_PER_PSYCHOLOGIST = 3
+APPROACHES_PER_PSYCHOLOGIST = 2
+AVAILABILITIES_PER_PSYCHOLOGIST = 8
+
+type Page = tuple[list[PsychologistDocument], dict[UUID, list[AvailabilityDocument]]]
+
+
+def build_reference_cache() -> ReferenceCache:
+    """Cache de referência com tabelas carregadas de listas em memória."""
+    state = State(name="São Paulo", abbreviation="SP")
+    cities = [City(name=f"Cidade {i}", state=state) for i in range(50)]
+    specialties = [Specialty(name=f"Especialidade {i}", description="Descrição", id=None) for i in range(20)]
+    approaches = [Approach(name=f"Abordagem {i}", description="Descrição", id=None) for i in range(10)]
+
+    def loader[E](entities: list[E]) -> Callable[[], Awaitable[list[E]]]:
+        async def load() -> list[E]:
+            return entities
+
+        return load
+
+    async def fetch_none(ids: list[UUID], session: Any) -> list[Any]:
+        return []
+
+    reference_cache = ReferenceCache(ttl_seconds=3600)
+    reference_cache.states = ReferenceTable(loader([state]), fetch_none, 3600)
+    reference_cache.cities = ReferenceTable(loader(cities), fetch_none, 3600)
+    reference_cache.specialties = ReferenceTable(loader(specialties), fetch_none, 3600)
+    reference_cache.approaches = ReferenceTable(loader(approaches), fetch_none, 3600)
+
+    return reference_cache
+
+
+async def build_pages(reference_cache: ReferenceCache, psychologists: int, page_size: int) -> list[Page]:
+    cities = await reference_cache.cities.get_all()
+    specialties = await reference_cache.specialties.get_all()
+    approaches = await reference_cache.approaches.get_all()
+    start = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+    docs: list[PsychologistDocument] = []
+    availabilities: dict[UUID, list[AvailabilityDocument]] = {}
+    for i in range(psychologists):
+        id = uuid4()
+        city = cities[i % len(cities)]
+        docs.append(
+            PsychologistDocument.model_construct(
+                id=id,
+                name=f"Psicólogo {i}",
+                email=f"psicologo{i}@mindhub.com",
+                password_hash="$2b$12$hash",
+                cpf="52998224725",
+                phone_number="11987654321",
+                birth_date="1985-05-20",
+                gender="female",
+                city=Link(DBRef("cities", city.id.value), CityDocument),
+                profile_picture=None,
+                crp="06/12345",
+                description="Atendimento online e presencial.",
+                specialties=[
+                    Link(DBRef("specialties", specialty.id.value), SpecialtyDocument)
+                    for specialty in specialties[i % 7 : i % 7 + SPECIALTIES_PER_PSYCHOLOGIST]
+                ],
+                approaches=[
+                    Link(DBRef("approaches", approach.id.value), ApproachDocument)
+                    for approach in approaches[i % 5 : i % 5 + APPROACHES_PER_PSYCHOLOGIST]
+                ],
+                audiences=[AudienceEnum.ADULTS.value, AudienceEnum.ELDERLY.value],
+                value_per_appointment=150.0,
+            )
+        )
+        availabilities[id] = [
+            AvailabilityDocument.model_construct(
+                id=uuid4(), psychologist_id=id, date=start + timedelta(hours=hour), available=True
+            )
+            for hour in range(AVAILABILITIES_PER_PSYCHOLOGIST)
+        ]
+
+    return [
+        (
+            docs[offset : offset + page_size],
+            {doc.id: availabilities[doc.id] for doc in docs[offset : offset + page_size]},
+        )
+        for offset in range(0, len(docs), page_size)
+    ]
+
+
+class LegacyMapping:
+    """Caminho anterior: mappers `async` aninhados e `asyncio.gather` com uma corrotina por psicólogo."""
+
+    def __init__(self, reference_cache: ReferenceCache) -> None:
+        self.reference_cache = reference_cache
+
+    async def map_page(self, page: Page) -> list[Psychologist]:
+        docs, availabilities = page
+        return await asyncio.gather(*(self._to_domain(doc, availabilities.get(doc.id)) for doc in docs))
+
+    async def _to_domain(self, doc: PsychologistDocument, availabilities: list[AvailabilityDocument] | None) -> Any:
+        city = await self.reference_cache.cities.get_by_id(UniqueEntityId(doc.city.ref.id))  # type: ignore
+        specialties = await self.reference_cache.specialties.get_by_ids(
+            [UniqueEntityId(link.ref.id) for link in doc.specialties]  # type: ignore
+        )
+        approaches = await self.reference_cache.approaches.get_by_ids(
+            [UniqueEntityId(link.ref.id) for link in doc.approaches]  # type: ignore
+        )
+
+        return await self._psychologist_to_domain(doc, availabilities, city, specialties, approaches)
+
+    @staticmethod
+    async def _availability_to_domain(doc: AvailabilityDocument) -> Availability:
+        return AvailabilityMongoMapper.to_domain(doc)
+
+    async def _psychologist_to_domain(
+        self,
+        model: PsychologistDocument,
+        availabilities: list[AvailabilityDocument] | None,
+        city: City | None,
+        specialties: list[Specialty],
+        approaches: list[Approach],
+    ) -> Psychologist:
+        domain_availabilities: list[Availability] | None = None
+        if availabilities:
+            domain_availabilities = [await self._availability_to_domain(doc) for doc in availabilities]
+
+        return Psychologist(
+            name=model.name,
+            email=Email(value=model.email),
+            password=Password(value=model.password_hash, hashed=True),
+            cpf=CPF(value=model.cpf),
+            phone_number=PhoneNumber(value=model.phone_number),
+            birth_date=datetime.fromisoformat(model.birth_date),
+            gender=model.gender,
+            city=city,  # type: ignore
+            crp=CRP(value=model.crp),
+            description=model.description,
+            specialties=specialties,
+            approaches=approaches,
+            audiences=[AudienceEnum(audience) for audience in model.audiences],
+            value_per_appointment=model.value_per_appointment,
+            availabilities=domain_availabilities,
+            profile_picture=model.profile_picture,
+            id=UniqueEntityId(model.id),
+        )
+
+
+class CurrentMapping:
+    """Caminho atual do `MongoPsychologistRepo`."""
+
+    def __init__(self, reference_cache: ReferenceCache) -> None:
+        # Sem sessão: o mapeamento não consulta o banco quando as referências estão no cache
+        self.repo = MongoPsychologistRepo(None, reference_cache, ListingReads("primary"), ReadCoalescer())  # type: ignore
+
+    async def map_page(self, page: Page) -> list[Psychologist]:
+        docs, availabilities = page
+        return await self.repo._to_domain(docs, availabilities)
+
+
+async def measure(map_page: Callable[[Page], Awaitable[list[Psychologist]]], pages: list[Page]) -> dict[str, float]:
+    # Aquecimento: carrega as tabelas de referência
+    await map_page(pages[0])
+
+    latencies: list[float] = []
+    cpu_start = time.process_time()
+    for page in pages:
+        start = time.perf_counter()
+        await map_page(page)
+        latencies.append((time.perf_counter() - start) * 1000)
+    cpu_ms = (time.process_time() - cpu_start) * 1000
+
+    # As entidades retidas são as mesmas nos dois caminhos; a diferença está nos objetos de vida curta
+    # (corrotinas, tasks e futures), que o tracemalloc não mede bem porque voltam às freelists.
+    # Conta as tasks criadas em uma segunda passada
+    loop = asyncio.get_running_loop()
+    tasks = 0
+
+    def counting_task_factory(loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any) -> asyncio.Task[Any]:
+        nonlocal tasks
+        tasks += 1
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    loop.set_task_factory(counting_task_factory)
+    try:
+        for page in pages:
+            await map_page(page)
+    finally:
+        loop.set_task_factory(None)
+
+    return {
+        "cpu_ms_per_page": cpu_ms / len(pages),
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": statistics.quantiles(latencies, n=100)[98],
+        "tasks_per_page": tasks / len(pages),
+    }
+
+
+async def run_benchmark(psychologists: int, page_size: int, rounds: int) -> None:
+    reference_cache = build_reference_cache()
+    pages = await build_pages(reference_cache, psychologists, page_size)
+    mappings = (("antigo", LegacyMapping(reference_cache)), ("atual", CurrentMapping(reference_cache)))
+
+    # Rodadas alternadas entre os caminhos, para que ruído da máquina (frequência, outros processos) afete os dois
+    results: dict[str, list[dict[str, float]]] = {name: [] for name, _ in mappings}
+    for _ in range(rounds):
+        for name, mapping in mappings:
+            results[name].append(await measure(mapping.map_page, pages))
+
+    def spread(name: str, metric: str) -> str:
+        values = [result[metric] for result in results[name]]
+        stdev = statistics.stdev(values) if len(values) > 1 else 0.0
+        return f"{statistics.mean(values):.3f} ± {stdev:.3f}"
+
+    print("=" * 84)
+    print(f"📊 MAPEAMENTO DA LISTAGEM ({psychologists} psicólogos, páginas de {page_size}, {rounds} rodadas)")
+    print("=" * 84)
+    print(f"  {'caminho':<10} {'CPU/página (ms)':>18} {'p50 (ms)':>18} {'p99 (ms)':>18} {'tasks/página':>13}")
+    for name, _ in mappings:
+        print(
+            f"  {name:<10} {spread(name, 'cpu_ms_per_page'):>18} {spread(name, 'p50_ms'):>18} "
+            f"{spread(name, 'p99_ms'):>18} {results[name][0]['tasks_per_page']:>13.1f}"
+        )
+    print("=" * 84)
+    print("  Média ± desvio padrão entre as rodadas.")
+
+
+def main():
+    """Função principal."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--psychologists", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.psychologists, args.page_size, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
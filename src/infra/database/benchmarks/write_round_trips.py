@@ -0,0 +1,274 @@
+"""
+Conta quantos comandos cada caso de escrita envia ao MongoDB.
+
+Cada cenário roda dentro de uma transação que é abortada no final, então o banco
+não é alterado. Requer os seeds aplicados (usa um psicólogo existente como modelo).
+
+    uv run python src/infra/database/benchmarks/write_round_trips.py
+"""
+
+import asyncio
+import random
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+# Adiciona o diretório src ao path para imports
+src_path = Path(__file__).parent.parent.parent.parent
+sys.path.insert(0, str(src_path))
+
+from beanie import init_beanie
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.monitoring import CommandFailedEvent, CommandListener, CommandStartedEvent, CommandSucceededEvent
+
+from domain.appointment import Appointment
+from domain.common.unique_entity_id import UniqueEntityId
+from domain.content import Content
+from domain.patient import Patient
+from domain.pix_payment import PixPayment
+from domain.psychologist import Psychologist
+from infra.cache.read_coalescing import ReadCoalescer
+from infra.cache.reference_cache import ReferenceCache
+from infra.config.read_routing import ListingReads
+from infra.config.settings import Settings
+from infra.models.mongo.appointment_document import AppointmentDocument, PixPaymentDocument
+from infra.models.mongo.approach_document import ApproachDocument
+from infra.models.mongo.availability_document import AvailabilityDocument
+from infra.models.mongo.city_document import CityDocument
+from infra.models.mongo.content_document import ContentDocument
+from infra.models.mongo.patient_document import PatientDocument
+from infra.models.mongo.psychologist_document import PsychologistDocument
+from infra.models.mongo.psychologist_search_document import PsychologistSearchDocument
+from infra.models.mongo.specialty_document import SpecialtyDocument
+from infra.models.mongo.state_document import StateDocument
+from infra.repos.mongo.appointment_repo import MongoAppointmentRepo
+from infra.repos.mongo.content_repo import MongoContentRepo
+from infra.repos.mongo.patient_repo import MongoPatientRepo
+from infra.repos.mongo.psychologist_repo import MongoPsychologistRepo
+
+# Comandos do próprio driver, que não são ida e volta da aplicação
+IGNORED_COMMANDS = {"hello", "ismaster", "isMaster", "ping", "endSessions", "abortTransaction", "commitTransaction"}
+
+
+class CommandCounter(CommandListener):
+    """Registra os comandos enviados ao servidor enquanto está gravando."""
+
+    def __init__(self) -> None:
+        self.recording = False
+        self.commands: list[str] = []
+
+    def started(self, event: CommandStartedEvent) -> None:
+        if self.recording and event.command_name not in IGNORED_COMMANDS:
+            self.commands.append(f"{event.command_name}({event.command.get(event.command_name)})")
+
+    def succeeded(self, event: CommandSucceededEvent) -> None: ...
+
+    def failed(self, event: CommandFailedEvent) -> None: ...
+
+
+def random_cpf() -> str:
+    """Gera um CPF com dígitos verificadores válidos."""
+    digits = [random.randint(0, 9) for _ in range(9)]
+    for length in (9, 10):
+        total = sum(digit * (length + 1 - i) for i, digit in enumerate(digits))
+        digits.append((total * 10) % 11 % 10)
+
+    return "".join(map(str, digits))
+
+
+def copy_psychologist(template: Psychologist) -> Psychologist:
+    return Psychologist(
+        name=template.name,
+        email=f"bench-{uuid4().hex[:12]}@mindhub.dev",
+        password=template.password,
+        cpf=random_cpf(),
+        phone_number=template.phone_number,
+        birth_date=template.birth_date,
+        gender=template.gender,
+        city=template.city,
+        crp=f"99/{random.randint(10000, 99999)}",
+        specialties=template.specialties,
+        approaches=template.approaches,
+        audiences=template.audiences,
+        value_per_appointment=template.value_per_appointment,
+        description=template.description,
+    )
+
+
+def new_patient(template: Psychologist) -> Patient:
+    return Patient(
+        name="Paciente Benchmark",
+        email=f"bench-{uuid4().hex[:12]}@mindhub.dev",
+        password=template.password,
+        cpf=random_cpf(),
+        phone_number=template.phone_number,
+        birth_date=template.birth_date,
+        gender=template.gender,
+        city=template.city,
+    )
+
+
+def new_appointment(psychologist: Psychologist, patient: Patient) -> Appointment:
+    date = datetime.now(timezone.utc) + timedelta(days=7)
+    pix_payment = PixPayment(
+        amount=psychologist.value_per_appointment,
+        provider_payment_id=uuid4().hex,
+        pix_payload="00020126benchmark",
+        expires_at=date,
+    )
+
+    return Appointment(
+        date=date,
+        patient_id=patient.id,
+        psychologist_id=psychologist.id,
+        value=psychologist.value_per_appointment,
+        pix_payment=pix_payment,
+    )
+
+
+async def measure(
+    client: AsyncMongoClient[Any],
+    counter: CommandCounter,
+    scenario: Callable[[AsyncClientSession], Awaitable[Callable[[], Awaitable[Any]]]],
+) -> list[str]:
+    """Prepara o cenário sem contar e conta apenas a chamada ao repositório que ele devolve."""
+    async with client.start_session() as session:
+        await session.start_transaction()
+        try:
+            write = await scenario(session)
+
+            counter.commands = []
+            counter.recording = True
+            await write()
+            counter.recording = False
+
+            return counter.commands
+        finally:
+            counter.recording = False
+            await session.abort_transaction()
+
+
+async def run_benchmark() -> None:
+    settings = Settings()
+    counter = CommandCounter()
+    client = AsyncMongoClient[Any](settings.MONGO_URI, uuidRepresentation="standard", event_listeners=[counter])
+
+    await init_beanie(
+        database=client[settings.MONGO_DATABASE_NAME],
+        document_models=[
+            StateDocument,
+            CityDocument,
+            PatientDocument,
+            PsychologistDocument,
+            PsychologistSearchDocument,
+            SpecialtyDocument,
+            ApproachDocument,
+            AvailabilityDocument,
+            PixPaymentDocument,
+            AppointmentDocument,
+            ContentDocument,
+        ],
+    )
+
+    listing_reads = ListingReads("primary")
+    reference_cache = ReferenceCache(ttl_seconds=settings.REFERENCE_CACHE_TTL_SECONDS)
+    read_coalescer = ReadCoalescer()
+
+    try:
+        seeded = await PsychologistDocument.find_one({})
+        if not seeded:
+            print("❌ Nenhum psicólogo encontrado. Rode os seeds antes do benchmark.")
+            sys.exit(1)
+
+        async with client.start_session() as session:
+            template = await MongoPsychologistRepo(session, reference_cache, listing_reads, read_coalescer).get_by_id(
+                UniqueEntityId(seeded.id)
+            )
+        assert template is not None
+
+        async def create_psychologist(session: AsyncClientSession):
+            psychologist = copy_psychologist(template)
+            return lambda: MongoPsychologistRepo(session, reference_cache, listing_reads, read_coalescer).create(
+                psychologist
+            )
+
+        async def update_psychologist_description(session: AsyncClientSession):
+            repo = MongoPsychologistRepo(session, reference_cache, listing_reads, read_coalescer)
+            psychologist = await repo.create(copy_psychologist(template))
+            psychologist.description = "Descrição atualizada pelo benchmark"
+            return lambda: repo.update(psychologist)
+
+        async def update_psychologist_price(session: AsyncClientSession):
+            repo = MongoPsychologistRepo(session, reference_cache, listing_reads, read_coalescer)
+            psychologist = await repo.create(copy_psychologist(template))
+            psychologist.value_per_appointment = template.value_per_appointment + 10
+            return lambda: repo.update(psychologist)
+
+        async def create_patient(session: AsyncClientSession):
+            patient = new_patient(template)
+            return lambda: MongoPatientRepo(session, reference_cache, listing_reads).create(patient)
+
+        async def update_patient_phone(session: AsyncClientSession):
+            repo = MongoPatientRepo(session, reference_cache, listing_reads)
+            patient = await repo.create(new_patient(template))
+            patient.phone_number = template.phone_number
+            return lambda: repo.update(patient)
+
+        async def create_content(session: AsyncClientSession):
+            content = Content(title="Benchmark", body="Conteúdo de benchmark", author_id=template.id)
+            return lambda: MongoContentRepo(session, listing_reads, read_coalescer).create(content)
+
+        async def update_content(session: AsyncClientSession):
+            repo = MongoContentRepo(session, listing_reads, read_coalescer)
+            content = await repo.create(Content(title="Benchmark", body="Conteúdo", author_id=template.id))
+            content.update(title="Benchmark atualizado")
+            return lambda: repo.update(content)
+
+        async def create_appointment(session: AsyncClientSession):
+            patient = await MongoPatientRepo(session, reference_cache, listing_reads).create(new_patient(template))
+            appointment = new_appointment(template, patient)
+            return lambda: MongoAppointmentRepo(session).create(appointment)
+
+        async def confirm_appointment(session: AsyncClientSession):
+            repo = MongoAppointmentRepo(session)
+            patient = await MongoPatientRepo(session, reference_cache, listing_reads).create(new_patient(template))
+            appointment = await repo.create(new_appointment(template, patient))
+            appointment.mark_payment_sent()
+            appointment.confirm()
+            return lambda: repo.update(appointment)
+
+        scenarios = {
+            "create psychologist": create_psychologist,
+            "update psychologist (description)": update_psychologist_description,
+            "update psychologist (price)": update_psychologist_price,
+            "create patient": create_patient,
+            "update patient (phone)": update_patient_phone,
+            "create content": create_content,
+            "update content": update_content,
+            "create appointment": create_appointment,
+            "confirm appointment payment": confirm_appointment,
+        }
+
+        print("=" * 60)
+        print("📊 IDAS E VOLTAS AO MONGODB POR CASO DE ESCRITA")
+        print("=" * 60)
+        for name, scenario in scenarios.items():
+            commands = await measure(client, counter, scenario)
+            print(f"  • {name:<36} {len(commands):>2}  {', '.join(commands)}")
+        print("=" * 60)
+
+    finally:
+        await client.close()
+
+
+def main():
+    """Função principal."""
+    asyncio.run(run_benchmark())
+
+
+if __name__ == "__main__":
+    main()
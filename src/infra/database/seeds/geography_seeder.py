@@ -2,6 +2,10 @@
 
 import asyncio
 
+from redis.exceptions import RedisError
+
+from infra.cache.geography_snapshot import GeographySnapshotStore
+from infra.config.redis import RedisManager
 from infra.models.mongo.city_document import CityDocument
 from infra.models.mongo.state_document import StateDocument
 from infra.services.ibge_service import IBGEService
@@ -80,6 +84,7 @@ async def seed_geography() -> tuple[dict[str, StateDocument], dict[tuple[str, st
                     print(f"    💾 {cities_count} cidades salvas...")
 
         print(f"\n✨ Seed de geografia concluído! Total: {len(states_map)} estados e {len(cities_map)} cidades.\n")
+        await notify_geography_changed()
         return states_map, cities_map
 
     except Exception as e:
@@ -90,6 +95,17 @@ async def seed_geography() -> tuple[dict[str, StateDocument], dict[tuple[str, st
         await ibge_service.close()
 
 
+async def notify_geography_changed() -> None:
+    """Avisa as instâncias da API em execução para recarregarem estados e cidades e refazerem o snapshot."""
+    try:
+        async with RedisManager.connect() as redis_client:
+            instances = await GeographySnapshotStore.request_rebuild(redis_client)
+        print(f"   📣 Snapshot de geografia refeito em {instances} instância(s) da API\n")
+    except (RedisError, OSError) as e:
+        # Sem o aviso, as instâncias pegam os dados novos na próxima recarga do cache de referência
+        print(f"   ⚠️  Não foi possível avisar a API para refazer o snapshot de geografia: {e}\n")
+
+
 if __name__ == "__main__":
     # Para executar standalone (necessário inicializar beanie antes)
     asyncio.run(seed_geography())
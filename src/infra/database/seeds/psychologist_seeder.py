@@ -1,7 +1,7 @@
 """Seeder para psicólogos com disponibilidades dinâmicas."""
 
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 try:
     import bcrypt
@@ -16,11 +16,14 @@ from infra.models.mongo.psychologist_document import PsychologistDocument
 from infra.models.mongo.specialty_document import SpecialtyDocument
 
 
-def generate_availabilities(start_date: datetime, num_days: int = 14) -> list[AvailabilityDocument]:
+def generate_availabilities(
+    psychologist_id: UUID, start_date: datetime, num_days: int = 14
+) -> list[AvailabilityDocument]:
     """
     Gera disponibilidades para os próximos N dias.
 
     Args:
+        psychologist_id: Id do psicólogo dono dos horários
         start_date: Data de início (geralmente amanhã)
         num_days: Número de dias para gerar disponibilidades (padrão: 14 dias / 2 semanas)
 
@@ -44,6 +47,7 @@ def generate_availabilities(start_date: datetime, num_days: int = 14) -> list[Av
 
             availability = AvailabilityDocument(
                 id=uuid4(),
+                psychologist_id=psychologist_id,
                 date=availability_datetime,
                 available=True,
             )
@@ -109,9 +113,6 @@ async def seed_psychologists(
             if approach:
                 approaches.append(approach)
 
-        # Gera disponibilidades para as próximas 2 semanas
-        availabilities = generate_availabilities(tomorrow, num_days=14)
-
         # Cria o psicólogo
         psychologist = PsychologistDocument(
             id=uuid4(),
@@ -129,11 +130,14 @@ async def seed_psychologists(
             specialties=specialties,
             approaches=approaches,
             audiences=psych_data["audiences"],
-            availabilities=availabilities,
             profile_picture=None,
         )
 
         await psychologist.insert()
+
+        # Gera disponibilidades para as próximas 2 semanas
+        availabilities = generate_availabilities(psychologist.id, tomorrow, num_days=14)
+        await AvailabilityDocument.insert_many(availabilities)
         psychologists_created.append(psychologist)
         print(f"  ✅ Psicólogo '{psych_data['name']}' criado com {len(availabilities)} disponibilidades!")
 
@@ -24,9 +24,11 @@ from infra.models.mongo.city_document import CityDocument  # noqa: E402
 from infra.models.mongo.content_document import ContentDocument  # noqa: E402
 from infra.models.mongo.patient_document import PatientDocument  # noqa: E402
 from infra.models.mongo.psychologist_document import PsychologistDocument  # noqa: E402
+from infra.models.mongo.psychologist_search_document import PsychologistSearchDocument  # noqa: E402
 from infra.models.mongo.specialty_document import SpecialtyDocument  # noqa: E402
 from infra.models.mongo.state_document import StateDocument  # noqa: E402
 from infra.models.mongo.user_document import UserDocument  # noqa: E402
+from infra.repos.mongo.psychologist_repo import MongoPsychologistRepo  # noqa: E402
 
 
 async def init_database():
@@ -44,6 +46,7 @@ async def init_database():
             UserDocument,
             PatientDocument,
             PsychologistDocument,
+            PsychologistSearchDocument,
             SpecialtyDocument,
             ApproachDocument,
             StateDocument,
@@ -84,6 +87,10 @@ async def run_all_seeds():
         # 2. Seeds que dependem dos anteriores
         psychologists = await seed_psychologists(specialties_map, approaches_map, cities_map)
 
+        # 3. Projeção de busca dos psicólogos (GET /psychologists)
+        indexed = await MongoPsychologistRepo.rebuild_search_projection()
+        print(f"🔎 Projeção de busca atualizada com {indexed} psicólogos\n")
+
         # Resumo final
         print("=" * 60)
         print("✨ SEEDS CONCLUÍDOS COM SUCESSO!")
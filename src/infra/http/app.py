@@ -15,17 +15,21 @@ from pydantic import ValidationError
 from application.common.exception import ApplicationException
 from domain.common.exception import DomainException
 from domain.common.guard import GuardException
+from infra.cache.geography_snapshot import GeographySnapshotStore
 from infra.config.settings import Settings
+from infra.http.response_cache_middleware import ResponseCacheMiddleware
 from infra.providers import container
 from infra.routers.appointment_router import router as appointment_router
 from infra.routers.approach_router import router as approach_router
 from infra.routers.content_router import router as content_router
 from infra.routers.geography_router import router as geography_router
+from infra.routers.health_router import router as health_router
 from infra.routers.patient_router import router as patient_router
 from infra.routers.psychologist_router import router as psychologist_router
 from infra.routers.session_router import router as session_router
 from infra.routers.specialty_router import router as specialty_router
 from infra.routers.user_router import router as user_router
+from infra.services.appointment_expiry_sweeper import AppointmentExpirySweeper
 
 
 class LifeSpan(TypedDict): ...
@@ -57,11 +61,24 @@ class MindHubApp:
 
     @asynccontextmanager
     async def __lifespan(self, app: FastAPI) -> AsyncGenerator[LifeSpan, None]:
+        # Conecta ao MongoDB e monta o snapshot de estados e cidades antes da primeira requisição
+        await app.state.dishka_container.get(GeographySnapshotStore)
+
+        sweeper: AppointmentExpirySweeper | None = None
+        if Settings().APPOINTMENT_EXPIRY_SWEEPER_ENABLED:
+            sweeper = await app.state.dishka_container.get(AppointmentExpirySweeper)
+            await sweeper.start()
+
         yield {}
 
-        app.state.dishka_container.close()
+        if sweeper:
+            await sweeper.stop()
+
+        await app.state.dishka_container.close()
 
     def _set_middlewares(self) -> None:
+        # Adicionado antes do CORS para que as respostas vindas do cache também recebam os cabeçalhos CORS
+        self.__app.add_middleware(ResponseCacheMiddleware)
         self.__app.add_middleware(
             CORSMiddleware,
             allow_origins=["*"],
@@ -80,6 +97,7 @@ class MindHubApp:
         self.__app.include_router(content_router)
         self.__app.include_router(user_router)
         self.__app.include_router(appointment_router)
+        self.__app.include_router(health_router)
 
         if Settings().ENV == "development":
             # Disponibiliza os arquivos salvos na pasta "/temp"
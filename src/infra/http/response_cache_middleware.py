@@ -0,0 +1,202 @@
+import json
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+from uuid import UUID
+
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from application.services.iresponse_cache import CacheTags
+from infra.cache.response_cache import RenderedResponse, ResponseCache
+from infra.config.logger import logger
+from infra.config.settings import Settings
+
+
+def _item_ids(body: Any, field: str = "id") -> list[UUID]:
+    return [UUID(item[field]) for item in body["items"] if item.get(field)]
+
+
+@dataclass(frozen=True)
+class CachedRoute:
+    name: str
+    pattern: re.Pattern[str]
+    ttl_seconds: int
+    # Tags da resposta a partir dos parâmetros de caminho e de query e do corpo JSON
+    tags: Callable[[dict[str, str], Any], list[str]]
+
+
+CACHED_ROUTES = (
+    CachedRoute(
+        name="psychologists",
+        pattern=re.compile(r"^/psychologists$"),
+        ttl_seconds=60,
+        tags=lambda params, body: [
+            CacheTags.PSYCHOLOGISTS,
+            *(CacheTags.psychologist(id) for id in _item_ids(body)),
+            # Na busca por horário livre, qualquer psicólogo pode entrar ou sair da listagem
+            *([CacheTags.AVAILABILITY_SEARCH] if {"available_from", "available_to"} & params.keys() else []),
+        ],
+    ),
+    CachedRoute(
+        name="psychologist",
+        pattern=re.compile(r"^/psychologists/(?P<id>[0-9a-fA-F-]{36})$"),
+        ttl_seconds=300,
+        tags=lambda params, body: [CacheTags.psychologist(UUID(params["id"]))],
+    ),
+    CachedRoute(
+        name="psychologist_availabilities",
+        pattern=re.compile(r"^/psychologists/(?P<id>[0-9a-fA-F-]{36})/availabilities$"),
+        ttl_seconds=60,
+        tags=lambda params, body: [CacheTags.psychologist(UUID(params["id"]))],
+    ),
+    CachedRoute(
+        name="contents",
+        pattern=re.compile(r"^/contents$"),
+        ttl_seconds=60,
+        # A listagem mostra o nome do autor: muda também quando o psicólogo é atualizado
+        tags=lambda params, body: [
+            CacheTags.CONTENTS,
+            *(CacheTags.content(id) for id in _item_ids(body)),
+            *(CacheTags.psychologist(id) for id in set(_item_ids(body, "author_id"))),
+        ],
+    ),
+    CachedRoute(
+        name="specialties",
+        pattern=re.compile(r"^/specialties$"),
+        ttl_seconds=3600,
+        tags=lambda params, body: [CacheTags.SPECIALTIES],
+    ),
+    CachedRoute(
+        name="approaches",
+        pattern=re.compile(r"^/approaches$"),
+        ttl_seconds=3600,
+        tags=lambda params, body: [CacheTags.APPROACHES],
+    ),
+)
+
+
+class ResponseCacheMiddleware:
+    """
+    Serve do `ResponseCache` os GETs anônimos das rotas em `CACHED_ROUTES`.
+
+    A chave é a rota com os parâmetros de query ordenados. Requisições com `Authorization` passam direto,
+    e `Cache-Control: no-cache` força uma nova renderização. Só respostas 200 são guardadas.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.enabled = Settings().RESPONSE_CACHE_ENABLED
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        route, params = self._match(scope["path"])
+        if route is None or "authorization" in headers:
+            await self.app(scope, receive, send)
+            return
+
+        response_cache: ResponseCache = await scope["app"].state.dishka_container.get(ResponseCache)
+        query = sorted(parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True))
+        key = response_cache.key(route.name, f"{scope['path']}?{urlencode(query)}")
+        # Parâmetros de caminho prevalecem sobre os de query com o mesmo nome
+        params = {**dict(query), **params}
+
+        if "no-cache" not in headers.get("cache-control", ""):
+            try:
+                body = await response_cache.get(key)
+            except RedisError as e:
+                # Sem o Redis a rota continua sendo servida pelo MongoDB, só que sem cache
+                response_cache.errors += 1
+                logger.error(f"❌ Response cache unavailable, serving {route.name} uncached: {e}")
+                await self.app(scope, receive, send)
+                return
+
+            if body is not None:
+                encoded = body.encode()
+                await self._send(
+                    send,
+                    RenderedResponse(
+                        status=200,
+                        headers=[
+                            (b"content-type", b"application/json"),
+                            (b"content-length", str(len(encoded)).encode()),
+                        ],
+                        body=encoded,
+                    ),
+                    b"HIT",
+                )
+                return
+
+        # Requisições iguais que chegam enquanto a primeira é renderizada esperam por ela
+        rendered = await response_cache.flights.run(
+            key, lambda: self._render(scope, receive, route, params, key, response_cache)
+        )
+        await self._send(send, rendered, b"MISS")
+
+    @staticmethod
+    def _match(path: str) -> tuple[CachedRoute | None, dict[str, str]]:
+        for route in CACHED_ROUTES:
+            match = route.pattern.match(path)
+            if match:
+                return route, match.groupdict()
+
+        return None, {}
+
+    async def _render(
+        self,
+        scope: Scope,
+        receive: Receive,
+        route: CachedRoute,
+        params: dict[str, str],
+        key: str,
+        response_cache: ResponseCache,
+    ) -> RenderedResponse:
+        start: Message = {}
+        chunks: list[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        rendered = RenderedResponse(
+            status=start["status"], headers=list(start.get("headers", [])), body=b"".join(chunks)
+        )
+
+        if rendered.status == 200:
+            try:
+                body = rendered.body.decode()
+                tags = route.tags(params, json.loads(body))
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"❌ Response of {route.name} not cached: {e}")
+            else:
+                try:
+                    await response_cache.store(key, body, route.ttl_seconds, tags)
+                except RedisError as e:
+                    # A resposta já foi renderizada: é entregue mesmo sem ficar em cache
+                    response_cache.errors += 1
+                    logger.error(f"❌ Response of {route.name} not cached: {e}")
+
+        return rendered
+
+    @staticmethod
+    async def _send(send: Send, rendered: RenderedResponse, cache_status: bytes) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": rendered.status,
+                "headers": [*rendered.headers, (b"x-cache", cache_status)],
+            }
+        )
+        await send({"type": "http.response.body", "body": rendered.body})
@@ -4,8 +4,8 @@ from abc import ABC, abstractmethod
 class IMapper[E, M](ABC):
     @staticmethod
     @abstractmethod
-    async def to_domain(model: E) -> M: ...
+    def to_domain(model: E) -> M: ...
 
     @staticmethod
     @abstractmethod
-    async def to_model(entity: M) -> E: ...
+    def to_model(entity: M) -> E: ...
@@ -1,14 +1,17 @@
+from typing import Any
+
 from domain.appointment import Appointment, AppointmentStatusEnum
 from domain.common.unique_entity_id import UniqueEntityId
 from infra.mappers.imapper import IMapper
+from infra.mappers.mongo.dirty_fields import FieldPaths, to_set_document
 from infra.mappers.mongo.pix_payment_mapper import PixPaymentMongoMapper
 from infra.models.mongo.appointment_document import AppointmentDocument
 
 
 class AppointmentMongoMapper(IMapper[AppointmentDocument, Appointment]):
     @staticmethod
-    async def to_domain(model: AppointmentDocument) -> Appointment:
-        pix_payment = await PixPaymentMongoMapper.to_domain(model.pix_payment)  # type: ignore
+    def to_domain(model: AppointmentDocument) -> Appointment:
+        pix_payment = PixPaymentMongoMapper.to_domain(model.pix_payment)  # type: ignore
 
         return Appointment(
             date=model.date,
@@ -23,8 +26,8 @@ class AppointmentMongoMapper(IMapper[AppointmentDocument, Appointment]):
         )
 
     @staticmethod
-    async def to_model(entity: Appointment) -> AppointmentDocument:
-        pix_payment_doc = await PixPaymentMongoMapper.to_model(entity.pix_payment)
+    def to_model(entity: Appointment) -> AppointmentDocument:
+        pix_payment_doc = PixPaymentMongoMapper.to_model(entity.pix_payment)
 
         return AppointmentDocument(
             id=entity.id.value,
@@ -37,3 +40,17 @@ class AppointmentMongoMapper(IMapper[AppointmentDocument, Appointment]):
             status=entity.status.value,
             availability_id=entity.availability_id.value if entity.availability_id else None,
         )
+
+    @staticmethod
+    def to_update(entity: Appointment) -> dict[str, Any]:
+        return to_set_document(entity, APPOINTMENT_FIELD_PATHS)
+
+
+APPOINTMENT_FIELD_PATHS: FieldPaths[Appointment] = {
+    "date": ("date", lambda appointment: appointment.date),
+    "status": ("status", lambda appointment: appointment.status.value),
+    "availability_id": (
+        "availability_id",
+        lambda appointment: appointment.availability_id.value if appointment.availability_id else None,
+    ),
+}
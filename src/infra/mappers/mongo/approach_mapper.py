@@ -6,7 +6,7 @@ from infra.models.mongo.approach_document import ApproachDocument
 
 class ApproachMongoMapper(IMapper[ApproachDocument, Approach]):
     @staticmethod
-    async def to_domain(model: ApproachDocument) -> Approach:
+    def to_domain(model: ApproachDocument) -> Approach:
         return Approach(
             name=model.name,
             description=model.description,
@@ -14,7 +14,7 @@ class ApproachMongoMapper(IMapper[ApproachDocument, Approach]):
         )
 
     @staticmethod
-    async def to_model(entity: Approach) -> ApproachDocument:
+    def to_model(entity: Approach) -> ApproachDocument:
         return ApproachDocument(
             id=entity.id.value,
             name=entity.name,
@@ -1,12 +1,11 @@
 from domain.availability import Availability
 from domain.common.unique_entity_id import UniqueEntityId
-from infra.mappers.imapper import IMapper
 from infra.models.mongo.availability_document import AvailabilityDocument
 
 
-class AvailabilityMongoMapper(IMapper[AvailabilityDocument, Availability]):
+class AvailabilityMongoMapper:
     @staticmethod
-    async def to_domain(model: AvailabilityDocument) -> Availability:
+    def to_domain(model: AvailabilityDocument) -> Availability:
         return Availability(
             date=model.date,
             available=model.available,
@@ -14,9 +13,10 @@ class AvailabilityMongoMapper(IMapper[AvailabilityDocument, Availability]):
         )
 
     @staticmethod
-    async def to_model(entity: Availability) -> AvailabilityDocument:
+    def to_model(entity: Availability, psychologist_id: UniqueEntityId) -> AvailabilityDocument:
         return AvailabilityDocument(
             id=entity.id.value,
-            date=entity.date,
+            psychologist_id=psychologist_id.value,
+            date=entity.normalized_date,
             available=entity.available,
         )
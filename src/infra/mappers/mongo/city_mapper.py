@@ -7,8 +7,8 @@ from infra.models.mongo.city_document import CityDocument
 
 class CityMongoMapper(IMapper[CityDocument, City]):
     @staticmethod
-    async def to_domain(model: CityDocument) -> City:
-        state = await StateMongoMapper.to_domain(model.state)  # type: ignore
+    def to_domain(model: CityDocument) -> City:
+        state = StateMongoMapper.to_domain(model.state)  # type: ignore
 
         return City(
             name=model.name,
@@ -17,8 +17,8 @@ class CityMongoMapper(IMapper[CityDocument, City]):
         )
 
     @staticmethod
-    async def to_model(entity: City) -> CityDocument:
-        state = await StateMongoMapper.to_model(entity.state)
+    def to_model(entity: City) -> CityDocument:
+        state = StateMongoMapper.to_model(entity.state)
 
         return CityDocument(
             name=entity.name,
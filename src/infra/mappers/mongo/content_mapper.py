@@ -1,12 +1,15 @@
+from typing import Any
+
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.content import Content
+from infra.mappers.mongo.dirty_fields import FieldPaths, link_ref, to_set_document
 from infra.models.mongo.content_document import ContentDocument
 from infra.models.mongo.psychologist_document import PsychologistDocument
 
 
 class ContentMongoMapper:
     @staticmethod
-    async def to_domain(model: ContentDocument) -> Content:
+    def to_domain(model: ContentDocument) -> Content:
         if not model:
             return None
 
@@ -19,15 +22,23 @@ class ContentMongoMapper:
         )
 
     @staticmethod
-    async def to_model(entity: Content) -> ContentDocument:
-        # Buscar o autor para criar o link
-        author = await PsychologistDocument.find_one(PsychologistDocument.id == entity.author_id.value)
-
+    def to_model(entity: Content) -> ContentDocument:
         return ContentDocument(
             id=entity.id.value,
             title=entity.title,
             body=entity.body,
             author_id=entity.author_id.value,
-            author=author,
+            # Referência montada a partir do id, sem buscar o autor no banco
+            author=link_ref(PsychologistDocument, entity.author_id.value),  # type: ignore
             created_at=entity.created_at,
         )
+
+    @staticmethod
+    def to_update(entity: Content) -> dict[str, Any]:
+        return to_set_document(entity, CONTENT_FIELD_PATHS)
+
+
+CONTENT_FIELD_PATHS: FieldPaths[Content] = {
+    "title": ("title", lambda content: content.title),
+    "body": ("body", lambda content: content.body),
+}
@@ -0,0 +1,36 @@
+from collections.abc import Callable
+from typing import Any
+
+from bson import DBRef
+
+from domain.common.entity import Entity
+from domain.user import User
+from infra.models.mongo.city_document import CityDocument
+
+# Campo da entidade -> (caminho no documento, serializador do valor)
+type FieldPaths[E: Entity] = dict[str, tuple[str, Callable[[E], Any]]]
+
+
+def to_set_document[E: Entity](entity: E, fields: FieldPaths[E]) -> dict[str, Any]:
+    """Monta o `$set` apenas com os campos alterados da entidade."""
+    return {path: serialize(entity) for field, (path, serialize) in fields.items() if field in entity.dirty_fields}
+
+
+def link_ref(document: type[Any], id: Any) -> DBRef:
+    """Mesmo formato que o Beanie grava para um `Link`."""
+    return DBRef(document.get_collection_name(), id)
+
+
+USER_FIELD_PATHS: FieldPaths[User] = {
+    "name": ("name", lambda user: user.name),
+    "email": ("email", lambda user: user.email.value),
+    "cpf": ("cpf", lambda user: user.cpf.value),
+    "phone_number": ("phone_number", lambda user: user.phone_number.value),
+    "birth_date": ("birth_date", lambda user: user.birth_date.isoformat()),
+    "gender": ("gender", lambda user: user.gender.value),
+    "city": ("city", lambda user: link_ref(CityDocument, user.city.id.value)),
+    "profile_picture": (
+        "profile_picture",
+        lambda user: user.profile_picture.model_dump(mode="json") if user.profile_picture else None,
+    ),
+}
@@ -1,5 +1,7 @@
 from datetime import datetime
+from typing import Any
 
+from domain.city import City
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.patient import Patient
 from domain.value_objects.cpf import CPF
@@ -8,19 +10,23 @@ from domain.value_objects.password import Password
 from domain.value_objects.phone_number import PhoneNumber
 from infra.mappers.imapper import IMapper
 from infra.mappers.mongo.city_mapper import CityMongoMapper
+from infra.mappers.mongo.dirty_fields import USER_FIELD_PATHS, to_set_document
 from infra.models.mongo.patient_document import PatientDocument
 
 
 class PatientMongoMapper(IMapper[PatientDocument, Patient]):
     @staticmethod
-    async def to_domain(model: PatientDocument) -> Patient:
-        city = await CityMongoMapper.to_domain(model.city)  # type: ignore
+    def to_domain(model: PatientDocument, city: City | None = None) -> Patient:
+        # Cidade já resolvida (cache de referência) dispensa o link buscado no documento
+        if city is None:
+            city = CityMongoMapper.to_domain(model.city)  # type: ignore
+        # Valores já validados (e normalizados) na escrita, como a senha já em hash
         patient = Patient(
             name=model.name,
-            email=Email(value=model.email),
+            email=Email.model_construct(value=model.email),
             password=Password(value=model.password_hash, hashed=True),
-            cpf=CPF(value=model.cpf),
-            phone_number=PhoneNumber(value=model.phone_number),
+            cpf=CPF.model_construct(value=model.cpf),
+            phone_number=PhoneNumber.model_construct(value=model.phone_number),
             birth_date=datetime.fromisoformat(model.birth_date),
             gender=model.gender,
             city=city,
@@ -31,8 +37,8 @@ class PatientMongoMapper(IMapper[PatientDocument, Patient]):
         return patient
 
     @staticmethod
-    async def to_model(entity: Patient) -> PatientDocument:
-        city = await CityMongoMapper.to_model(entity.city)
+    def to_model(entity: Patient) -> PatientDocument:
+        city = CityMongoMapper.to_model(entity.city)
 
         return PatientDocument(
             id=entity.id.value,
@@ -46,3 +52,7 @@ class PatientMongoMapper(IMapper[PatientDocument, Patient]):
             profile_picture=entity.profile_picture,
             city=city,  # type: ignore
         )
+
+    @staticmethod
+    def to_update(entity: Patient) -> dict[str, Any]:
+        return to_set_document(entity, USER_FIELD_PATHS)
@@ -1,12 +1,15 @@
+from typing import Any
+
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.pix_payment import PaymentStatusEnum, PixPayment
 from infra.mappers.imapper import IMapper
+from infra.mappers.mongo.dirty_fields import FieldPaths, to_set_document
 from infra.models.mongo.appointment_document import PixPaymentDocument
 
 
 class PixPaymentMongoMapper(IMapper[PixPaymentDocument, PixPayment]):
     @staticmethod
-    async def to_domain(model: PixPaymentDocument) -> PixPayment:
+    def to_domain(model: PixPaymentDocument) -> PixPayment:
         return PixPayment(
             amount=model.amount,
             provider_payment_id=model.provider_payment_id,
@@ -17,7 +20,7 @@ class PixPaymentMongoMapper(IMapper[PixPaymentDocument, PixPayment]):
         )
 
     @staticmethod
-    async def to_model(entity: PixPayment) -> PixPaymentDocument:
+    def to_model(entity: PixPayment) -> PixPaymentDocument:
         return PixPaymentDocument(
             id=entity.id.value,
             amount=entity.amount,
@@ -26,3 +29,12 @@ class PixPaymentMongoMapper(IMapper[PixPaymentDocument, PixPayment]):
             expires_at=entity.expires_at,
             status=entity.status.value,
         )
+
+    @staticmethod
+    def to_update(entity: PixPayment) -> dict[str, Any]:
+        return to_set_document(entity, PIX_PAYMENT_FIELD_PATHS)
+
+
+PIX_PAYMENT_FIELD_PATHS: FieldPaths[PixPayment] = {
+    "status": ("status", lambda pix_payment: pix_payment.status.value),
+}
@@ -1,8 +1,9 @@
-import asyncio
 from datetime import datetime
+from typing import Any
 
 from domain.approach import Approach
 from domain.availability import Availability
+from domain.city import City
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.psychologist import AudienceEnum, Psychologist
 from domain.specialty import Specialty
@@ -15,68 +16,67 @@ from infra.mappers.imapper import IMapper
 from infra.mappers.mongo.approach_mapper import ApproachMongoMapper
 from infra.mappers.mongo.availability_mapper import AvailabilityMongoMapper
 from infra.mappers.mongo.city_mapper import CityMongoMapper
+from infra.mappers.mongo.dirty_fields import USER_FIELD_PATHS, FieldPaths, link_ref, to_set_document
 from infra.mappers.mongo.specialty_mapper import SpecialtyMongoMapper
+from infra.models.mongo.approach_document import ApproachDocument
+from infra.models.mongo.availability_document import AvailabilityDocument
 from infra.models.mongo.psychologist_document import PsychologistDocument
+from infra.models.mongo.specialty_document import SpecialtyDocument
 
 
 class PsychologistMongoMapper(IMapper[PsychologistDocument, Psychologist]):
     @staticmethod
-    async def to_domain(model: PsychologistDocument) -> Psychologist:
-        city = await CityMongoMapper.to_domain(model.city)  # type: ignore
+    def to_domain(
+        model: PsychologistDocument,
+        availabilities: list[AvailabilityDocument] | None = None,
+        *,
+        city: City | None = None,
+        specialties: list[Specialty] | None = None,
+        approaches: list[Approach] | None = None,
+    ) -> Psychologist:
+        # Referências já resolvidas (cache de referência) dispensam os links buscados no documento
+        if city is None:
+            city = CityMongoMapper.to_domain(model.city)  # type: ignore
 
-        specialties: list[Specialty] = [
-            await SpecialtyMongoMapper.to_domain(doc)  # type: ignore
-            for doc in model.specialties
-        ]
+        if specialties is None:
+            specialties = [SpecialtyMongoMapper.to_domain(doc) for doc in model.specialties]  # type: ignore
 
-        approaches: list[Approach] = [
-            await ApproachMongoMapper.to_domain(doc)  # type: ignore
-            for doc in model.approaches
-        ]
+        if approaches is None:
+            approaches = [ApproachMongoMapper.to_domain(doc) for doc in model.approaches]  # type: ignore
 
-        availabilities: list[Availability] | None = None
-        if model.availabilities:
-            availabilities = [
-                await AvailabilityMongoMapper.to_domain(doc)  # type: ignore
-                for doc in model.availabilities
-            ]
+        # Disponibilidades ficam na coleção `availability_slots` e são carregadas pelo repositório
+        domain_availabilities: list[Availability] | None = None
+        if availabilities:
+            domain_availabilities = [AvailabilityMongoMapper.to_domain(doc) for doc in availabilities]
 
+        # Valores já validados (e normalizados) na escrita: refazer a validação a cada leitura custava mais que
+        # o resto do mapeamento, sobretudo a do e-mail (sintaxe e IDNA do domínio)
         return Psychologist(
             name=model.name,
-            email=Email(value=model.email),
+            email=Email.model_construct(value=model.email),
             password=Password(value=model.password_hash, hashed=True),
-            cpf=CPF(value=model.cpf),
-            phone_number=PhoneNumber(value=model.phone_number),
+            cpf=CPF.model_construct(value=model.cpf),
+            phone_number=PhoneNumber.model_construct(value=model.phone_number),
             birth_date=datetime.fromisoformat(model.birth_date),
             gender=model.gender,
             city=city,
-            crp=CRP(value=model.crp),
+            crp=CRP.model_construct(value=model.crp),
             description=model.description,
             specialties=specialties,
             approaches=approaches,
             audiences=[AudienceEnum(audience) for audience in model.audiences],
             value_per_appointment=model.value_per_appointment,
-            availabilities=availabilities,
+            availabilities=domain_availabilities,
             profile_picture=model.profile_picture,
             id=UniqueEntityId(model.id),
         )
 
     @staticmethod
-    async def to_model(entity: Psychologist) -> PsychologistDocument:
-        availabilities = (
-            await asyncio.gather(
-                *(AvailabilityMongoMapper.to_model(availability) for availability in entity.availabilities)
-            )
-            if entity.availabilities is not None
-            else None
-        )
-        specialties = await asyncio.gather(
-            *(SpecialtyMongoMapper.to_model(specialty) for specialty in entity.specialties)
-        )
+    def to_model(entity: Psychologist) -> PsychologistDocument:
+        specialties = [SpecialtyMongoMapper.to_model(specialty) for specialty in entity.specialties]
+        approaches = [ApproachMongoMapper.to_model(approach) for approach in entity.approaches]
 
-        approaches = await asyncio.gather(*(ApproachMongoMapper.to_model(approach) for approach in entity.approaches))
-
-        city = await CityMongoMapper.to_model(entity.city)
+        city = CityMongoMapper.to_model(entity.city)
 
         return PsychologistDocument(
             id=entity.id.value,
@@ -95,5 +95,27 @@ class PsychologistMongoMapper(IMapper[PsychologistDocument, Psychologist]):
             approaches=approaches,  # type: ignore
             audiences=[audience.value for audience in entity.audiences],
             value_per_appointment=entity.value_per_appointment,
-            availabilities=availabilities,  # type: ignore
         )
+
+    @staticmethod
+    def to_update(entity: Psychologist) -> dict[str, Any]:
+        return to_set_document(entity, PSYCHOLOGIST_FIELD_PATHS)
+
+
+PSYCHOLOGIST_FIELD_PATHS: FieldPaths[Psychologist] = {
+    **USER_FIELD_PATHS,
+    "crp": ("crp", lambda psychologist: psychologist.crp.value),
+    "description": ("description", lambda psychologist: psychologist.description),
+    "specialties": (
+        "specialties",
+        lambda psychologist: [
+            link_ref(SpecialtyDocument, specialty.id.value) for specialty in psychologist.specialties
+        ],
+    ),
+    "approaches": (
+        "approaches",
+        lambda psychologist: [link_ref(ApproachDocument, approach.id.value) for approach in psychologist.approaches],
+    ),
+    "audiences": ("audiences", lambda psychologist: [audience.value for audience in psychologist.audiences]),
+    "value_per_appointment": ("value_per_appointment", lambda psychologist: psychologist.value_per_appointment),
+}
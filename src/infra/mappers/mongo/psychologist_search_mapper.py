@@ -0,0 +1,25 @@
+from domain.psychologist import Psychologist
+from infra.models.mongo.psychologist_search_document import PsychologistSearchDocument
+
+
+class PsychologistSearchMongoMapper:
+    """Mapeamento de mão única: a projeção de busca nunca é convertida de volta em entidade."""
+
+    @staticmethod
+    def to_model(entity: Psychologist) -> PsychologistSearchDocument:
+        return PsychologistSearchDocument(
+            id=entity.id.value,
+            name=entity.name,
+            gender=entity.gender,
+            price=entity.value_per_appointment,
+            audiences=[audience.value for audience in entity.audiences],
+            specialty_ids=[specialty.id.value for specialty in entity.specialties],
+            specialty_names=[specialty.name for specialty in entity.specialties],
+            approach_ids=[approach.id.value for approach in entity.approaches],
+            approach_names=[approach.name for approach in entity.approaches],
+            city_id=entity.city.id.value,
+            city_name=entity.city.name,
+            state_id=entity.city.state.id.value,
+            state_name=entity.city.state.name,
+            state_abbreviation=entity.city.state.abbreviation,
+        )
@@ -6,7 +6,7 @@ from infra.models.mongo.specialty_document import SpecialtyDocument
 
 class SpecialtyMongoMapper(IMapper[SpecialtyDocument, Specialty]):
     @staticmethod
-    async def to_domain(model: SpecialtyDocument) -> Specialty:
+    def to_domain(model: SpecialtyDocument) -> Specialty:
         return Specialty(
             name=model.name,
             description=model.description,
@@ -14,7 +14,7 @@ class SpecialtyMongoMapper(IMapper[SpecialtyDocument, Specialty]):
         )
 
     @staticmethod
-    async def to_model(entity: Specialty) -> SpecialtyDocument:
+    def to_model(entity: Specialty) -> SpecialtyDocument:
         return SpecialtyDocument(
             id=entity.id.value,
             name=entity.name,
@@ -6,7 +6,7 @@ from infra.models.mongo.state_document import StateDocument
 
 class StateMongoMapper(IMapper[StateDocument, State]):
     @staticmethod
-    async def to_domain(model: StateDocument) -> State:
+    def to_domain(model: StateDocument) -> State:
         return State(
             name=model.name,
             abbreviation=model.abbreviation,
@@ -14,7 +14,7 @@ class StateMongoMapper(IMapper[StateDocument, State]):
         )
 
     @staticmethod
-    async def to_model(entity: State) -> StateDocument:
+    def to_model(entity: State) -> StateDocument:
         return StateDocument(
             name=entity.name,
             abbreviation=entity.abbreviation,
@@ -12,21 +12,21 @@ from infra.models.mongo.user_document import UserDocument
 
 class UserMongoMapper(IMapper[UserDocument, User]):
     @staticmethod
-    async def to_domain(model: UserDocument) -> User:
+    def to_domain(model: UserDocument) -> User:
         if isinstance(model, PatientDocument):
-            return await PatientMongoMapper.to_domain(model)
+            return PatientMongoMapper.to_domain(model)
 
         if isinstance(model, PsychologistDocument):
-            return await PsychologistMongoMapper.to_domain(model)
+            return PsychologistMongoMapper.to_domain(model)
 
         raise ApplicationException("Tipo de modelo inválido")
 
     @staticmethod
-    async def to_model(entity: User) -> UserDocument:
+    def to_model(entity: User) -> UserDocument:
         if isinstance(entity, Patient):
-            return await PatientMongoMapper.to_model(entity)
+            return PatientMongoMapper.to_model(entity)
 
         if isinstance(entity, Psychologist):
-            return await PsychologistMongoMapper.to_model(entity)
+            return PsychologistMongoMapper.to_model(entity)
 
         raise ApplicationException("Tipo de entidade inválido")
@@ -3,6 +3,7 @@ from uuid import UUID
 
 from beanie import Document, Link
 from pydantic import Field
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from domain.appointment import AppointmentStatusEnum
 
@@ -14,9 +15,18 @@ class PixPaymentDocument(Document):
     pix_payload: str
     expires_at: datetime
     status: str
+    # Preenchido pela varredura de expiração quando o agendamento já não aguarda pagamento (foi informado como
+    # pago ou cancelado): o pagamento segue pendente, mas sai das próximas varreduras
+    expiry_swept_at: datetime | None = None
 
     class Settings:
         name = "pix_payments"
+        indexes = [
+            # Varredura de pagamentos pendentes expirados ainda não descartados, na ordem do cursor
+            IndexModel(
+                [("status", ASCENDING), ("expiry_swept_at", ASCENDING), ("expires_at", ASCENDING), ("_id", ASCENDING)]
+            ),
+        ]
 
 
 class AppointmentDocument(Document):
@@ -32,3 +42,11 @@ class AppointmentDocument(Document):
 
     class Settings:
         name = "appointments"
+        indexes = [
+            IndexModel([("psychologist_id", ASCENDING), ("status", ASCENDING), ("date", DESCENDING)]),
+            IndexModel([("patient_id", ASCENDING), ("status", ASCENDING), ("date", DESCENDING)]),
+            IndexModel([("status", ASCENDING), ("date", DESCENDING)]),
+            IndexModel([("date", DESCENDING)]),
+            IndexModel([("availability_id", ASCENDING)]),
+            IndexModel([("pix_payment.$id", ASCENDING)]),
+        ]
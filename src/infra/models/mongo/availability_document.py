@@ -3,17 +3,19 @@ from uuid import UUID
 
 from beanie import Document
 from pydantic import Field
-from pymongo import IndexModel
+from pymongo import ASCENDING, IndexModel
 
 
 class AvailabilityDocument(Document):
     id: UUID
+    psychologist_id: UUID
     date: datetime
     available: bool = Field(default=True)
 
     class Settings:
-        name = "availabilities"
+        name = "availability_slots"
         indexes = [
-            IndexModel("date"),
-            IndexModel("available"),
+            IndexModel([("psychologist_id", ASCENDING), ("date", ASCENDING)], unique=True),
+            # Busca por horário livre: faixa de datas dos horários livres, já com o psicólogo (consulta coberta)
+            IndexModel([("available", ASCENDING), ("date", ASCENDING), ("psychologist_id", ASCENDING)]),
         ]
@@ -2,6 +2,7 @@ from datetime import datetime
 from uuid import UUID
 
 from beanie import Document, Link
+from pymongo import ASCENDING, DESCENDING, IndexModel
 
 from infra.models.mongo.psychologist_document import PsychologistDocument
 
@@ -16,3 +17,7 @@ class ContentDocument(Document):
 
     class Settings:
         name = "contents"
+        indexes = [
+            IndexModel([("author.$id", ASCENDING), ("created_at", DESCENDING)]),
+            IndexModel([("created_at", DESCENDING)]),
+        ]
@@ -4,7 +4,6 @@ from beanie import Indexed, Link
 from pydantic import Field
 
 from infra.models.mongo.approach_document import ApproachDocument
-from infra.models.mongo.availability_document import AvailabilityDocument
 from infra.models.mongo.specialty_document import SpecialtyDocument
 from infra.models.mongo.user_document import UserDocument
 
@@ -16,5 +15,3 @@ class PsychologistDocument(UserDocument):
     audiences: list[str] = Field(default_factory=list)
     value_per_appointment: float
     description: str | None = None
-    # Availabilities como subdocumentos embutidos (não Links)
-    availabilities: list[AvailabilityDocument] | None = Field(default_factory=list)
@@ -0,0 +1,40 @@
+from uuid import UUID
+
+from beanie import Document
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+from domain.user import GenderEnum
+
+
+class PsychologistSearchDocument(Document):
+    """Projeção achatada de um psicólogo, usada apenas pela busca de `GET /psychologists`."""
+
+    # Mesmo id do PsychologistDocument
+    id: UUID
+    name: str
+    gender: GenderEnum
+    price: float
+    audiences: list[str] = Field(default_factory=list)
+    specialty_ids: list[UUID] = Field(default_factory=list)
+    specialty_names: list[str] = Field(default_factory=list)
+    approach_ids: list[UUID] = Field(default_factory=list)
+    approach_names: list[str] = Field(default_factory=list)
+    city_id: UUID
+    city_name: str
+    state_id: UUID
+    state_name: str
+    state_abbreviation: str
+
+    class Settings:
+        name = "psychologist_search"
+        indexes = [
+            # Índices multikey sobre os arrays usados no score
+            IndexModel([("specialty_ids", ASCENDING)]),
+            IndexModel([("approach_ids", ASCENDING)]),
+            IndexModel([("audiences", ASCENDING)]),
+            IndexModel([("gender", ASCENDING)]),
+            IndexModel([("price", ASCENDING)]),
+            IndexModel([("city_id", ASCENDING)]),
+            IndexModel([("state_id", ASCENDING)]),
+        ]
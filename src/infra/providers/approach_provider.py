@@ -5,6 +5,7 @@ from dishka import (
 )
 
 from application.repos.iapproach_repo import IApproachRepo
+from application.services.iresponse_cache import IResponseCache
 from application.use_cases.approach.create_approach import CreateApproachUseCase
 from application.use_cases.approach.get_approach_by_id import GetApproachByIdUseCase
 from application.use_cases.approach.get_approaches import GetApproachesUseCase
@@ -12,8 +13,10 @@ from application.use_cases.approach.get_approaches import GetApproachesUseCase
 
 class ApproachProvider(Provider):
     @provide(scope=Scope.REQUEST)
-    def CreateApproachUseCaseInstance(self, approach_repo: IApproachRepo) -> CreateApproachUseCase:
-        return CreateApproachUseCase(approach_repo)
+    def CreateApproachUseCaseInstance(
+        self, approach_repo: IApproachRepo, response_cache: IResponseCache
+    ) -> CreateApproachUseCase:
+        return CreateApproachUseCase(approach_repo, response_cache)
 
     @provide(scope=Scope.REQUEST)
     def GetApproachByIdUseCaseInsntance(self, approach_repo: IApproachRepo) -> GetApproachByIdUseCase:
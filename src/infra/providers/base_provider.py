@@ -1,4 +1,4 @@
-from typing import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
 
 import redis.asyncio as redis
 from dishka import (
@@ -10,7 +10,16 @@ from dishka import (
 from application.services.iauth_service import IAuthService
 from application.services.ifile_service import IFileService
 from application.services.ipix_payment_service import IPixPaymentService
+from application.services.iresponse_cache import IResponseCache
+from infra.cache.response_cache import PendingInvalidations, ResponseCache
+from infra.cache.session_epochs import SessionEpochCache
+from infra.config.logger import logger
+from infra.config.mongo_db_manager import MongoManager
 from infra.config.redis import RedisManager
+from infra.config.redis_lease import RedisLease
+from infra.config.settings import Settings
+from infra.services.appointment_expiry_sweeper import AppointmentExpirySweeper
+from infra.services.bcrypt_pool import BcryptPool
 from infra.services.default_auth_service import DefaultAuthService
 from infra.services.local_file_service import LocalFileService
 from infra.services.pix_payment_service import PixPaymentService
@@ -27,9 +36,79 @@ class BaseProvider(Provider):
         return LocalFileService()
 
     @provide(scope=Scope.APP)
-    def AuthServiceImpl(self, redis_client: redis.Redis) -> IAuthService:
-        return DefaultAuthService(redis_client)
+    async def SessionEpochs(self, redis_client: redis.Redis) -> AsyncGenerator[SessionEpochCache]:
+        settings = Settings()
+        session_epochs = SessionEpochCache(
+            redis_client,
+            max_entries=settings.AUTH_EPOCH_CACHE_SIZE,
+            max_staleness_seconds=settings.AUTH_EPOCH_MAX_STALENESS_SECONDS,
+        )
+        await session_epochs.start()
+
+        try:
+            yield session_epochs
+        finally:
+            await session_epochs.stop()
+
+    @provide(scope=Scope.APP)
+    def BcryptPoolInstance(self) -> Iterator[BcryptPool]:
+        settings = Settings()
+        bcrypt_pool = BcryptPool(
+            workers=settings.BCRYPT_WORKERS,
+            rounds=settings.BCRYPT_ROUNDS,
+            max_concurrent_verifications=settings.LOGIN_MAX_CONCURRENCY,
+        )
+
+        try:
+            yield bcrypt_pool
+        finally:
+            bcrypt_pool.shutdown()
+
+    @provide(scope=Scope.APP)
+    async def AuthServiceImpl(
+        self, redis_client: redis.Redis, session_epochs: SessionEpochCache, bcrypt_pool: BcryptPool
+    ) -> IAuthService:
+        auth_service = DefaultAuthService(redis_client, session_epochs, bcrypt_pool)
+
+        migrated = await auth_service.migrate_legacy_tokens()
+        if migrated:
+            logger.info(f"🔑 Moved {migrated} refresh tokens to per-user sorted sets")
+
+        return auth_service
 
     @provide(scope=Scope.APP)
     def PixPaymentServiceImpl(self) -> IPixPaymentService:
         return PixPaymentService()
+
+    @provide(scope=Scope.APP)
+    def ResponseCacheInstance(self, redis_client: redis.Redis) -> ResponseCache:
+        return ResponseCache(redis_client)
+
+    @provide(scope=Scope.APP)
+    def AppointmentExpirySweeperInstance(
+        self, db_manager: MongoManager, response_cache: ResponseCache, redis_client: redis.Redis
+    ) -> AppointmentExpirySweeper:
+        settings = Settings()
+        lease = RedisLease(redis_client, AppointmentExpirySweeper.LEASE_NAME, settings.APPOINTMENT_EXPIRY_LEASE_SECONDS)
+
+        return AppointmentExpirySweeper(
+            db_manager,
+            response_cache,
+            lease,
+            interval_seconds=settings.APPOINTMENT_EXPIRY_SWEEP_INTERVAL_SECONDS,
+            batch_size=settings.APPOINTMENT_EXPIRY_BATCH_SIZE,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    async def PendingInvalidationsInstance(self, response_cache: ResponseCache) -> AsyncGenerator[PendingInvalidations]:
+        invalidations = PendingInvalidations(response_cache)
+
+        try:
+            yield invalidations
+        finally:
+            # Requisições que não abriram sessão no MongoDB; as demais já aplicaram após o commit
+            await invalidations.flush()
+
+    @provide(scope=Scope.REQUEST)
+    def ResponseCacheImpl(self, invalidations: PendingInvalidations) -> IResponseCache:
+        return invalidations
@@ -6,6 +6,7 @@ from dishka import (
 
 from application.repos.icontent_repo import IContentRepo
 from application.repos.ipsychologist_repo import IPsychologistRepo
+from application.services.iresponse_cache import IResponseCache
 from application.use_cases.content.create_content import CreateContentUseCase
 from application.use_cases.content.delete_content import DeleteContentUseCase
 from application.use_cases.content.get_content_by_id import GetContentByIdUseCase
@@ -19,8 +20,9 @@ class ContentProvider(Provider):
         self,
         content_repo: IContentRepo,
         psychologist_repo: IPsychologistRepo,
+        response_cache: IResponseCache,
     ) -> CreateContentUseCase:
-        return CreateContentUseCase(content_repo, psychologist_repo)
+        return CreateContentUseCase(content_repo, psychologist_repo, response_cache)
 
     @provide(scope=Scope.REQUEST)
     def GetContentsUseCaseInstance(
@@ -35,9 +37,13 @@ class ContentProvider(Provider):
         return GetContentByIdUseCase(content_repo, psychologist_repo)
 
     @provide(scope=Scope.REQUEST)
-    def UpdateContentUseCaseInstance(self, content_repo: IContentRepo) -> UpdateContentUseCase:
-        return UpdateContentUseCase(content_repo)
+    def UpdateContentUseCaseInstance(
+        self, content_repo: IContentRepo, response_cache: IResponseCache
+    ) -> UpdateContentUseCase:
+        return UpdateContentUseCase(content_repo, response_cache)
 
     @provide(scope=Scope.REQUEST)
-    def DeleteContentUseCaseInstance(self, content_repo: IContentRepo) -> DeleteContentUseCase:
-        return DeleteContentUseCase(content_repo)
+    def DeleteContentUseCaseInstance(
+        self, content_repo: IContentRepo, response_cache: IResponseCache
+    ) -> DeleteContentUseCase:
+        return DeleteContentUseCase(content_repo, response_cache)
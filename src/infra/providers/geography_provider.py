@@ -1,28 +1,25 @@
+from collections.abc import AsyncGenerator
+
+import redis.asyncio as redis
 from dishka import (
     Provider,
     Scope,
     provide,  # type: ignore
 )
 
-from application.repos.icity_repo import ICityRepo
-from application.repos.istate_repo import IStateRepo
-from application.use_cases.geography.get_cities_by_state_id import (
-    GetCitiesByStateIdUseCase,
-)
-from application.use_cases.geography.get_states import GetStatesUseCase
+from infra.cache.geography_snapshot import GeographySnapshotStore
+from infra.cache.reference_cache import ReferenceCache
 
 
 class GeographyProvider(Provider):
-    @provide(scope=Scope.REQUEST)
-    def GetStatesUseCaseInstance(
-        self,
-        state_repo: IStateRepo,
-    ) -> GetStatesUseCase:
-        return GetStatesUseCase(state_repo)
+    @provide(scope=Scope.APP)
+    async def GeographySnapshotStoreInstance(
+        self, reference_cache: ReferenceCache, redis_client: redis.Redis
+    ) -> AsyncGenerator[GeographySnapshotStore]:
+        snapshot_store = GeographySnapshotStore(reference_cache, redis_client)
+        await snapshot_store.start()
 
-    @provide(scope=Scope.REQUEST)
-    def GetCitiesByStateIdUseCaseInstance(
-        self,
-        city_repo: ICityRepo,
-    ) -> GetCitiesByStateIdUseCase:
-        return GetCitiesByStateIdUseCase(city_repo)
+        try:
+            yield snapshot_store
+        finally:
+            await snapshot_store.stop()
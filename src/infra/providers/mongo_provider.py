@@ -7,10 +7,12 @@ from dishka import (
     Scope,
     provide,  # type: ignore
 )
+from fastapi import Request
 from pymongo.asynchronous.client_session import AsyncClientSession
 
 from application.repos.iappointment_repo import IAppointmentRepo
 from application.repos.iapproach_repo import IApproachRepo
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.icity_repo import ICityRepo
 from application.repos.icontent_repo import IContentRepo
 from application.repos.ipatient_repo import IPatientRepo
@@ -18,9 +20,15 @@ from application.repos.ipsychologist_repo import IPsychologistRepo
 from application.repos.ispecialty_repo import ISpecialtyRepo
 from application.repos.istate_repo import IStateRepo
 from application.repos.iuser_repo import IUserRepo
+from infra.cache.read_coalescing import ReadCoalescer
+from infra.cache.reference_cache import PendingReferenceInvalidations, ReferenceCache
+from infra.cache.response_cache import PendingInvalidations
 from infra.config.mongo_db_manager import MongoManager
+from infra.config.read_routing import ListingReads
+from infra.config.settings import Settings
 from infra.repos.mongo.appointment_repo import MongoAppointmentRepo
 from infra.repos.mongo.approach_repo import MongoApproachRepo
+from infra.repos.mongo.availability_repo import MongoAvailabilityRepo
 from infra.repos.mongo.city_repo import MongoCityRepo
 from infra.repos.mongo.content_repo import MongoContentRepo
 from infra.repos.mongo.patient_repo import MongoPatientRepo
@@ -36,43 +44,107 @@ class MongoDBProvider(Provider):
         async with MongoManager.connect() as db_manager:
             yield db_manager
 
+    @provide(scope=Scope.APP)
+    def ListingReadsInstance(self, db_manager: MongoManager) -> ListingReads:
+        return db_manager.listing_reads
+
+    @provide(scope=Scope.APP)
+    def ReferenceDataCache(self, db_manager: MongoManager) -> ReferenceCache:
+        # Depende do MongoManager para que o Beanie já esteja inicializado
+        return ReferenceCache(ttl_seconds=Settings().REFERENCE_CACHE_TTL_SECONDS)
+
+    @provide(scope=Scope.APP)
+    def ReadCoalescerInstance(self) -> ReadCoalescer:
+        return ReadCoalescer()
+
     @provide(scope=Scope.REQUEST)
-    async def MongoDBSession(self, db_manager: MongoManager) -> AsyncGenerator[AsyncClientSession]:
-        async with db_manager.get_session() as session:
+    def PendingReferenceInvalidationsInstance(self) -> PendingReferenceInvalidations:
+        return PendingReferenceInvalidations()
+
+    @provide(scope=Scope.REQUEST)
+    async def MongoDBSession(
+        self,
+        request: Request,
+        db_manager: MongoManager,
+        invalidations: PendingInvalidations,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> AsyncGenerator[AsyncClientSession]:
+        # Só as rotas que escrevem abrem transação; as marcadas com ReadOnly recebem uma sessão simples
+        transactional = not getattr(request.state, "read_only", False)
+
+        async with db_manager.get_session(transactional) as session:
             yield session
 
+        # Tabelas de referência e respostas em cache invalidadas pela requisição, só depois do commit
+        reference_invalidations.flush()
+        await invalidations.flush()
+
     @provide(scope=Scope.REQUEST)
     def UserRepo(self, session: AsyncClientSession) -> IUserRepo:
         return MongoUserRepo(session)
 
     @provide(scope=Scope.REQUEST)
-    def PatientRepo(self, session: AsyncClientSession) -> IPatientRepo:
-        return MongoPatientRepo(session)
+    def PatientRepo(
+        self, session: AsyncClientSession, reference_cache: ReferenceCache, listing_reads: ListingReads
+    ) -> IPatientRepo:
+        return MongoPatientRepo(session, reference_cache, listing_reads)
 
     @provide(scope=Scope.REQUEST)
-    def CityRepo(self, session: AsyncClientSession) -> ICityRepo:
-        return MongoCityRepo(session)
+    def CityRepo(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> ICityRepo:
+        return MongoCityRepo(session, reference_cache, reference_invalidations)
 
     @provide(scope=Scope.REQUEST)
-    def StateRepo(self, session: AsyncClientSession) -> IStateRepo:
-        return MongoStateRepo(session)
+    def StateRepo(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> IStateRepo:
+        return MongoStateRepo(session, reference_cache, reference_invalidations)
 
     @provide(scope=Scope.REQUEST)
-    def PsychologistRepo(self, session: AsyncClientSession) -> IPsychologistRepo:
-        return MongoPsychologistRepo(session)
+    def PsychologistRepo(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        listing_reads: ListingReads,
+        read_coalescer: ReadCoalescer,
+    ) -> IPsychologistRepo:
+        return MongoPsychologistRepo(session, reference_cache, listing_reads, read_coalescer)
 
     @provide(scope=Scope.REQUEST)
-    def SpecialtyRepo(self, session: AsyncClientSession) -> ISpecialtyRepo:
-        return MongoSpecialtyRepo(session)
+    def SpecialtyRepo(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> ISpecialtyRepo:
+        return MongoSpecialtyRepo(session, reference_cache, reference_invalidations)
 
     @provide(scope=Scope.REQUEST)
-    def ApproachRepo(self, session: AsyncClientSession) -> IApproachRepo:
-        return MongoApproachRepo(session)
+    def ApproachRepo(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> IApproachRepo:
+        return MongoApproachRepo(session, reference_cache, reference_invalidations)
 
     @provide(scope=Scope.REQUEST)
-    def ContentRepo(self, session: AsyncClientSession) -> IContentRepo:
-        return MongoContentRepo(session)
+    def ContentRepo(
+        self, session: AsyncClientSession, listing_reads: ListingReads, read_coalescer: ReadCoalescer
+    ) -> IContentRepo:
+        return MongoContentRepo(session, listing_reads, read_coalescer)
 
     @provide(scope=Scope.REQUEST)
     def AppointmentRepo(self, session: AsyncClientSession) -> IAppointmentRepo:
         return MongoAppointmentRepo(session)
+
+    @provide(scope=Scope.REQUEST)
+    def AvailabilityRepo(self, session: AsyncClientSession) -> IAvailabilityRepo:
+        return MongoAvailabilityRepo(session)
@@ -5,6 +5,7 @@ from dishka import (
 )
 
 from application.repos.iappointment_repo import IAppointmentRepo
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.icity_repo import ICityRepo
 from application.repos.ipatient_repo import IPatientRepo
 from application.repos.ipsychologist_repo import IPsychologistRepo
@@ -12,6 +13,7 @@ from application.repos.iuser_repo import IUserRepo
 from application.services.iauth_service import IAuthService
 from application.services.ifile_service import IFileService
 from application.services.ipix_payment_service import IPixPaymentService
+from application.services.iresponse_cache import IResponseCache
 from application.use_cases.appointment.cancel_appointment import (
     CancelAppointmentUseCase,
 )
@@ -83,9 +85,13 @@ class PatientProvider(Provider):
         patient_repo: IPatientRepo,
         psychologist_repo: IPsychologistRepo,
         appointment_repo: IAppointmentRepo,
+        availability_repo: IAvailabilityRepo,
         pix_payment_service: IPixPaymentService,
+        response_cache: IResponseCache,
     ) -> SolicitScheduleAppointmentUseCase:
-        return SolicitScheduleAppointmentUseCase(patient_repo, psychologist_repo, appointment_repo, pix_payment_service)
+        return SolicitScheduleAppointmentUseCase(
+            patient_repo, psychologist_repo, appointment_repo, availability_repo, pix_payment_service, response_cache
+        )
 
     @provide(scope=Scope.REQUEST)
     def DeletePatientUseCaseInstance(
@@ -105,26 +111,30 @@ class PatientProvider(Provider):
     def CancelAppointmentUseCaseInstance(
         self,
         appointment_repo: IAppointmentRepo,
-        psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
         patient_repo: IPatientRepo,
+        response_cache: IResponseCache,
     ) -> CancelAppointmentUseCase:
         return CancelAppointmentUseCase(
             appointment_repo=appointment_repo,
-            psychologist_repo=psychologist_repo,
+            availability_repo=availability_repo,
             patient_repo=patient_repo,
+            response_cache=response_cache,
         )
 
     @provide(scope=Scope.REQUEST)
     def RescheduleAppointmentUseCaseInstance(
         self,
         appointment_repo: IAppointmentRepo,
-        psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
         patient_repo: IPatientRepo,
+        response_cache: IResponseCache,
     ) -> RescheduleAppointmentUseCase:
         return RescheduleAppointmentUseCase(
             appointment_repo=appointment_repo,
-            psychologist_repo=psychologist_repo,
+            availability_repo=availability_repo,
             patient_repo=patient_repo,
+            response_cache=response_cache,
         )
 
     @provide(scope=Scope.REQUEST)
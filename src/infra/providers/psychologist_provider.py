@@ -6,12 +6,14 @@ from dishka import (
 
 from application.repos.iappointment_repo import IAppointmentRepo
 from application.repos.iapproach_repo import IApproachRepo
+from application.repos.iavailability_repo import IAvailabilityRepo
 from application.repos.icity_repo import ICityRepo
 from application.repos.ipsychologist_repo import IPsychologistRepo
 from application.repos.ispecialty_repo import ISpecialtyRepo
 from application.repos.iuser_repo import IUserRepo
 from application.services.iauth_service import IAuthService
 from application.services.ifile_service import IFileService
+from application.services.iresponse_cache import IResponseCache
 from application.use_cases.appointment.complete_appointment import (
     CompleteAppointmentUseCase,
 )
@@ -22,6 +24,9 @@ from application.use_cases.psychologist.confirm_payment import ConfirmPaymentUse
 from application.use_cases.psychologist.create_psychologist import (
     CreatePsychologistUseCase,
 )
+from application.use_cases.psychologist.get_psychologist_availabilities import (
+    GetPsychologistAvailabilitiesUseCase,
+)
 from application.use_cases.psychologist.get_psychologist_by_id import (
     GetPsychologistByIdUseCase,
 )
@@ -47,6 +52,7 @@ class PsychologistProvider(Provider):
         city_repo: ICityRepo,
         file_service: IFileService,
         auth_service: IAuthService,
+        response_cache: IResponseCache,
     ) -> CreatePsychologistUseCase:
         return CreatePsychologistUseCase(
             user_repo=user_repo,
@@ -56,6 +62,7 @@ class PsychologistProvider(Provider):
             city_repo=city_repo,
             file_service=file_service,
             auth_service=auth_service,
+            response_cache=response_cache,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -66,12 +73,22 @@ class PsychologistProvider(Provider):
         return GetPsychologistsUseCase(psychologist_repo)
 
     @provide(scope=Scope.REQUEST)
-    def AddAvailabilitiesUseCaseInstance(self, psychologist_repo: IPsychologistRepo) -> AddAvailabilitiesUseCase:
-        return AddAvailabilitiesUseCase(psychologist_repo)
+    def AddAvailabilitiesUseCaseInstance(
+        self,
+        psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
+        response_cache: IResponseCache,
+    ) -> AddAvailabilitiesUseCase:
+        return AddAvailabilitiesUseCase(psychologist_repo, availability_repo, response_cache)
 
     @provide(scope=Scope.REQUEST)
-    def RemoveAvailabilitiesUseCaseInstance(self, psychologist_repo: IPsychologistRepo) -> RemoveAvailabilitiesUseCase:
-        return RemoveAvailabilitiesUseCase(psychologist_repo)
+    def RemoveAvailabilitiesUseCaseInstance(
+        self,
+        psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
+        response_cache: IResponseCache,
+    ) -> RemoveAvailabilitiesUseCase:
+        return RemoveAvailabilitiesUseCase(psychologist_repo, availability_repo, response_cache)
 
     @provide(scope=Scope.REQUEST)
     def UpdatePsychologistUseCaseInstance(
@@ -83,6 +100,7 @@ class PsychologistProvider(Provider):
         approach_repo: IApproachRepo,
         file_service: IFileService,
         auth_service: IAuthService,
+        response_cache: IResponseCache,
     ) -> UpdatePsychologistUseCase:
         return UpdatePsychologistUseCase(
             user_repo=user_repo,
@@ -92,6 +110,7 @@ class PsychologistProvider(Provider):
             approach_repo=approach_repo,
             file_service=file_service,
             auth_service=auth_service,
+            response_cache=response_cache,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -101,6 +120,14 @@ class PsychologistProvider(Provider):
     ) -> GetPsychologistByIdUseCase:
         return GetPsychologistByIdUseCase(psychologist_repo)
 
+    @provide(scope=Scope.REQUEST)
+    def GetPsychologistAvailabilitiesUseCaseInstance(
+        self,
+        psychologist_repo: IPsychologistRepo,
+        availability_repo: IAvailabilityRepo,
+    ) -> GetPsychologistAvailabilitiesUseCase:
+        return GetPsychologistAvailabilitiesUseCase(psychologist_repo, availability_repo)
+
     @provide(scope=Scope.REQUEST)
     def ConfirmPaymentUseCaseInstance(self, appointment_repo: IAppointmentRepo) -> ConfirmPaymentUseCase:
         return ConfirmPaymentUseCase(appointment_repo)
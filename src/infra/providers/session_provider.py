@@ -48,8 +48,7 @@ class SessionProvider(Provider):
                 detail="Token inválido ou expirado",
             )
 
-        tokens = await auth_service.get_tokens(str(decoded.id))
-        if len(tokens) == 0:
+        if not await auth_service.is_session_active(decoded):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Token de autenticação não encontrado. Usuário provavelmente não está logado. Por favor, faça login novamente",
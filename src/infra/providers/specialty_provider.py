@@ -5,6 +5,7 @@ from dishka import (
 )
 
 from application.repos.ispecialty_repo import ISpecialtyRepo
+from application.services.iresponse_cache import IResponseCache
 from application.use_cases.specialty.create_specialty import CreateSpecialtyUseCase
 from application.use_cases.specialty.get_specialties import GetSpecialtiesUseCase
 from application.use_cases.specialty.get_specialty_by_id import GetSpecialtyByIdUseCase
@@ -12,8 +13,10 @@ from application.use_cases.specialty.get_specialty_by_id import GetSpecialtyById
 
 class SpecialtyProvider(Provider):
     @provide(scope=Scope.REQUEST)
-    def CreateSpecialtyUseCaseInstance(self, specialty_repo: ISpecialtyRepo) -> CreateSpecialtyUseCase:
-        return CreateSpecialtyUseCase(specialty_repo)
+    def CreateSpecialtyUseCaseInstance(
+        self, specialty_repo: ISpecialtyRepo, response_cache: IResponseCache
+    ) -> CreateSpecialtyUseCase:
+        return CreateSpecialtyUseCase(specialty_repo, response_cache)
 
     @provide(scope=Scope.REQUEST)
     def GetSpecialtiesUseCaseInstance(self, specialty_repo: ISpecialtyRepo) -> GetSpecialtiesUseCase:
@@ -5,6 +5,7 @@ from dishka import (
 )
 
 from application.repos.iuser_repo import IUserRepo
+from application.services.iresponse_cache import IResponseCache
 from application.use_cases.user.delete_user import DeleteUserUseCase
 
 
@@ -13,5 +14,6 @@ class UserProvider(Provider):
     def DeleteUserUseCaseInstance(
         self,
         user_repo: IUserRepo,
+        response_cache: IResponseCache,
     ) -> DeleteUserUseCase:
-        return DeleteUserUseCase(user_repo)
+        return DeleteUserUseCase(user_repo, response_cache)
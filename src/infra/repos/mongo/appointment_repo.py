@@ -1,17 +1,34 @@
-import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+from uuid import UUID
 
-from beanie import WriteRules
-from pymongo import ASCENDING, DESCENDING
+from pymongo import ASCENDING, DESCENDING, UpdateOne
 from pymongo.asynchronous.client_session import AsyncClientSession
 
 from application.common.page import Page
 from application.common.pageable import Pageable
 from application.filters.appointment_filters import AppointmentFilters
 from application.repos.iappointment_repo import IAppointmentRepo
-from domain.appointment import Appointment
+from domain.appointment import Appointment, AppointmentStatusEnum
 from domain.common.unique_entity_id import UniqueEntityId
+from domain.pix_payment import PaymentStatusEnum
 from infra.mappers.mongo.appointment_mapper import AppointmentMongoMapper
-from infra.models.mongo.appointment_document import AppointmentDocument
+from infra.mappers.mongo.pix_payment_mapper import PixPaymentMongoMapper
+from infra.models.mongo.appointment_document import AppointmentDocument, PixPaymentDocument
+from infra.models.mongo.availability_document import AvailabilityDocument
+
+
+@dataclass(frozen=True)
+class ExpiredPaymentsBatch:
+    scanned: int
+    canceled: int
+    # Pagamentos cujos agendamentos já não aguardam pagamento, retirados das próximas varreduras
+    set_aside: int
+    # Posição (expires_at, _id) do último pagamento varrido, para continuar a varredura
+    resume_after: tuple[datetime, UUID] | None
+    # Psicólogos que tiveram horários liberados
+    psychologist_ids: list[UUID]
 
 
 class MongoAppointmentRepo(IAppointmentRepo):
@@ -21,26 +38,38 @@ class MongoAppointmentRepo(IAppointmentRepo):
         self._session = session
 
     async def create(self, entity: Appointment) -> Appointment:
-        doc = await AppointmentMongoMapper.to_model(entity)
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        doc = AppointmentMongoMapper.to_model(entity)
+        # O pagamento é um documento novo; o agendamento só guarda a referência a ele
+        await doc.pix_payment.insert(session=self._session)  # type: ignore
+        await doc.insert(session=self._session)
 
-        return await AppointmentMongoMapper.to_domain(doc)
+        return entity
 
     async def get_by_id(self, id: UniqueEntityId) -> Appointment | None:
         doc = await AppointmentDocument.find_one(
             AppointmentDocument.id == id.value, fetch_links=True, session=self._session
         )
 
-        return await AppointmentMongoMapper.to_domain(doc) if doc else None
+        return AppointmentMongoMapper.to_domain(doc) if doc else None
 
     async def update(self, entity: Appointment) -> Appointment:
-        doc = await AppointmentMongoMapper.to_model(entity)
-        # save will replace the existing document with same id
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        changes = AppointmentMongoMapper.to_update(entity)
+        pix_payment_changes = PixPaymentMongoMapper.to_update(entity.pix_payment)
+
+        if changes:
+            await AppointmentDocument.get_pymongo_collection().update_one(
+                {"_id": entity.id.value}, {"$set": changes}, session=self._session
+            )
+
+        if pix_payment_changes:
+            await PixPaymentDocument.get_pymongo_collection().update_one(
+                {"_id": entity.pix_payment.id.value}, {"$set": pix_payment_changes}, session=self._session
+            )
+
+        entity.clear_dirty_fields()
+        entity.pix_payment.clear_dirty_fields()
 
-        return await AppointmentMongoMapper.to_domain(doc)
+        return entity
 
     async def get(
         self,
@@ -102,25 +131,109 @@ class MongoAppointmentRepo(IAppointmentRepo):
                 {"$sort": {"is_canceled": ASCENDING, "date": DESCENDING}},
                 {"$skip": pageable.offset()},
                 {"$limit": pageable.limit()},
+                {"$unset": "is_canceled"},
+                # Resolve o link do pagamento na mesma consulta (evita um find_one por linha)
+                {
+                    "$lookup": {
+                        "from": PixPaymentDocument.get_collection_name(),
+                        "localField": "pix_payment.$id",
+                        "foreignField": "_id",
+                        "as": "pix_payment",
+                    }
+                },
+                {"$unwind": "$pix_payment"},
             ]
 
-            raw_docs = await AppointmentDocument.aggregate(pipeline, session=self._session).to_list()
+            docs = await AppointmentDocument.aggregate(
+                pipeline, projection_model=AppointmentDocument, session=self._session
+            ).to_list()
 
-            # Convert raw dicts to AppointmentDocument instances and fetch links
-            docs = []
-            for raw_doc in raw_docs:
-                doc = await AppointmentDocument.find_one(
-                    AppointmentDocument.id == raw_doc["_id"],
-                    fetch_links=True,
-                    session=self._session,
-                )
-                if doc:
-                    docs.append(doc)
-
-        entities = await asyncio.gather(*(AppointmentMongoMapper.to_domain(doc) for doc in docs))
+        entities = [AppointmentMongoMapper.to_domain(doc) for doc in docs]
 
         return Page(
             items=entities,
             total=total,
             pageable=pageable,
         )
+
+    async def cancel_expired_unpaid(
+        self, now: datetime, limit: int, after: tuple[datetime, UUID] | None = None
+    ) -> ExpiredPaymentsBatch:
+        """
+        Varre até `limit` pagamentos PIX pendentes já expirados, dos que expiraram primeiro, a partir de `after`.
+        Cancela os agendamentos deles que ainda aguardam pagamento, libera seus horários e marca esses
+        pagamentos como falhos. Os demais (agendamento informado como pago ou cancelado) continuam pendentes,
+        mas recebem `expiry_swept_at` e não são lidos de novo: nenhum agendamento volta a aguardar pagamento.
+
+        Deve rodar em transação: as atualizações só valem para agendamentos ainda em `waiting_for_payment`,
+        e um pagamento informado ao mesmo tempo gera conflito de escrita em vez de ser cancelado.
+        """
+        pending = PaymentStatusEnum.PENDING.value
+        waiting = AppointmentStatusEnum.WAITING_FOR_PAYMENT.value
+
+        # Índice (status, expiry_swept_at, expires_at, _id)
+        query: dict[str, Any] = {"status": pending, "expiry_swept_at": None, "expires_at": {"$lt": now}}
+        if after is not None:
+            query["$or"] = [{"expires_at": {"$gt": after[0]}}, {"expires_at": after[0], "_id": {"$gt": after[1]}}]
+
+        payments = PixPaymentDocument.get_pymongo_collection()
+        expired = await (
+            payments.find(query, projection={"_id": 1, "expires_at": 1}, session=self._session)
+            .sort([("expires_at", ASCENDING), ("_id", ASCENDING)])
+            .limit(limit)
+            .to_list()
+        )
+        if not expired:
+            return ExpiredPaymentsBatch(scanned=0, canceled=0, set_aside=0, resume_after=None, psychologist_ids=[])
+
+        # Índice pix_payment.$id. Pagamentos de agendamentos já informados como pagos continuam pendentes
+        # até a confirmação do psicólogo: não são cancelados, só retirados da varredura
+        appointments = AppointmentDocument.get_pymongo_collection()
+        unpaid = await appointments.find(
+            {"pix_payment.$id": {"$in": [raw["_id"] for raw in expired]}, "status": waiting},
+            projection={"_id": 1, "psychologist_id": 1, "availability_id": 1, "pix_payment": 1},
+            session=self._session,
+        ).to_list()
+
+        if unpaid:
+            await appointments.update_many(
+                {"_id": {"$in": [raw["_id"] for raw in unpaid]}, "status": waiting},
+                {"$set": {"status": AppointmentStatusEnum.CANCELED.value}},
+                session=self._session,
+            )
+
+            releases = [
+                UpdateOne(
+                    {"_id": raw["availability_id"], "psychologist_id": raw["psychologist_id"], "available": False},
+                    {"$set": {"available": True}},
+                )
+                for raw in unpaid
+                if raw.get("availability_id")
+            ]
+            if releases:
+                await AvailabilityDocument.get_pymongo_collection().bulk_write(
+                    releases, ordered=False, session=self._session
+                )
+
+            await payments.update_many(
+                {"_id": {"$in": [raw["pix_payment"].id for raw in unpaid]}, "status": pending},
+                {"$set": {"status": PaymentStatusEnum.FAILED.value}},
+                session=self._session,
+            )
+
+        unpaid_payment_ids = {raw["pix_payment"].id for raw in unpaid}
+        set_aside = [raw["_id"] for raw in expired if raw["_id"] not in unpaid_payment_ids]
+        if set_aside:
+            await payments.update_many(
+                {"_id": {"$in": set_aside}, "status": pending},
+                {"$set": {"expiry_swept_at": now}},
+                session=self._session,
+            )
+
+        return ExpiredPaymentsBatch(
+            scanned=len(expired),
+            canceled=len(unpaid),
+            set_aside=len(set_aside),
+            resume_after=(expired[-1]["expires_at"], expired[-1]["_id"]),
+            psychologist_ids=list({raw["psychologist_id"] for raw in unpaid if raw.get("availability_id")}),
+        )
@@ -1,6 +1,3 @@
-import asyncio
-
-from beanie.operators import In
 from pymongo import ASCENDING, DESCENDING
 from pymongo.asynchronous.client_session import AsyncClientSession
 
@@ -10,31 +7,37 @@ from application.filters.approach_filters import ApproachFilters
 from application.repos.iapproach_repo import IApproachRepo
 from domain.approach import Approach
 from domain.common.unique_entity_id import UniqueEntityId
+from infra.cache.reference_cache import PendingReferenceInvalidations, ReferenceCache
 from infra.mappers.mongo.approach_mapper import ApproachMongoMapper
 from infra.models.mongo.approach_document import ApproachDocument
 
 
 class MongoApproachRepo(IApproachRepo):
     _session: AsyncClientSession
+    _reference_cache: ReferenceCache
+    _reference_invalidations: PendingReferenceInvalidations
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> None:
         self._session = session
+        self._reference_cache = reference_cache
+        self._reference_invalidations = reference_invalidations
 
     async def create(self, entity: Approach) -> Approach:
-        doc = await ApproachMongoMapper.to_model(entity)
+        doc = ApproachMongoMapper.to_model(entity)
         await doc.save(session=self._session)
-        return await ApproachMongoMapper.to_domain(doc)
+        self._reference_invalidations.invalidate(self._reference_cache.approaches)
+        return ApproachMongoMapper.to_domain(doc)
 
     async def get_by_id(self, id: UniqueEntityId) -> Approach | None:
-        doc = await ApproachDocument.find_one(ApproachDocument.id == id.value, session=self._session)
-        return await ApproachMongoMapper.to_domain(doc) if doc else None
+        return await self._reference_cache.approaches.get_by_id(id, self._session)
 
     async def get_by_ids(self, ids: list[UniqueEntityId]) -> list[Approach]:
-        docs = await ApproachDocument.find(
-            In(ApproachDocument.id, [id.value for id in ids]), session=self._session
-        ).to_list()
-
-        return await asyncio.gather(*(ApproachMongoMapper.to_domain(doc) for doc in docs))
+        return await self._reference_cache.approaches.get_by_ids(ids, self._session)
 
     async def get(
         self,
@@ -63,7 +66,7 @@ class MongoApproachRepo(IApproachRepo):
         find_query = find_query.skip(pageable.offset()).limit(pageable.limit())
         docs = await find_query.to_list()
 
-        entities = await asyncio.gather(*(ApproachMongoMapper.to_domain(doc) for doc in docs))
+        entities = [ApproachMongoMapper.to_domain(doc) for doc in docs]
 
         return Page(
             items=entities,
@@ -0,0 +1,144 @@
+from datetime import datetime
+from typing import Any
+
+from beanie.operators import In
+from pymongo import UpdateOne
+from pymongo.asynchronous.client_session import AsyncClientSession
+
+from application.repos.iavailability_repo import IAvailabilityRepo
+from domain.availability import Availability
+from domain.common.unique_entity_id import UniqueEntityId
+from infra.mappers.mongo.availability_mapper import AvailabilityMongoMapper
+from infra.models.mongo.availability_document import AvailabilityDocument
+from infra.models.mongo.user_document import UserDocument
+
+
+class MongoAvailabilityRepo(IAvailabilityRepo):
+    _session: AsyncClientSession
+
+    def __init__(self, session: AsyncClientSession) -> None:
+        self._session = session
+
+    async def create_many(self, psychologist_id: UniqueEntityId, entities: list[Availability]) -> None:
+        if not entities:
+            return
+
+        # Upsert por (psychologist_id, date): reenviar um horário existente não duplica nem falha
+        operations = [
+            UpdateOne(
+                {"psychologist_id": psychologist_id.value, "date": entity.normalized_date},
+                {"$setOnInsert": {"_id": entity.id.value, "available": entity.available}},
+                upsert=True,
+            )
+            for entity in entities
+        ]
+        await AvailabilityDocument.get_pymongo_collection().bulk_write(operations, ordered=False, session=self._session)
+
+    async def delete_available(self, psychologist_id: UniqueEntityId, ids: list[UniqueEntityId]) -> int:
+        if not ids:
+            return 0
+
+        result = await AvailabilityDocument.find(
+            AvailabilityDocument.psychologist_id == psychologist_id.value,
+            In(AvailabilityDocument.id, [id.value for id in ids]),
+            AvailabilityDocument.available == True,
+            session=self._session,
+        ).delete(session=self._session)
+
+        return result.deleted_count if result else 0
+
+    async def get_by_psychologist_id(self, psychologist_id: UniqueEntityId) -> list[Availability]:
+        docs = (
+            await AvailabilityDocument.find(
+                AvailabilityDocument.psychologist_id == psychologist_id.value, session=self._session
+            )
+            .sort([("date", 1)])  # type: ignore
+            .to_list()
+        )
+
+        return [AvailabilityMongoMapper.to_domain(doc) for doc in docs]
+
+    async def get_between(
+        self, psychologist_id: UniqueEntityId, start: datetime, end: datetime, only_available: bool = False
+    ) -> list[Availability]:
+        # Faixa do índice (psychologist_id, date): lê apenas as entradas da janela, já ordenadas por data
+        query: dict[str, Any] = {
+            "psychologist_id": psychologist_id.value,
+            "date": {"$gte": Availability.normalize_datetime(start), "$lte": Availability.normalize_datetime(end)},
+        }
+        if only_available:
+            query["available"] = True
+
+        cursor = AvailabilityDocument.get_pymongo_collection().find(query, session=self._session).sort("date", 1)
+
+        return [AvailabilityMongoMapper.to_domain(AvailabilityDocument.model_validate(raw)) async for raw in cursor]
+
+    async def reserve_availability(self, psychologist_id: UniqueEntityId, date: datetime) -> UniqueEntityId | None:
+        doc = await AvailabilityDocument.get_pymongo_collection().find_one_and_update(
+            {
+                "psychologist_id": psychologist_id.value,
+                "date": Availability.normalize_datetime(date),
+                "available": True,
+            },
+            {"$set": {"available": False}},
+            projection={"_id": 1},
+            session=self._session,
+        )
+
+        return UniqueEntityId(doc["_id"]) if doc else None
+
+    async def release_availability(self, psychologist_id: UniqueEntityId, id: UniqueEntityId) -> bool:
+        result = await AvailabilityDocument.get_pymongo_collection().update_one(
+            {"_id": id.value, "psychologist_id": psychologist_id.value, "available": False},
+            {"$set": {"available": True}},
+            session=self._session,
+        )
+
+        return result.modified_count == 1
+
+    @staticmethod
+    async def migrate_embedded_availabilities() -> int:
+        """Move as disponibilidades que ainda estão embutidas em `users.availabilities` para `availability_slots`."""
+        users = UserDocument.get_pymongo_collection()
+        embedded = {"availabilities": {"$exists": True}}
+
+        if await users.count_documents(embedded, limit=1) == 0:
+            return 0
+
+        cursor = await users.aggregate(
+            [
+                {"$match": embedded},
+                {"$unwind": "$availabilities"},
+                {
+                    "$project": {
+                        "_id": "$availabilities._id",
+                        "psychologist_id": "$_id",
+                        "date": "$availabilities.date",
+                        "available": "$availabilities.available",
+                    }
+                },
+                # O cadastro antigo só descartava datas já existentes, não as repetidas no mesmo lote: uma data pode
+                # aparecer mais de uma vez. Fica uma por data, a reservada se houver, por causa do índice único
+                {"$sort": {"available": 1, "_id": 1}},
+                {
+                    "$group": {
+                        "_id": {"psychologist_id": "$psychologist_id", "date": "$date"},
+                        "slot": {"$first": "$$ROOT"},
+                    }
+                },
+                {"$replaceRoot": {"newRoot": "$slot"}},
+                {
+                    "$merge": {
+                        "into": AvailabilityDocument.get_collection_name(),
+                        "on": ["psychologist_id", "date"],
+                        "whenMatched": "keepExisting",
+                        "whenNotMatched": "insert",
+                    }
+                },
+            ],
+            allowDiskUse=True,
+        )
+        await cursor.to_list()
+
+        result = await users.update_many(embedded, {"$unset": {"availabilities": ""}})
+        return result.modified_count
@@ -1,36 +1,37 @@
-import asyncio
-
 from beanie import WriteRules
 from pymongo.asynchronous.client_session import AsyncClientSession
 
 from application.repos.icity_repo import ICityRepo
 from domain.city import City
 from domain.common.unique_entity_id import UniqueEntityId
+from infra.cache.reference_cache import PendingReferenceInvalidations, ReferenceCache
 from infra.mappers.mongo.city_mapper import CityMongoMapper
-from infra.models.mongo.city_document import CityDocument
 
 
 class MongoCityRepo(ICityRepo):
     _session: AsyncClientSession
-
-    def __init__(self, session: AsyncClientSession) -> None:
+    _reference_cache: ReferenceCache
+    _reference_invalidations: PendingReferenceInvalidations
+
+    def __init__(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> None:
         self._session = session
+        self._reference_cache = reference_cache
+        self._reference_invalidations = reference_invalidations
 
     async def create(self, entity: City) -> City:
-        doc = await CityMongoMapper.to_model(entity)
+        doc = CityMongoMapper.to_model(entity)
         await doc.save(link_rule=WriteRules.WRITE, session=self._session)
+        self._reference_invalidations.invalidate(self._reference_cache.cities)
 
-        return await CityMongoMapper.to_domain(doc)
+        return CityMongoMapper.to_domain(doc)
 
     async def get_by_id(self, id: UniqueEntityId) -> City | None:
-        doc = await CityDocument.find_one(CityDocument.id == id.value, fetch_links=True, session=self._session)
-        return await CityMongoMapper.to_domain(doc) if doc else None
+        return await self._reference_cache.cities.get_by_id(id, self._session)
 
     async def get_all_by_state_id(self, state_id: UniqueEntityId):
-        docs = await CityDocument.find(
-            CityDocument.state.id == state_id.value,
-            fetch_links=True,
-            session=self._session,
-        ).to_list()
-
-        return await asyncio.gather(*(CityMongoMapper.to_domain(doc) for doc in docs))
+        return await self._reference_cache.cities.get_group(state_id.value)
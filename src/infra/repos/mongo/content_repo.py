@@ -1,4 +1,3 @@
-from beanie import WriteRules
 from pymongo import ASCENDING, DESCENDING
 from pymongo.asynchronous.client_session import AsyncClientSession
 
@@ -8,56 +7,67 @@ from application.filters.content_filters import ContentFilters
 from application.repos.icontent_repo import IContentRepo
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.content import Content
+from infra.cache.read_coalescing import ReadCoalescer
+from infra.config.read_routing import ListingReads
 from infra.mappers.mongo.content_mapper import ContentMongoMapper
 from infra.models.mongo.content_document import ContentDocument
 
 
 class MongoContentRepo(IContentRepo):
     _session: AsyncClientSession
+    _listing_reads: ListingReads
+    _read_coalescer: ReadCoalescer
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(self, session: AsyncClientSession, listing_reads: ListingReads, read_coalescer: ReadCoalescer) -> None:
         self._session = session
+        self._listing_reads = listing_reads
+        self._read_coalescer = read_coalescer
 
     async def create(self, entity: Content) -> Content:
-        doc = await ContentMongoMapper.to_model(entity)
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        doc = ContentMongoMapper.to_model(entity)
+        await doc.insert(session=self._session)
 
-        return await ContentMongoMapper.to_domain(doc)
+        return entity
 
     async def get_by_id(self, id: UniqueEntityId) -> Content | None:
-        doc = await ContentDocument.find_one(ContentDocument.id == id.value, fetch_links=True, session=self._session)
+        if self._session.in_transaction:
+            return await self._find_by_id(id, self._session)
 
-        return await ContentMongoMapper.to_domain(doc) if doc else None
+        # Fora de transação, buscas simultâneas do mesmo conteúdo compartilham uma consulta sem sessão
+        return await self._read_coalescer.contents.run(id.value, lambda: self._find_by_id(id, None))
+
+    async def _find_by_id(self, id: UniqueEntityId, session: AsyncClientSession | None) -> Content | None:
+        doc = await ContentDocument.find_one(ContentDocument.id == id.value, fetch_links=True, session=session)
+
+        return ContentMongoMapper.to_domain(doc) if doc else None
 
     async def get(self, pageable: Pageable, filters: ContentFilters | None = None) -> Page[Content]:
-        filters_exprs: list[object] = []
+        query: dict[str, object] = {}
 
         if filters:
             if filters.title:
-                filters_exprs.append({"title": {"$regex": filters.title, "$options": "i"}})
+                query["title"] = {"$regex": filters.title, "$options": "i"}
             if filters.author_id:
-                filters_exprs.append(ContentDocument.author.id == filters.author_id)
+                query["author.$id"] = filters.author_id
 
-        find_query = ContentDocument.find(
-            *filters_exprs if filters_exprs else {},
-            fetch_links=True,
-            session=self._session,
-        )
-        total = await find_query.count()
+        # Listagem: pode ir para um secundário. O autor não é carregado, o mapper usa só o author_id
+        collection = self._listing_reads.collection(ContentDocument)
+        total = await collection.count_documents(query, session=self._session)
 
         if pageable.sort:
             direction_dict = {"asc": ASCENDING, "desc": DESCENDING}
             sort_list = [(field_name, direction_dict[direction.value]) for field_name, direction in pageable.sort]
-            find_query = find_query.sort(sort_list)  # type: ignore
         else:
-            find_query = find_query.sort([("created_at", -1)])  # type: ignore
-
-        find_query = find_query.skip(pageable.offset()).limit(pageable.limit())
+            sort_list = [("created_at", DESCENDING)]
 
-        docs = await find_query.to_list()
+        raw_docs = (
+            collection.find(query, session=self._session)
+            .sort(sort_list)
+            .skip(pageable.offset())
+            .limit(pageable.limit())
+        )
 
-        entities = [await ContentMongoMapper.to_domain(doc) for doc in docs]
+        entities = [ContentMongoMapper.to_domain(ContentDocument.model_validate(raw)) async for raw in raw_docs]
 
         return Page[Content](
             items=entities,
@@ -66,11 +76,16 @@ class MongoContentRepo(IContentRepo):
         )
 
     async def update(self, entity: Content) -> Content:
-        doc = await ContentMongoMapper.to_model(entity)
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        changes = ContentMongoMapper.to_update(entity)
+
+        if changes:
+            await ContentDocument.get_pymongo_collection().update_one(
+                {"_id": entity.id.value}, {"$set": changes}, session=self._session
+            )
+
+        entity.clear_dirty_fields()
 
-        return await ContentMongoMapper.to_domain(doc)
+        return entity
 
     async def delete(self, id: UniqueEntityId) -> bool:
         result = await ContentDocument.find_one(ContentDocument.id == id.value, session=self._session)
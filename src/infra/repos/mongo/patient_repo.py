@@ -1,7 +1,5 @@
-import asyncio
 from datetime import datetime
 
-from beanie import WriteRules
 from pymongo import ASCENDING, DESCENDING
 from pymongo.asynchronous.client_session import AsyncClientSession
 
@@ -12,34 +10,46 @@ from application.repos.ipatient_repo import IPatientRepo
 from domain.appointment import Appointment
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.patient import Patient
+from infra.cache.reference_cache import ReferenceCache
+from infra.config.read_routing import ListingReads
 from infra.mappers.mongo.patient_mapper import PatientMongoMapper
 from infra.models.mongo.patient_document import PatientDocument
 
 
 class MongoPatientRepo(IPatientRepo):
     _session: AsyncClientSession
+    _reference_cache: ReferenceCache
+    _listing_reads: ListingReads
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self, session: AsyncClientSession, reference_cache: ReferenceCache, listing_reads: ListingReads
+    ) -> None:
         self._session = session
+        self._reference_cache = reference_cache
+        self._listing_reads = listing_reads
 
     async def create(self, entity: Patient) -> Patient:
-        doc = await PatientMongoMapper.to_model(entity)
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        doc = PatientMongoMapper.to_model(entity)
+        await doc.insert(session=self._session)
 
-        return await PatientMongoMapper.to_domain(doc)
+        return entity
 
     async def update(self, entity: Patient) -> Patient:
-        doc = await PatientMongoMapper.to_model(entity)
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        changes = PatientMongoMapper.to_update(entity)
 
-        return await PatientMongoMapper.to_domain(doc)
+        if changes:
+            await PatientDocument.get_pymongo_collection().update_one(
+                {"_id": entity.id.value}, {"$set": changes}, session=self._session
+            )
+
+        entity.clear_dirty_fields()
+
+        return entity
 
     async def get_by_id(self, id: UniqueEntityId) -> Patient | None:
-        doc = await PatientDocument.find_one(PatientDocument.id == id.value, fetch_links=True, session=self._session)
+        doc = await PatientDocument.find_one(PatientDocument.id == id.value, session=self._session)
 
-        return await PatientMongoMapper.to_domain(doc) if doc else None
+        return (await self._to_domain([doc]))[0] if doc else None
 
     async def get(
         self,
@@ -54,30 +64,47 @@ class MongoPatientRepo(IPatientRepo):
             if filters.email:
                 query_conditions["email"] = {"$regex": filters.email, "$options": "i"}
 
-        find_query = PatientDocument.find(
-            query_conditions if query_conditions else {},
-            fetch_links=True,
-            session=self._session,
-        )
-        total = await find_query.count()
+        # Listagem: pode ir para um secundário
+        collection = self._listing_reads.collection(PatientDocument)
+        total = await collection.count_documents(query_conditions, session=self._session)
 
         if pageable.sort:
             direction_dict = {"asc": ASCENDING, "desc": DESCENDING}
             sort_list = [(field_name, direction_dict[direction.value]) for field_name, direction in pageable.sort]
-            find_query = find_query.sort(sort_list)  # type: ignore
         else:
-            find_query = find_query.sort([("name", 1)])  # type: ignore
+            sort_list = [("name", ASCENDING)]
 
-        find_query = find_query.skip(pageable.offset()).limit(pageable.limit())
-        docs = await find_query.to_list()
+        raw_docs = (
+            collection.find(query_conditions, session=self._session)
+            .sort(sort_list)
+            .skip(pageable.offset())
+            .limit(pageable.limit())
+        )
+        docs = [PatientDocument.model_validate(raw) async for raw in raw_docs]
 
-        entities = await asyncio.gather(*(PatientMongoMapper.to_domain(doc) for doc in docs))
+        entities = await self._to_domain(docs)
         return Page(
             items=entities,
             total=total,
             pageable=pageable,
         )
 
+    async def _to_domain(self, docs: list[PatientDocument]) -> list[Patient]:
+        """Resolve a cidade pelo cache de referência em vez de `fetch_links`."""
+        await self._reference_cache.cities.refresh()
+
+        entities: list[Patient] = []
+        for doc in docs:
+            city = self._reference_cache.cities.peek(doc.city.ref.id)  # type: ignore
+
+            if city is None:
+                # Cidade criada depois da última carga do cache: busca o link do próprio documento
+                await doc.fetch_all_links()
+
+            entities.append(PatientMongoMapper.to_domain(doc, city))
+
+        return entities
+
     async def delete(self, id: UniqueEntityId) -> bool:
         doc = await PatientDocument.find_one(PatientDocument.id == id.value, session=self._session)
         if doc:
@@ -1,155 +1,245 @@
-# uuid.UUID not required here
-import asyncio
+import base64
+import json
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+from uuid import UUID
 
-from beanie import WriteRules
+from pydantic import BaseModel
 from pymongo.asynchronous.client_session import AsyncClientSession
+from pymongo.asynchronous.collection import AsyncCollection
 
+from application.common.exception import ApplicationException
 from application.common.page import Page
 from application.common.pageable import Pageable
 from application.filters.psychologist_filters import PsychologistFilters
 from application.repos.ipsychologist_repo import IPsychologistRepo
+from domain.availability import Availability
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.psychologist import Psychologist
+from infra.cache.read_coalescing import ReadCoalescer
+from infra.cache.reference_cache import ReferenceCache
+from infra.config.read_routing import ListingReads
 from infra.mappers.mongo.psychologist_mapper import PsychologistMongoMapper
+from infra.mappers.mongo.psychologist_search_mapper import PsychologistSearchMongoMapper
+from infra.models.mongo.availability_document import AvailabilityDocument
 from infra.models.mongo.psychologist_document import PsychologistDocument
+from infra.models.mongo.psychologist_search_document import PsychologistSearchDocument
+
+# Campos do psicólogo copiados para a projeção `psychologist_search`
+SEARCH_PROJECTION_FIELDS = frozenset(
+    {"name", "gender", "value_per_appointment", "audiences", "specialties", "approaches", "city"}
+)
+
+SEARCH_WEIGHTS = {
+    "gender": 10,
+    "specialty_ids": 40,
+    "approach_ids": 30,
+    "audiences": 15,
+    "max_price": 5,
+}
+
+
+class _PsychologistPricing(BaseModel):
+    value_per_appointment: float
+
+
+def _encode_cursor(score: float, id: UUID, next_slot: datetime | None = None) -> str:
+    payload: dict[str, Any] = {"score": score, "id": str(id)}
+    if next_slot is not None:
+        # Busca por horário livre: o próximo horário desempata o score
+        payload["slot"] = next_slot.isoformat()
+
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[float | None, UUID | None, datetime | None]:
+    """Cursor vazio inicia a paginação por cursor a partir do primeiro item."""
+    if not cursor:
+        return None, None, None
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        next_slot = datetime.fromisoformat(payload["slot"]) if "slot" in payload else None
+        return float(payload["score"]), UUID(payload["id"]), next_slot
+    except (ValueError, KeyError, TypeError) as e:
+        raise ApplicationException("Cursor de paginação inválido.") from e
 
 
 class MongoPsychologistRepo(IPsychologistRepo):
     _session: AsyncClientSession
+    _reference_cache: ReferenceCache
+    _listing_reads: ListingReads
+    _read_coalescer: ReadCoalescer
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        listing_reads: ListingReads,
+        read_coalescer: ReadCoalescer,
+    ) -> None:
         self._session = session
+        self._reference_cache = reference_cache
+        self._listing_reads = listing_reads
+        self._read_coalescer = read_coalescer
 
     async def create(self, entity: Psychologist) -> Psychologist:
-        doc = await PsychologistMongoMapper.to_model(entity)
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        doc = PsychologistMongoMapper.to_model(entity)
+        await doc.insert(session=self._session)
+        await self._save_search_projection(entity)
 
-        return await PsychologistMongoMapper.to_domain(doc)
+        return entity
 
     async def update(self, entity: Psychologist) -> Psychologist:
-        doc = await PsychologistMongoMapper.to_model(entity)
-        await doc.save(link_rule=WriteRules.WRITE, session=self._session)
-        await doc.fetch_all_links()
+        changes = PsychologistMongoMapper.to_update(entity)
+
+        if changes:
+            await PsychologistDocument.get_pymongo_collection().update_one(
+                {"_id": entity.id.value}, {"$set": changes}, session=self._session
+            )
+
+        if not entity.dirty_fields.isdisjoint(SEARCH_PROJECTION_FIELDS):
+            await self._save_search_projection(entity)
+
+        entity.clear_dirty_fields()
 
-        return await PsychologistMongoMapper.to_domain(doc)
+        return entity
 
     async def get_by_id(self, id: UniqueEntityId) -> Psychologist | None:
-        doc = await PsychologistDocument.find_one(
-            PsychologistDocument.id == id.value, fetch_links=True, session=self._session
+        if self._session.in_transaction:
+            return await self._find_by_id(id, self._session)
+
+        # Fora de transação, buscas simultâneas do mesmo perfil compartilham uma consulta sem sessão
+        return await self._read_coalescer.psychologists.run(id.value, lambda: self._find_by_id(id, None))
+
+    async def _find_by_id(self, id: UniqueEntityId, session: AsyncClientSession | None) -> Psychologist | None:
+        doc = await PsychologistDocument.find_one(PsychologistDocument.id == id.value, session=session)
+
+        if not doc:
+            return None
+
+        availabilities = await self._get_availabilities(
+            [doc.id], AvailabilityDocument.get_pymongo_collection(), session, self._availabilities_since(session)
+        )
+
+        return (await self._to_domain([doc], availabilities))[0]
+
+    async def get_value_per_appointment(self, id: UniqueEntityId) -> float | None:
+        pricing = await PsychologistDocument.find_one(
+            PsychologistDocument.id == id.value,
+            projection_model=_PsychologistPricing,
+            session=self._session,
         )
 
-        return await PsychologistMongoMapper.to_domain(doc) if doc else None
+        return pricing.value_per_appointment if pricing else None
 
     async def get(
         self,
         pageable: Pageable,
         filters: PsychologistFilters | None = None,
     ) -> Page[Psychologist]:
-        WEIGHTS = {
-            "gender": 10,
-            "specialty_ids": 40,
-            "approach_ids": 30,
-            "audiences": 15,
-            "max_price": 5,
-        }
-        pipeline = []
-
-        if filters:
-            scores = []
-
-            if filters.gender:
-                scores.append(
-                    {
-                        "$cond": {
-                            "if": {"$eq": ["$gender", filters.gender]},
-                            "then": WEIGHTS["gender"],
-                            "else": 0,
-                        }
-                    }
-                )
+        scores, conditions = self._build_search_criteria(filters)
+        score_stage = {"$addFields": {"score": {"$add": scores} if scores else {"$literal": 0}}}
+        # Sem filtros todos são "candidatos" com score 0
+        match: dict[str, Any] = {"$or": conditions} if conditions else {}
+        sort_stage = {"$sort": {"score": -1, "_id": 1}}
+        limit = pageable.limit()
+        total: int | None = None
+        # Busca é leitura de listagem: pode ir para um secundário
+        search = self._listing_reads.collection(PsychologistSearchDocument)
 
-            if filters.max_price:
-                scores.append(
+        if filters and (filters.available_from is not None or filters.available_to is not None):
+            ranked, total, has_more = await self._search_available(filters, score_stage, pageable)
+        elif pageable.cursor is None:
+            offset = pageable.offset()
+            cursor = await search.aggregate(
+                [
+                    {"$match": match},
                     {
-                        "$cond": {
-                            "if": {"$lte": ["$price_per_session", filters.max_price]},
-                            "then": WEIGHTS["max_price"],
-                            "else": 0,
+                        "$facet": {
+                            "items": [
+                                score_stage,
+                                sort_stage,
+                                {"$skip": offset},
+                                {"$limit": limit},
+                                {"$project": {"_id": 1, "score": 1}},
+                            ],
+                            "matched": [{"$count": "count"}],
                         }
-                    }
-                )
+                    },
+                ],
+                session=self._session,
+            )
+            result = await cursor.to_list()
+            ranked: list[dict[str, Any]] = result[0]["items"]
+            matched = result[0]["matched"][0]["count"] if result[0]["matched"] else 0
+            total = matched
 
-            if filters.approach_ids and len(filters.approach_ids) > 0:
-                scores.append(
-                    {
-                        "$multiply": [
-                            {
-                                "$divide": [
-                                    {
-                                        "$size": {
-                                            "$setIntersection": [
-                                                "$approaches.$id",
-                                                [*filters.approach_ids],
-                                            ]
-                                        }
-                                    },
-                                    len(filters.approach_ids),
-                                ]
-                            },
-                            WEIGHTS["approach_ids"],
-                        ]
-                    }
-                )
+            if conditions:
+                # O ranking inclui todos os psicólogos: os que não atendem a nenhum critério têm score 0
+                total = await search.estimated_document_count()
 
-            if filters.specialty_ids and len(filters.specialty_ids) > 0:
-                scores.append(
-                    {
-                        "$multiply": [
-                            {
-                                "$divide": [
-                                    {
-                                        "$size": {
-                                            "$setIntersection": [
-                                                "$specialties.$id",
-                                                [*filters.specialty_ids],
-                                            ]
-                                        }
-                                    },
-                                    len(filters.specialty_ids),
-                                ]
-                            },
-                            WEIGHTS["approach_ids"],
-                        ]
-                    }
-                )
+                if len(ranked) < limit:
+                    ranked += await self._search_unmatched(
+                        conditions, skip=max(offset - matched, 0), limit=limit - len(ranked)
+                    )
 
-            if filters.audiences:
-                scores.append(
-                    {
-                        "$multiply": [
-                            {
-                                "$divide": [
-                                    {
-                                        "$size": {
-                                            "$setIntersection": [
-                                                "$audiences",
-                                                [*filters.audiences],
-                                            ]
-                                        }
-                                    },
-                                    len(filters.audiences),
+            has_more = offset + len(ranked) < total
+        else:
+            last_score, last_id, _ = _decode_cursor(pageable.cursor)
+            ranked = []
+
+            if last_score is None or last_score > 0 or not conditions:
+                pipeline: list[dict[str, Any]] = [{"$match": match}, score_stage]
+                if last_score is not None:
+                    pipeline.append(
+                        {
+                            "$match": {
+                                "$or": [
+                                    {"score": {"$lt": last_score}},
+                                    {"score": last_score, "_id": {"$gt": last_id}},
                                 ]
-                            },
-                            WEIGHTS["approach_ids"],
-                        ]
-                    }
-                )
+                            }
+                        }
+                    )
+                pipeline += [sort_stage, {"$limit": limit}, {"$project": {"_id": 1, "score": 1}}]
 
-            pipeline.append({"$addFields": {"score": {"$add": scores}}})
-            pipeline.append({"$sort": {"score": -1}})
+                ranked = await (await search.aggregate(pipeline, session=self._session)).to_list()
 
-        pipeline += [
+            if conditions and len(ranked) < limit:
+                after_id = last_id if last_score == 0 and not ranked else None
+                ranked += await self._search_unmatched(conditions, skip=0, limit=limit - len(ranked), after_id=after_id)
+
+            has_more = len(ranked) == limit
+
+        ids: list[UUID] = [raw["_id"] for raw in ranked]
+        raw_docs = self._listing_reads.collection(PsychologistDocument).find(
+            {"_id": {"$in": ids}}, session=self._session
+        )
+        docs_by_id = {raw["_id"]: PsychologistDocument.model_validate(raw) async for raw in raw_docs}
+        availabilities = await self._get_availabilities(
+            ids,
+            self._listing_reads.collection(AvailabilityDocument),
+            self._session,
+            self._availabilities_since(self._session),
+        )
+
+        entities = await self._to_domain([docs_by_id[id] for id in ids if id in docs_by_id], availabilities)
+
+        return Page(
+            items=entities,
+            total=total,
+            pageable=pageable,
+            next_cursor=_encode_cursor(ranked[-1]["score"], ranked[-1]["_id"], ranked[-1].get("next_slot"))
+            if ranked and has_more
+            else None,
+        )
+
+    @staticmethod
+    async def rebuild_search_projection() -> int:
+        """Recria a coleção `psychologist_search` a partir dos psicólogos cadastrados."""
+        pipeline: list[dict[str, Any]] = [
             {
                 "$lookup": {
                     "from": "specialties",
@@ -166,34 +256,274 @@ class MongoPsychologistRepo(IPsychologistRepo):
                     "as": "approaches",
                 }
             },
+            {"$lookup": {"from": "cities", "localField": "city.$id", "foreignField": "_id", "as": "city"}},
+            {"$unwind": "$city"},
+            {"$lookup": {"from": "states", "localField": "city.state.$id", "foreignField": "_id", "as": "state"}},
+            {"$unwind": "$state"},
             {
-                "$lookup": {
-                    "from": "cities",
-                    "localField": "city.$id",
-                    "foreignField": "_id",
-                    "as": "city",
+                "$project": {
+                    "name": 1,
+                    "gender": 1,
+                    "price": "$value_per_appointment",
+                    "audiences": 1,
+                    "specialty_ids": "$specialties._id",
+                    "specialty_names": "$specialties.name",
+                    "approach_ids": "$approaches._id",
+                    "approach_names": "$approaches.name",
+                    "city_id": "$city._id",
+                    "city_name": "$city.name",
+                    "state_id": "$state._id",
+                    "state_name": "$state.name",
+                    "state_abbreviation": "$state.abbreviation",
+                }
+            },
+            {
+                "$merge": {
+                    "into": PsychologistSearchDocument.get_collection_name(),
+                    "on": "_id",
+                    "whenMatched": "replace",
+                    "whenNotMatched": "insert",
                 }
             },
-            {"$unwind": {"path": "$city", "preserveNullAndEmptyArrays": True}},
+        ]
+
+        await PsychologistDocument.aggregate(pipeline).to_list()
+
+        return await PsychologistSearchDocument.count()
+
+    async def _to_domain(
+        self, docs: list[PsychologistDocument], availabilities: dict[UUID, list[AvailabilityDocument]]
+    ) -> list[Psychologist]:
+        """
+        Resolve cidade, especialidades e abordagens pelo cache de referência em vez de `fetch_links`.
+
+        As tabelas são conferidas uma vez por página; o mapeamento de cada documento é síncrono.
+        """
+        await self._reference_cache.cities.refresh()
+        await self._reference_cache.specialties.refresh()
+        await self._reference_cache.approaches.refresh()
+
+        entities: list[Psychologist] = []
+        for doc in docs:
+            entity = self._map_with_references(doc, availabilities.get(doc.id))
+
+            if entity is None:
+                # Referência criada depois da última carga do cache: busca os links do próprio documento
+                await doc.fetch_all_links()
+                entity = PsychologistMongoMapper.to_domain(doc, availabilities.get(doc.id))
+
+            entities.append(entity)
+
+        return entities
+
+    def _map_with_references(
+        self, doc: PsychologistDocument, availabilities: list[AvailabilityDocument] | None
+    ) -> Psychologist | None:
+        specialty_ids: list[UUID] = [link.ref.id for link in doc.specialties]  # type: ignore
+        approach_ids: list[UUID] = [link.ref.id for link in doc.approaches]  # type: ignore
+
+        city = self._reference_cache.cities.peek(doc.city.ref.id)  # type: ignore
+        specialties = self._reference_cache.specialties.peek_many(specialty_ids)
+        approaches = self._reference_cache.approaches.peek_many(approach_ids)
+
+        if city is None or len(specialties) != len(specialty_ids) or len(approaches) != len(approach_ids):
+            return None
+
+        return PsychologistMongoMapper.to_domain(
+            doc, availabilities, city=city, specialties=specialties, approaches=approaches
+        )
+
+    @staticmethod
+    def _availabilities_since(session: AsyncClientSession | None) -> datetime | None:
+        """
+        Leituras fora de transação só exibem o perfil: bastam os horários a partir do atual. Os casos de uso
+        de escrita rodam em transação e recebem a agenda inteira.
+        """
+        if session is not None and session.in_transaction:
+            return None
+
+        return Availability.current_slot_start()
+
+    async def _get_availabilities(
+        self,
+        psychologist_ids: list[UUID],
+        collection: AsyncCollection[Any],
+        session: AsyncClientSession | None,
+        since: datetime | None = None,
+    ) -> dict[UUID, list[AvailabilityDocument]]:
+        """
+        Carrega as disponibilidades de vários psicólogos em uma única consulta, agrupadas por psicólogo.
+
+        Com `since`, lê só a faixa a partir dessa data do índice (psychologist_id, date), como `get_between`.
+        """
+        query: dict[str, Any] = {"psychologist_id": {"$in": psychologist_ids}}
+        if since is not None:
+            query["date"] = {"$gte": since}
+
+        raw_docs = collection.find(query, session=session).sort("date", 1)
+
+        grouped: dict[UUID, list[AvailabilityDocument]] = defaultdict(list)
+        async for raw in raw_docs:
+            doc = AvailabilityDocument.model_validate(raw)
+            grouped[doc.psychologist_id].append(doc)
+
+        return grouped
+
+    async def _save_search_projection(self, entity: Psychologist) -> None:
+        search_doc = PsychologistSearchMongoMapper.to_model(entity)
+        await search_doc.save(session=self._session)
+
+    async def _search_available(
+        self, filters: PsychologistFilters, score_stage: dict[str, Any], pageable: Pageable
+    ) -> tuple[list[dict[str, Any]], int | None, bool]:
+        """
+        Psicólogos com horário livre na janela, do maior score para o menor e, no empate, do horário mais próximo.
+
+        Parte dos horários livres da janela (índice `available, date, psychologist_id`), agrupa o primeiro horário
+        de cada psicólogo e só então junta a projeção de busca: os critérios ponderados viram apenas o score.
+        """
+        date_range: dict[str, datetime] = {}
+        if filters.available_from is not None:
+            date_range["$gte"] = filters.available_from
+        if filters.available_to is not None:
+            date_range["$lte"] = filters.available_to
+
+        pipeline: list[dict[str, Any]] = [
+            {"$match": {"available": True, "date": date_range}},
+            {"$group": {"_id": "$psychologist_id", "next_slot": {"$min": "$date"}}},
             {
                 "$lookup": {
-                    "from": "states",
-                    "localField": "city.state.$id",
+                    "from": PsychologistSearchDocument.get_collection_name(),
+                    "localField": "_id",
                     "foreignField": "_id",
-                    "as": "city.state",
+                    "as": "search",
                 }
             },
-            {"$unwind": {"path": "$city.state", "preserveNullAndEmptyArrays": True}},
-            {"$skip": pageable.offset()},
-            {"$limit": pageable.limit()},
+            # Descarta horários órfãos (psicólogo removido)
+            {"$unwind": "$search"},
+            {"$replaceRoot": {"newRoot": {"$mergeObjects": ["$search", {"next_slot": "$next_slot"}]}}},
+            score_stage,
         ]
+        sort_stage = {"$sort": {"score": -1, "next_slot": 1, "_id": 1}}
+        project_stage = {"$project": {"_id": 1, "score": 1, "next_slot": 1}}
+        limit = pageable.limit()
+        slots = self._listing_reads.collection(AvailabilityDocument)
+
+        if pageable.cursor is None:
+            offset = pageable.offset()
+            pipeline.append(
+                {
+                    "$facet": {
+                        "items": [sort_stage, {"$skip": offset}, {"$limit": limit}, project_stage],
+                        "matched": [{"$count": "count"}],
+                    }
+                }
+            )
+            result = await (await slots.aggregate(pipeline, session=self._session)).to_list()
+            ranked: list[dict[str, Any]] = result[0]["items"]
+            total = result[0]["matched"][0]["count"] if result[0]["matched"] else 0
 
-        docs = await PsychologistDocument.aggregate(pipeline, PsychologistDocument, self._session).to_list()
+            return ranked, total, offset + len(ranked) < total
 
-        entities = await asyncio.gather(*(PsychologistMongoMapper.to_domain(doc) for doc in docs))
+        last_score, last_id, last_slot = _decode_cursor(pageable.cursor)
+        if last_score is not None:
+            if last_slot is None:
+                raise ApplicationException("Cursor de paginação inválido.")
 
-        return Page(
-            items=entities,
-            total=len(docs),
-            pageable=pageable,
+            pipeline.append(
+                {
+                    "$match": {
+                        "$or": [
+                            {"score": {"$lt": last_score}},
+                            {"score": last_score, "next_slot": {"$gt": last_slot}},
+                            {"score": last_score, "next_slot": last_slot, "_id": {"$gt": last_id}},
+                        ]
+                    }
+                }
+            )
+        pipeline += [sort_stage, {"$limit": limit}, project_stage]
+
+        ranked = await (await slots.aggregate(pipeline, session=self._session)).to_list()
+
+        return ranked, None, len(ranked) == limit
+
+    async def _search_unmatched(
+        self,
+        conditions: list[dict[str, Any]],
+        skip: int,
+        limit: int,
+        after_id: UUID | None = None,
+    ) -> list[dict[str, Any]]:
+        """Psicólogos que não atendem a nenhum critério (score 0), em ordem de id."""
+        match: dict[str, Any] = {"$nor": conditions}
+        if after_id is not None:
+            match["_id"] = {"$gt": after_id}
+
+        cursor = await self._listing_reads.collection(PsychologistSearchDocument).aggregate(
+            [
+                {"$match": match},
+                {"$sort": {"_id": 1}},
+                {"$skip": skip},
+                {"$limit": limit},
+                {"$project": {"_id": 1, "score": {"$literal": 0}}},
+            ],
+            session=self._session,
         )
+        return await cursor.to_list()
+
+    @staticmethod
+    def _build_search_criteria(
+        filters: PsychologistFilters | None,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Retorna as expressões de score e as condições de match equivalentes para cada filtro."""
+        scores: list[dict[str, Any]] = []
+        conditions: list[dict[str, Any]] = []
+
+        if not filters:
+            return scores, conditions
+
+        if filters.gender:
+            scores.append(
+                {
+                    "$cond": {
+                        "if": {"$eq": ["$gender", filters.gender]},
+                        "then": SEARCH_WEIGHTS["gender"],
+                        "else": 0,
+                    }
+                }
+            )
+            conditions.append({"gender": filters.gender})
+
+        if filters.max_price:
+            scores.append(
+                {
+                    "$cond": {
+                        "if": {"$lte": ["$price", filters.max_price]},
+                        "then": SEARCH_WEIGHTS["max_price"],
+                        "else": 0,
+                    }
+                }
+            )
+            conditions.append({"price": {"$lte": filters.max_price}})
+
+        set_filters: list[tuple[str, list[Any]]] = [
+            ("approach_ids", [*(filters.approach_ids or [])]),
+            ("specialty_ids", [*(filters.specialty_ids or [])]),
+            ("audiences", [audience.value for audience in filters.audiences or []]),
+        ]
+
+        for field, values in set_filters:
+            if not values:
+                continue
+
+            scores.append(
+                {
+                    "$multiply": [
+                        {"$divide": [{"$size": {"$setIntersection": [f"${field}", values]}}, len(values)]},
+                        SEARCH_WEIGHTS[field],
+                    ]
+                }
+            )
+            conditions.append({field: {"$in": values}})
+
+        return scores, conditions
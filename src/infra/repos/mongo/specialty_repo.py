@@ -1,7 +1,4 @@
-import asyncio
-
 from beanie import WriteRules
-from beanie.operators import In
 from pymongo import ASCENDING, DESCENDING
 from pymongo.asynchronous.client_session import AsyncClientSession
 
@@ -11,36 +8,41 @@ from application.filters.specialty_filters import SpecialtyFilters
 from application.repos.ispecialty_repo import ISpecialtyRepo
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.specialty import Specialty
+from infra.cache.reference_cache import PendingReferenceInvalidations, ReferenceCache
 from infra.mappers.mongo.specialty_mapper import SpecialtyMongoMapper
 from infra.models.mongo.specialty_document import SpecialtyDocument
 
 
 class MongoSpecialtyRepo(ISpecialtyRepo):
     _session: AsyncClientSession
-
-    def __init__(self, session: AsyncClientSession) -> None:
+    _reference_cache: ReferenceCache
+    _reference_invalidations: PendingReferenceInvalidations
+
+    def __init__(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> None:
         self._session = session
+        self._reference_cache = reference_cache
+        self._reference_invalidations = reference_invalidations
 
     async def create(self, entity: Specialty) -> Specialty:
-        doc = await SpecialtyMongoMapper.to_model(entity)
+        doc = SpecialtyMongoMapper.to_model(entity)
         await doc.save(link_rule=WriteRules.WRITE, session=self._session)
+        self._reference_invalidations.invalidate(self._reference_cache.specialties)
 
-        return await SpecialtyMongoMapper.to_domain(doc)
+        return SpecialtyMongoMapper.to_domain(doc)
 
     async def get_by_id(self, id: UniqueEntityId) -> Specialty | None:
-        doc = await SpecialtyDocument.find_one(SpecialtyDocument.id == id.value, session=self._session)
-
-        return await SpecialtyMongoMapper.to_domain(doc) if doc else None
+        return await self._reference_cache.specialties.get_by_id(id, self._session)
 
     async def get_by_ids(self, ids: list[UniqueEntityId]) -> list[Specialty]:
-        docs = await SpecialtyDocument.find(
-            In(SpecialtyDocument.id, [id.value for id in ids]), session=self._session
-        ).to_list()
-        return await asyncio.gather(*(SpecialtyMongoMapper.to_domain(doc) for doc in docs))
+        return await self._reference_cache.specialties.get_by_ids(ids, self._session)
 
     async def get_all(self) -> list[Specialty]:
-        docs = await SpecialtyDocument.find_all(session=self._session).to_list()
-        return await asyncio.gather(*(SpecialtyMongoMapper.to_domain(doc) for doc in docs))
+        return await self._reference_cache.specialties.get_all()
 
     async def get(self, pageable: Pageable, filters: SpecialtyFilters) -> Page[Specialty]:
         query_conditions = {}
@@ -64,7 +66,7 @@ class MongoSpecialtyRepo(ISpecialtyRepo):
         find_query = find_query.skip(pageable.offset()).limit(pageable.limit())
         docs = await find_query.to_list()
 
-        entities = await asyncio.gather(*(SpecialtyMongoMapper.to_domain(doc) for doc in docs))
+        entities = [SpecialtyMongoMapper.to_domain(doc) for doc in docs]
 
         return Page(
             items=entities,
@@ -1,5 +1,3 @@
-import asyncio
-
 from beanie import WriteRules
 from pymongo.asynchronous.client_session import AsyncClientSession
 
@@ -9,25 +7,35 @@ from application.filters.state_filters import StateFilters
 from application.repos.istate_repo import IStateRepo
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.state import State
+from infra.cache.reference_cache import PendingReferenceInvalidations, ReferenceCache
 from infra.mappers.mongo.state_mapper import StateMongoMapper
 from infra.models.mongo.state_document import StateDocument
 
 
 class MongoStateRepo(IStateRepo):
     _session: AsyncClientSession
+    _reference_cache: ReferenceCache
+    _reference_invalidations: PendingReferenceInvalidations
 
-    def __init__(self, session: AsyncClientSession) -> None:
+    def __init__(
+        self,
+        session: AsyncClientSession,
+        reference_cache: ReferenceCache,
+        reference_invalidations: PendingReferenceInvalidations,
+    ) -> None:
         self._session = session
+        self._reference_cache = reference_cache
+        self._reference_invalidations = reference_invalidations
 
     async def create(self, entity: State) -> State:
-        doc = await StateMongoMapper.to_model(entity)
+        doc = StateMongoMapper.to_model(entity)
         await doc.insert(link_rule=WriteRules.WRITE, session=self._session)
+        self._reference_invalidations.invalidate(self._reference_cache.states, self._reference_cache.cities)
 
-        return await StateMongoMapper.to_domain(doc)
+        return StateMongoMapper.to_domain(doc)
 
     async def get_by_id(self, id: UniqueEntityId) -> State | None:
-        doc = await StateDocument.find_one(StateDocument.id == id.value, session=self._session)
-        return await StateMongoMapper.to_domain(doc) if doc else None
+        return await self._reference_cache.states.get_by_id(id, self._session)
 
     async def get(
         self,
@@ -57,7 +65,7 @@ class MongoStateRepo(IStateRepo):
         find_query = find_query.skip(pageable.offset()).limit(pageable.limit())
 
         docs = await find_query.to_list()
-        entities = await asyncio.gather(*(StateMongoMapper.to_domain(doc) for doc in docs))
+        entities = [StateMongoMapper.to_domain(doc) for doc in docs]
 
         return Page(
             items=entities,
@@ -66,5 +74,4 @@ class MongoStateRepo(IStateRepo):
         )
 
     async def get_all(self) -> list[State]:
-        docs = await StateDocument.find_all(fetch_links=True, session=self._session).to_list()
-        return await asyncio.gather(*(StateMongoMapper.to_domain(doc) for doc in docs))
+        return await self._reference_cache.states.get_all()
@@ -4,6 +4,8 @@ from application.repos.iuser_repo import IUserRepo
 from domain.common.unique_entity_id import UniqueEntityId
 from domain.user import User
 from infra.mappers.mongo.user_mapper import UserMongoMapper
+from infra.models.mongo.availability_document import AvailabilityDocument
+from infra.models.mongo.psychologist_search_document import PsychologistSearchDocument
 from infra.models.mongo.user_document import UserDocument
 
 
@@ -29,7 +31,7 @@ class MongoUserRepo(IUserRepo):
             return None
 
         await found_doc.fetch_all_links()
-        return await UserMongoMapper.to_domain(found_doc)
+        return UserMongoMapper.to_domain(found_doc)
 
     async def get_by_email(self, email: str) -> User | None:
         found_doc = await UserDocument.find_one(
@@ -42,7 +44,7 @@ class MongoUserRepo(IUserRepo):
             return None
 
         await found_doc.fetch_all_links()
-        return await UserMongoMapper.to_domain(found_doc)
+        return UserMongoMapper.to_domain(found_doc)
 
     async def delete(self, id: UniqueEntityId) -> bool:
         doc = await UserDocument.get(
@@ -52,5 +54,11 @@ class MongoUserRepo(IUserRepo):
         )
         if doc:
             await doc.delete(session=self._session)
+            await PsychologistSearchDocument.find(
+                PsychologistSearchDocument.id == id.value, session=self._session
+            ).delete(session=self._session)
+            await AvailabilityDocument.find(
+                AvailabilityDocument.psychologist_id == id.value, session=self._session
+            ).delete(session=self._session)
             return True
         return False
@@ -36,6 +36,7 @@ from application.use_cases.psychologist.confirm_payment import (
     ConfirmPaymentDTO,
     ConfirmPaymentUseCase,
 )
+from infra.routers.utils import ReadOnly
 
 router = APIRouter(route_class=DishkaRoute)
 route = "/appointments"
@@ -81,6 +82,7 @@ async def reschedule_appointment(
     status_code=status.HTTP_200_OK,
     response_model=AppointmentDTO,
     tags=["appointments"],
+    dependencies=[ReadOnly],
 )
 async def get_appointment_by_id(
     appointment_id: Annotated[UUID, Path()],
@@ -95,6 +97,7 @@ async def get_appointment_by_id(
     status_code=status.HTTP_200_OK,
     response_model=Page[AppointmentDTO],
     tags=["appointments"],
+    dependencies=[ReadOnly],
 )
 async def get_appointments(
     dto: Annotated[GetAppointmentsDTO, Query()],
@@ -19,6 +19,7 @@ from application.use_cases.approach.get_approaches import (
     GetApproachesDTO,
     GetApproachesUseCase,
 )
+from infra.routers.utils import ReadOnly
 
 router = APIRouter(route_class=DishkaRoute)
 
@@ -41,6 +42,7 @@ async def create_approach(
     status_code=status.HTTP_200_OK,
     response_model=ApproachDTO,
     tags=["approaches"],
+    dependencies=[ReadOnly],
 )
 async def get_approach_by_id(
     approach_id: Annotated[UUID, Path()],
@@ -55,6 +57,7 @@ async def get_approach_by_id(
     status_code=status.HTTP_200_OK,
     response_model=Page[ApproachDTO],
     tags=["approaches"],
+    dependencies=[ReadOnly],
 )
 async def get_approaches(
     dto: Annotated[GetApproachesDTO, Query()],
@@ -28,6 +28,7 @@ from application.use_cases.content.update_content import (
     UpdateContentDTO,
     UpdateContentUseCase,
 )
+from infra.routers.utils import ReadOnly
 
 router = APIRouter(route_class=DishkaRoute)
 
@@ -57,6 +58,7 @@ async def create_content(
     status_code=status.HTTP_200_OK,
     response_model=ContentDTO,
     tags=["contents"],
+    dependencies=[ReadOnly],
 )
 async def get_content_by_id(
     content_id: Annotated[UUID, Path()],
@@ -71,6 +73,7 @@ async def get_content_by_id(
     status_code=status.HTTP_200_OK,
     response_model=Page[ContentDTO],
     tags=["contents"],
+    dependencies=[ReadOnly],
 )
 async def get_contents(
     dto: Annotated[GetContentsDTO, Query()],
@@ -3,18 +3,37 @@ from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Path, Query, status
+from fastapi import APIRouter, Path, Query, Request, Response, status
 
 from application.common.page import Page
+from application.common.pageable import Pageable
 from application.dtos.city_dto import CityDTO
 from application.dtos.state_dto import StateDTO
-from application.use_cases.geography.get_cities_by_state_id import (
-    GetCitiesByStateIdUseCase,
-)
-from application.use_cases.geography.get_states import GetStatesDTO, GetStatesUseCase
+from application.filters.state_filters import StateFilters
+from infra.cache.geography_snapshot import GeographySnapshot, GeographySnapshotStore, JsonResource
 
 router = APIRouter(route_class=DishkaRoute)
 
+# Dados de referência: o cliente pode reutilizar a resposta e revalidar com If-None-Match
+GEOGRAPHY_CACHE_CONTROL = "public, max-age=3600, must-revalidate"
+
+
+class GetStatesQuery(Pageable, StateFilters): ...
+
+
+def _snapshot_response(request: Request, snapshot: GeographySnapshot, resource: JsonResource) -> Response:
+    # Sem estados carregados (API iniciada antes do seed), o cliente não deve guardar a resposta vazia
+    cache_control = GEOGRAPHY_CACHE_CONTROL if snapshot.states else "no-cache"
+    headers = {"ETag": resource.etag, "Cache-Control": cache_control}
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+        if "*" in etags or resource.etag in etags:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(content=resource.body, media_type="application/json", headers=headers)
+
 
 @router.get(
     "/states",
@@ -23,10 +42,12 @@ router = APIRouter(route_class=DishkaRoute)
     tags=["geography"],
 )
 async def get_states(
-    dto: Annotated[GetStatesDTO, Query()],
-    use_case: FromDishka[GetStatesUseCase],
-) -> Page[StateDTO]:
-    return await use_case.execute(dto)
+    request: Request,
+    dto: Annotated[GetStatesQuery, Query()],
+    snapshot_store: FromDishka[GeographySnapshotStore],
+) -> Response:
+    snapshot = await snapshot_store.get()
+    return _snapshot_response(request, snapshot, snapshot.states_page(dto.page, dto.size, dto.name))
 
 
 @router.get(
@@ -36,7 +57,9 @@ async def get_states(
     tags=["geography"],
 )
 async def get_cities_by_state_id(
+    request: Request,
     state_id: Annotated[UUID, Path()],
-    use_case: FromDishka[GetCitiesByStateIdUseCase],
-) -> list[CityDTO]:
-    return await use_case.execute(state_id)
+    snapshot_store: FromDishka[GeographySnapshotStore],
+) -> Response:
+    snapshot = await snapshot_store.get()
+    return _snapshot_response(request, snapshot, snapshot.cities(state_id))
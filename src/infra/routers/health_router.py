@@ -0,0 +1,64 @@
+from typing import Any
+
+import redis.asyncio as redis
+from dishka import FromDishka
+from dishka.integrations.fastapi import DishkaRoute
+from fastapi import APIRouter, status
+
+from infra.cache.read_coalescing import ReadCoalescer
+from infra.cache.reference_cache import ReferenceCache
+from infra.cache.response_cache import ResponseCache
+from infra.cache.session_epochs import SessionEpochCache
+from infra.config.mongo_db_manager import MongoManager
+from infra.config.pool_monitoring import MonitoredConnectionPool
+from infra.services.appointment_expiry_sweeper import AppointmentExpirySweeper
+from infra.services.bcrypt_pool import BcryptPool
+
+router = APIRouter(route_class=DishkaRoute)
+
+
+@router.get(
+    "/health/cache",
+    status_code=status.HTTP_200_OK,
+    tags=["health"],
+)
+async def get_cache_stats(
+    reference_cache: FromDishka[ReferenceCache],
+    session_epochs: FromDishka[SessionEpochCache],
+    response_cache: FromDishka[ResponseCache],
+    read_coalescer: FromDishka[ReadCoalescer],
+) -> dict[str, Any]:
+    return {
+        "reference": reference_cache.stats(),
+        "session_epochs": session_epochs.stats(),
+        "responses": response_cache.stats(),
+        "read_coalescing": read_coalescer.stats(),
+    }
+
+
+@router.get(
+    "/health/jobs",
+    status_code=status.HTTP_200_OK,
+    tags=["health"],
+)
+async def get_job_stats(sweeper: FromDishka[AppointmentExpirySweeper]) -> dict[str, Any]:
+    return {"appointment_expiry": sweeper.stats()}
+
+
+@router.get(
+    "/health/pools",
+    status_code=status.HTTP_200_OK,
+    tags=["health"],
+)
+async def get_pool_stats(
+    bcrypt_pool: FromDishka[BcryptPool],
+    db_manager: FromDishka[MongoManager],
+    redis_client: FromDishka[redis.Redis],
+) -> dict[str, Any]:
+    redis_pool = redis_client.connection_pool
+
+    return {
+        "bcrypt": bcrypt_pool.stats(),
+        "mongo": db_manager.pool_monitor.stats(),
+        "redis": redis_pool.stats() if isinstance(redis_pool, MonitoredConnectionPool) else None,
+    }
@@ -33,7 +33,7 @@ from application.use_cases.patient.update_patient import (
     UpdatePatientDTO,
     UpdatePatientUseCase,
 )
-from infra.routers.utils import ConvertEmptyStrToNoneBeforeValidator
+from infra.routers.utils import ConvertEmptyStrToNoneBeforeValidator, ReadOnly
 
 router = APIRouter(route_class=DishkaRoute)
 route = "/patients"
@@ -80,6 +80,7 @@ async def create_patient(
     status_code=status.HTTP_200_OK,
     response_model=PatientDTO,
     tags=["patients"],
+    dependencies=[ReadOnly],
 )
 async def get_patient_by_id(
     patient_id: Annotated[UUID, Path()],
@@ -94,6 +95,7 @@ async def get_patient_by_id(
     status_code=status.HTTP_200_OK,
     response_model=Page[PatientDTO],
     tags=["patients"],
+    dependencies=[ReadOnly],
 )
 async def get_patients(
     dto: Annotated[GetPatientsDTO, Query()],
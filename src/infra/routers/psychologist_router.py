@@ -8,6 +8,8 @@ from fastapi import APIRouter, Body, File, Form, Path, Query, UploadFile, status
 from fastapi.responses import JSONResponse
 
 from application.common.page import Page
+from application.dtos.availability_dto import AvailabilityDTO
+from application.dtos.availability_recurrence_dto import AvailabilityRecurrenceDTO
 from application.dtos.psychologist_dto import PsychologistDTO
 from application.services.iauth_service import JWTData
 from application.use_cases.psychologist.add_availabilities import (
@@ -18,6 +20,10 @@ from application.use_cases.psychologist.create_psychologist import (
     CreatePsychologistDTO,
     CreatePsychologistUseCase,
 )
+from application.use_cases.psychologist.get_psychologist_availabilities import (
+    GetPsychologistAvailabilitiesDTO,
+    GetPsychologistAvailabilitiesUseCase,
+)
 from application.use_cases.psychologist.get_psychologist_by_id import (
     GetPsychologistByIdDTO,
     GetPsychologistByIdUseCase,
@@ -34,7 +40,7 @@ from application.use_cases.psychologist.update_psychologist import (
     UpdatePsychologistDTO,
     UpdatePsychologistUseCase,
 )
-from infra.routers.utils import ConvertEmptyStrToNoneBeforeValidator
+from infra.routers.utils import ConvertEmptyStrToNoneBeforeValidator, ReadOnly
 
 router = APIRouter(route_class=DishkaRoute)
 route = "/psychologists"
@@ -101,6 +107,7 @@ async def create_psychologist(
     status_code=status.HTTP_200_OK,
     response_model=PsychologistDTO,
     tags=["psychologists"],
+    dependencies=[ReadOnly],
 )
 async def get_psychologist_by_id(
     psychologist_id: Annotated[UUID, Path()],
@@ -110,11 +117,35 @@ async def get_psychologist_by_id(
     return await use_case.execute(dto)
 
 
+@router.get(
+    f"{route}/{{psychologist_id}}/availabilities",
+    status_code=status.HTTP_200_OK,
+    response_model=list[AvailabilityDTO],
+    tags=["psychologists"],
+    dependencies=[ReadOnly],
+)
+async def get_psychologist_availabilities(
+    psychologist_id: Annotated[UUID, Path()],
+    use_case: FromDishka[GetPsychologistAvailabilitiesUseCase],
+    from_date: Annotated[datetime | None, Query(alias="from", examples=["2025-11-03T00:00:00Z"])] = None,
+    to_date: Annotated[datetime | None, Query(alias="to", examples=["2025-11-10T00:00:00Z"])] = None,
+    only_free: Annotated[bool, Query()] = True,
+) -> list[AvailabilityDTO]:
+    dto = GetPsychologistAvailabilitiesDTO(
+        psychologist_id=psychologist_id,
+        from_date=from_date,
+        to_date=to_date,
+        only_free=only_free,
+    )
+    return await use_case.execute(dto)
+
+
 @router.get(
     route,
     status_code=status.HTTP_200_OK,
     response_model=Page[PsychologistDTO],
     tags=["psychologists"],
+    dependencies=[ReadOnly],
 )
 async def get_psychologists(
     dto: Annotated[GetPsychologistsDTO, Query()],
@@ -183,6 +214,70 @@ async def remove_availabilities(
     return await use_case.execute(dto)
 
 
+@router.post(
+    f"{route}/availabilities/recurrence",
+    status_code=status.HTTP_200_OK,
+    response_model=PsychologistDTO,
+    tags=["psychologists"],
+)
+async def add_recurring_availabilities(
+    jwt_data: FromDishka[JWTData],
+    request_dto: Annotated[
+        AvailabilityRecurrenceDTO,
+        Body(
+            examples=[
+                {
+                    "weekdays": [0, 2, 4],
+                    "hours": [9, 10, 14, 15],
+                    "start_date": "2025-11-03",
+                    "end_date": "2026-01-30",
+                    "timezone": "America/Sao_Paulo",
+                }
+            ]
+        ),
+    ],
+    use_case: FromDishka[AddAvailabilitiesUseCase],
+) -> PsychologistDTO | JSONResponse:
+    dto = AddAvailabilitiesDTO(
+        recurrence=request_dto,
+        psychologist_id=jwt_data.id,
+    )
+
+    return await use_case.execute(dto)
+
+
+@router.delete(
+    f"{route}/availabilities/recurrence",
+    status_code=status.HTTP_200_OK,
+    response_model=PsychologistDTO,
+    tags=["psychologists"],
+)
+async def remove_recurring_availabilities(
+    jwt_data: FromDishka[JWTData],
+    request_dto: Annotated[
+        AvailabilityRecurrenceDTO,
+        Body(
+            examples=[
+                {
+                    "weekdays": [4],
+                    "hours": [14, 15],
+                    "start_date": "2025-12-01",
+                    "end_date": "2025-12-31",
+                    "timezone": "America/Sao_Paulo",
+                }
+            ]
+        ),
+    ],
+    use_case: FromDishka[RemoveAvailabilitiesUseCase],
+) -> PsychologistDTO | JSONResponse:
+    dto = RemoveAvailabilitiesDTO(
+        recurrence=request_dto,
+        psychologist_id=jwt_data.id,
+    )
+
+    return await use_case.execute(dto)
+
+
 @router.put(
     f"{route}",
     status_code=status.HTTP_200_OK,
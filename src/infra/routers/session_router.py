@@ -16,6 +16,7 @@ from application.use_cases.session.login import (
 )
 from application.use_cases.session.logout import LogoutUseCase, UserNotFoundException
 from application.use_cases.session.me import MeUseCase
+from infra.routers.utils import ReadOnly
 
 router = APIRouter(route_class=DishkaRoute)
 route = "/sessions"
@@ -26,6 +27,7 @@ route = "/sessions"
     status_code=status.HTTP_200_OK,
     response_model=LoginDTOResponse,
     tags=["sessions"],
+    dependencies=[ReadOnly],
 )
 async def login(
     use_case: FromDishka[LoginUseCase],
@@ -55,6 +57,7 @@ async def login(
     f"{route}/logout",
     status_code=status.HTTP_200_OK,
     tags=["sessions"],
+    dependencies=[ReadOnly],
 )
 async def logout(
     use_case: FromDishka[LogoutUseCase],
@@ -71,6 +74,7 @@ async def logout(
     f"{route}/me",
     status_code=status.HTTP_200_OK,
     tags=["sessions"],
+    dependencies=[ReadOnly],
 )
 async def me(
     use_case: FromDishka[MeUseCase],
@@ -19,6 +19,7 @@ from application.use_cases.specialty.get_specialty_by_id import (
     GetSpecialtyByIdDTO,
     GetSpecialtyByIdUseCase,
 )
+from infra.routers.utils import ReadOnly
 
 router = APIRouter(route_class=DishkaRoute)
 
@@ -41,6 +42,7 @@ async def create_specialty(
     status_code=status.HTTP_200_OK,
     response_model=SpecialtyDTO,
     tags=["specialties"],
+    dependencies=[ReadOnly],
 )
 async def get_specialty_by_id(
     specialty_id: Annotated[UUID, Path()],
@@ -55,6 +57,7 @@ async def get_specialty_by_id(
     status_code=status.HTTP_200_OK,
     response_model=Page[SpecialtyDTO],
     tags=["specialties"],
+    dependencies=[ReadOnly],
 )
 async def get_specialties(
     dto: Annotated[GetSpecialtiesDTO, Query()],
@@ -1,5 +1,6 @@
 from typing import Any, Iterable
 
+from fastapi import Depends, Request
 from pydantic import BeforeValidator
 
 
@@ -11,3 +12,12 @@ def convert_empty_str_to_none(value: Any) -> Any:
 
 
 ConvertEmptyStrToNoneBeforeValidator = BeforeValidator(convert_empty_str_to_none)
+
+
+def mark_read_only(request: Request) -> None:
+    # Lido pelo MongoDBProvider: a requisição recebe uma sessão sem transação
+    request.state.read_only = True
+
+
+# Rotas que não escrevem no MongoDB: `dependencies=[ReadOnly]`
+ReadOnly = Depends(mark_read_only)
@@ -0,0 +1,130 @@
+import asyncio
+import contextlib
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from application.services.iresponse_cache import CacheTags
+from infra.cache.response_cache import ResponseCache
+from infra.config.logger import logger
+from infra.config.mongo_db_manager import MongoManager
+from infra.config.redis_lease import RedisLease
+from infra.repos.mongo.appointment_repo import ExpiredPaymentsBatch, MongoAppointmentRepo
+
+
+class AppointmentExpirySweeper:
+    """
+    Tarefa de fundo que cancela os agendamentos cujo pagamento PIX expirou sem ser pago e libera seus horários.
+
+    A cada `interval_seconds` a réplica dona do lease no Redis varre os pagamentos expirados em lotes de
+    `batch_size`, cada lote em uma transação. As demais réplicas só tentam adquirir o lease; se a dona parar
+    de renová-lo, outra assume a varredura quando ele expirar.
+    """
+
+    LEASE_NAME = "appointmentExpirySweeper"
+
+    _db_manager: MongoManager
+    _response_cache: ResponseCache
+    _lease: RedisLease
+    _interval_seconds: float
+    _batch_size: int
+    _task: asyncio.Task[None] | None
+
+    def __init__(
+        self,
+        db_manager: MongoManager,
+        response_cache: ResponseCache,
+        lease: RedisLease,
+        interval_seconds: float,
+        batch_size: int,
+    ) -> None:
+        self._db_manager = db_manager
+        self._response_cache = response_cache
+        self._lease = lease
+        self._interval_seconds = interval_seconds
+        self._batch_size = batch_size
+        self._task = None
+        self.sweeps = 0
+        self.batches = 0
+        self.scanned_payments = 0
+        self.canceled_appointments = 0
+        self.set_aside_payments = 0
+        self.released_psychologists = 0
+        self.errors = 0
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+
+        with contextlib.suppress(RedisError):
+            await self._lease.release()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                if await self._lease.acquire():
+                    await self.sweep()
+            except Exception as e:  # noqa: BLE001
+                # Qualquer falha (lote abortado por conflito, Redis indisponível, documento inválido) fica só
+                # neste ciclo: a tarefa segue viva e tenta de novo no próximo. CancelledError não é capturado
+                self.errors += 1
+                logger.exception(f"❌ Appointment expiry sweep failed: {e}")
+
+            await asyncio.sleep(self._interval_seconds)
+
+    async def sweep(self) -> int:
+        """Processa lotes até varrer todos os pagamentos expirados ou perder o lease. Retorna os lotes rodados."""
+        self.sweeps += 1
+        now = datetime.now(timezone.utc)
+        after: tuple[datetime, UUID] | None = None
+        batches = 0
+
+        while True:
+            batch = await self._sweep_batch(now, after)
+            if batch.scanned == 0:
+                break
+
+            batches += 1
+            after = batch.resume_after
+            self.scanned_payments += batch.scanned
+            self.canceled_appointments += batch.canceled
+            self.set_aside_payments += batch.set_aside
+            self.released_psychologists += len(batch.psychologist_ids)
+
+            if batch.psychologist_ids:
+                # Depois do commit, como nas requisições: perfis e buscas por horário livre mudaram
+                await self._response_cache.invalidate(
+                    [*(CacheTags.psychologist(id) for id in batch.psychologist_ids), CacheTags.AVAILABILITY_SEARCH]
+                )
+
+            # Lote incompleto: não há mais o que varrer. Sem o lease, outra réplica assume no próximo ciclo
+            if batch.scanned < self._batch_size or not await self._lease.renew():
+                break
+
+        self.batches += batches
+        if batches:
+            logger.info(f"⏰ Appointment expiry sweep: {batches} batches")
+
+        return batches
+
+    async def _sweep_batch(self, now: datetime, after: tuple[datetime, UUID] | None) -> ExpiredPaymentsBatch:
+        async with self._db_manager.get_session() as session:
+            return await MongoAppointmentRepo(session).cancel_expired_unpaid(now, self._batch_size, after)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sweeps": self.sweeps,
+            "batches": self.batches,
+            "scanned_payments": self.scanned_payments,
+            "canceled_appointments": self.canceled_appointments,
+            "set_aside_payments": self.set_aside_payments,
+            "released_psychologists": self.released_psychologists,
+            "errors": self.errors,
+        }
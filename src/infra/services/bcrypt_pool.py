@@ -0,0 +1,83 @@
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import bcrypt
+
+
+class BcryptPool:
+    """
+    Executa o bcrypt em um pool de threads próprio e limitado, fora do event loop.
+
+    O bcrypt libera o GIL durante o cálculo, então threads bastam. As verificações de login passam
+    ainda por um semáforo: numa rajada de logins, elas esperam na fila em vez de ocupar todos os workers,
+    e só a latência do login aumenta.
+    """
+
+    rounds: int
+    _workers: int
+    _executor: ThreadPoolExecutor
+    _verify_slots: asyncio.Semaphore
+    _lock: threading.Lock
+
+    def __init__(self, workers: int, rounds: int, max_concurrent_verifications: int) -> None:
+        self.rounds = rounds
+        self._workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._verify_slots = asyncio.Semaphore(max_concurrent_verifications)
+        self._lock = threading.Lock()
+        self._waiting_for_slot = 0
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._max_queue_depth = 0
+
+    async def hash(self, password: bytes) -> bytes:
+        return await self._run(lambda: bcrypt.hashpw(password, bcrypt.gensalt(rounds=self.rounds)))
+
+    async def verify(self, password: bytes, hashed_password: bytes) -> bool:
+        self._waiting_for_slot += 1
+        try:
+            await self._verify_slots.acquire()
+        finally:
+            self._waiting_for_slot -= 1
+
+        try:
+            return await self._run(lambda: bcrypt.checkpw(password, hashed_password))
+        finally:
+            self._verify_slots.release()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self._workers,
+                "rounds": self.rounds,
+                "waiting_for_login_slot": self._waiting_for_slot,
+                "queued": self._queued,
+                "running": self._running,
+                "completed": self._completed,
+                "max_queue_depth": self._max_queue_depth,
+            }
+
+    async def _run[T](self, fn: Callable[[], T]) -> T:
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        def job() -> T:
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            try:
+                return fn()
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, job)
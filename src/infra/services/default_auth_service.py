@@ -1,24 +1,30 @@
-import asyncio
+import time
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
-import bcrypt
 import jwt
 from redis.asyncio import Redis
 
 from application.services.iauth_service import IAuthService, JWTData
 from domain.user import User
 from domain.value_objects.password import Password
+from infra.cache.session_epochs import SessionEpochCache
 from infra.config.settings import Settings
+from infra.services.bcrypt_pool import BcryptPool
 
 
 class DefaultAuthService(IAuthService):
     redis_client: Redis
+    session_epochs: SessionEpochCache
+    bcrypt_pool: BcryptPool
 
-    def __init__(self, redis_client: Redis) -> None:
+    def __init__(self, redis_client: Redis, session_epochs: SessionEpochCache, bcrypt_pool: BcryptPool) -> None:
         self.redis_client = redis_client
+        self.session_epochs = session_epochs
+        self.bcrypt_pool = bcrypt_pool
         self.jwt_hash_name = "activeJwtClients"
         self.token_expire_time = Settings().REFRESH_TOKEN_EXPIRE_SECONDS
+        self.epoch_validation = Settings().AUTH_EPOCH_VALIDATION
 
     async def decode_access_token(self, token: str) -> JWTData | None:
         try:
@@ -31,8 +37,9 @@ class DefaultAuthService(IAuthService):
         except jwt.InvalidTokenError:
             return None
 
-    def sign_jwt_tokens(self, user: User) -> tuple[str, str]:
-        access_token_data = JWTData(id=user.id.value, user_type=user.get_user_type()).model_dump()
+    async def sign_jwt_tokens(self, user: User) -> tuple[str, str]:
+        epoch = await self.session_epochs.current(str(user.id.value))
+        access_token_data = JWTData(id=user.id.value, user_type=user.get_user_type(), epoch=epoch).model_dump()
         access_token_expire = datetime.now(timezone.utc) + timedelta(minutes=Settings().ACCESS_TOKEN_EXPIRE_MINUTES)
         access_token_data.update({"exp": access_token_expire})
         access_token = jwt.encode(  # type: ignore
@@ -44,27 +51,90 @@ class DefaultAuthService(IAuthService):
         return access_token, refresh_token
 
     async def save_authenticated_user(self, user_id: str, refresh_token: str) -> None:
-        key = self._construct_key(user_id, refresh_token)
-        await self.redis_client.set(key, refresh_token)
-        await self.redis_client.expire(key, self.token_expire_time)
+        # Um sorted set por usuário: membro = refresh token, score = instante em que expira
+        key = self._construct_key(user_id)
+        now = time.time()
+
+        async with self.redis_client.pipeline(transaction=True) as pipe:
+            pipe.zadd(key, {refresh_token: now + self.token_expire_time})
+            pipe.zremrangebyscore(key, "-inf", now)
+            # O set expira junto com o token mais novo
+            pipe.expire(key, self.token_expire_time)
+            await pipe.execute()
 
     async def de_authenticate_user(self, user_id: str) -> None:
-        keys = await self.redis_client.keys(f"*{self.jwt_hash_name}.{user_id}*")  # type: ignore
-        if keys:
-            await self.redis_client.delete(*keys)
+        await self.session_epochs.bump(user_id, delete=(self._construct_key(user_id),))
 
     async def get_tokens(self, user_id: str) -> list[str]:
-        keys: list[str] = await self.redis_client.keys(  # type: ignore
-            f"*{self.jwt_hash_name}.{user_id}*"
+        return await self.redis_client.zrangebyscore(  # type: ignore
+            self._construct_key(user_id), f"({time.time()}", "+inf"
         )
-        return await asyncio.gather(*[self.redis_client.get(key) for key in keys])  # type: ignore
 
-    def _construct_key(self, user_id: str, refresh_token: str) -> str:
-        return f"refresh-{refresh_token}.{self.jwt_hash_name}.{user_id}"
+    async def is_session_active(self, data: JWTData) -> bool:
+        if self.epoch_validation:
+            # Caminho rápido: sem ida ao Redis enquanto a época do usuário estiver na cópia local
+            return data.epoch >= await self.session_epochs.get(str(data.id))
+
+        return len(await self.get_tokens(str(data.id))) > 0
+
+    def _construct_key(self, user_id: str) -> str:
+        return f"{self.jwt_hash_name}:{user_id}"
+
+    async def migrate_legacy_tokens(self) -> int:
+        """
+        Move os tokens do formato antigo (uma chave `refresh-{token}.activeJwtClients.{user_id}` por token)
+        para o sorted set do usuário, mantendo o tempo restante de cada um. Roda uma única vez.
+        """
+        marker = f"{self.jwt_hash_name}:migrated"
+        if await self.redis_client.exists(marker):
+            return 0
+
+        migrated = 0
+        cursor = 0
+        while True:
+            # SCAN percorre o keyspace em lotes sem bloquear o Redis, ao contrário de KEYS
+            cursor, legacy_keys = await self.redis_client.scan(
+                cursor, match=f"refresh-*.{self.jwt_hash_name}.*", count=1000
+            )
+
+            if legacy_keys:
+                # Duas idas e voltas por lote: uma para os TTLs e outra para mover todas as chaves
+                async with self.redis_client.pipeline(transaction=False) as pipe:
+                    for legacy_key in legacy_keys:
+                        pipe.ttl(legacy_key)
+                    ttls = await pipe.execute()
+
+                now = time.time()
+                async with self.redis_client.pipeline(transaction=True) as pipe:
+                    for legacy_key, ttl in zip(legacy_keys, ttls, strict=True):
+                        if ttl == -2:
+                            continue
+
+                        refresh_token, user_id = self._parse_legacy_key(legacy_key)
+                        expires_in = ttl if ttl > 0 else self.token_expire_time
+                        key = self._construct_key(user_id)
+
+                        pipe.zadd(key, {refresh_token: now + expires_in})
+                        pipe.expire(key, expires_in, gt=True)
+                        pipe.expire(key, expires_in, nx=True)
+                        pipe.delete(legacy_key)
+                        migrated += 1
+
+                    await pipe.execute()
+
+            if cursor == 0:
+                break
+
+        await self.redis_client.set(marker, 1)
+        return migrated
+
+    def _parse_legacy_key(self, legacy_key: str) -> tuple[str, str]:
+        prefix, user_id = legacy_key.split(f".{self.jwt_hash_name}.", 1)
+        return prefix.removeprefix("refresh-"), user_id
 
     async def hash_password(self, password: Password) -> Password:
-        hashed = bcrypt.hashpw(password.value.encode("utf-8"), bcrypt.gensalt())
+        hashed = await self.bcrypt_pool.hash(password.value.encode("utf-8"))
         return Password(value=hashed.decode("utf-8"), hashed=True)
 
     async def verify_password(self, password: Password, hashed_password: Password) -> bool:
-        return bcrypt.checkpw(password.value.encode("utf-8"), hashed_password.value.encode("utf-8"))
+        return await self.bcrypt_pool.verify(password.value.encode("utf-8"), hashed_password.value.encode("utf-8"))
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 from application.services.ipix_payment_service import IPixPaymentService
@@ -18,7 +18,8 @@ class PixPaymentService(IPixPaymentService):
         pix_payload = f"00020126580014br.gov.bcb.pix013636{provider_payment_id}5204000053039865802BR5925MINDHUB SERVICOS MEDICOS6009SAO PAULO62070503***6304{self._calculate_crc(provider_payment_id)}"
 
         # Set expiration to 30 minutes from now
-        expires_at = datetime.now() + timedelta(minutes=30)
+        # Em UTC: o MongoDB guarda datas sem fuso e a varredura de expiração compara com o horário UTC
+        expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
 
         return PixPayment(
             amount=amount,